@@ -0,0 +1,160 @@
+/* ============================================================
+   개미로그 · search.js
+   의존: data/index.json(샤드 수/버전), data/search/N.json(검색 샤드), data/months/YYYY-MM.json
+   ※ 토크나이저/샤드 규칙은 generate_blog.py의 search_tokens와 같아야 합니다.
+   ※ index.json만 매번 확인하고, 샤드는 내용 버전(?v=)을 붙여 받으므로 캐시를 그대로 씁니다.
+   ============================================================ */
+(function () {
+  const form = document.getElementById('search-form');
+  if (!form) return;
+
+  const input   = document.getElementById('search-input');
+  const summary = document.getElementById('search-summary');
+  const results = document.getElementById('search-results');
+  const root    = form.dataset.root || '/';
+  const MAX_RESULTS = 20;
+
+  const RUN = /[0-9a-z]+|[\u3131-\u318e\uac00-\ud7a3\u4e00-\u9fff]+/g;
+  const cache = new Map();
+
+  // ── 토큰화: 한글/한자는 2글자씩(1글자면 그대로), 영문/숫자는 단어 단위 ──
+  function tokens(text) {
+    const out = [];
+    const runs = text.normalize('NFKC').toLowerCase().match(RUN) || [];
+    runs.forEach(function (run) {
+      if (run.charCodeAt(0) < 128 || run.length === 1) {
+        out.push(run);
+        return;
+      }
+      for (let i = 0; i < run.length - 1; i++) out.push(run.slice(i, i + 2));
+    });
+    return out;
+  }
+
+  function loadJSON(path) {
+    if (!cache.has(path)) {
+      cache.set(path, fetch(root + 'data/' + path).then(function (res) {
+        if (!res.ok) throw new Error(path + ': ' + res.status);
+        return res.json();
+      }));
+    }
+    return cache.get(path);
+  }
+
+  function loadShard(token, index) {
+    return loadJSON('search/' + (token.codePointAt(0) % index.search_shards) + '.json?v=' + index.search_version);
+  }
+
+  function monthVersion(index, month) {
+    const found = (index.months || []).find(function (m) { return m.month === month; });
+    return found ? found.v : '';
+  }
+
+  /** [id차이, tf, id차이, tf, ...] → Map(id → tf) */
+  function decode(flat, into) {
+    let id = 0;
+    for (let i = 0; i < flat.length; i += 2) {
+      id += flat[i];
+      into.set(id, (into.get(id) || 0) + flat[i + 1]);
+    }
+    return into;
+  }
+
+  function postings(token, shard) {
+    const found = new Map();
+    if (token.length === 1 && token.charCodeAt(0) >= 128) {
+      // 한 글자 검색: 그 글자로 시작하는 모든 2글자 토큰 (같은 샤드에 있음)
+      Object.keys(shard).forEach(function (key) {
+        if (key[0] === token) decode(shard[key], found);
+      });
+      return found;
+    }
+    return shard[token] ? decode(shard[token], found) : found;
+  }
+
+  function idToDate(id) {
+    const s = String(id);
+    return s.slice(0, 4) + '-' + s.slice(4, 6) + '-' + s.slice(6, 8);
+  }
+
+  function href(permalink) {
+    return permalink.startsWith('/') ? root + permalink.replace(/^\//, '') : permalink;
+  }
+
+  function show(text, items) {
+    summary.textContent = text;
+    summary.hidden = false;
+    results.innerHTML = items;
+    results.hidden = !items;
+  }
+
+  let seq = 0;
+  async function search(query) {
+    const mine = ++seq;
+    const toks = Array.from(new Set(tokens(query)));
+    if (!toks.length) {
+      summary.hidden = true;
+      results.hidden = true;
+      results.innerHTML = '';
+      return;
+    }
+
+    const index = await loadJSON('index.json');
+    const shards = await Promise.all(toks.map(function (t) { return loadShard(t, index); }));
+    let scores = null;
+    toks.forEach(function (token, i) {
+      const found = postings(token, shards[i]);
+      if (scores === null) {
+        scores = found;
+        return;
+      }
+      const next = new Map();
+      found.forEach(function (tf, id) {
+        if (scores.has(id)) next.set(id, scores.get(id) + tf);
+      });
+      scores = next;
+    });
+
+    const ranked = Array.from(scores.entries())
+      .sort(function (a, b) { return b[1] - a[1] || b[0] - a[0]; })
+      .slice(0, MAX_RESULTS)
+      .map(function (e) { return idToDate(e[0]); });
+
+    const months = Array.from(new Set(ranked.map(function (d) { return d.slice(0, 7); })));
+    const monthData = await Promise.all(months.map(function (m) {
+      return loadJSON('months/' + m + '.json?v=' + monthVersion(index, m)).catch(function () { return []; });
+    }));
+    if (mine !== seq) return; // 더 최근 입력이 있으면 버림
+
+    const byDate = new Map();
+    monthData.forEach(function (list) {
+      list.forEach(function (d) { byDate.set(d.date, d); });
+    });
+
+    const items = ranked.filter(function (d) { return byDate.has(d); }).map(function (date) {
+      const d = byDate.get(date);
+      const a = document.createElement('a');
+      a.href = href(d.permalink);
+      a.innerHTML = '<span class="date"></span> - ';
+      a.firstChild.textContent = d.date;
+      a.appendChild(document.createTextNode(d.title));
+      return '<li>' + a.outerHTML + '</li>';
+    }).join('');
+
+    show(scores.size ? '검색 결과 ' + scores.size + '개' + (scores.size > MAX_RESULTS ? ' (상위 ' + MAX_RESULTS + '개)' : '')
+                     : '검색 결과가 없습니다.', items);
+  }
+
+  let timer = null;
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(function () {
+      search(input.value).catch(function () { show('검색 데이터를 불러오지 못했습니다.', ''); });
+    }, 150);
+  });
+  form.addEventListener('submit', function (e) {
+    e.preventDefault();
+    clearTimeout(timer);
+    search(input.value).catch(function () { show('검색 데이터를 불러오지 못했습니다.', ''); });
+  });
+})();
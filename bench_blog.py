@@ -0,0 +1,266 @@
+"""Benchmark generate_blog.py on synthetic diary corpora.
+
+    python3 bench_blog.py                          # 100, 1k, 10k entries
+    python3 bench_blog.py --sizes 100,1000,10000,100000
+    python3 bench_blog.py --save-baseline          # record bench_baseline.json
+    python3 bench_blog.py --tolerance 0.3          # fail if anything is >30% worse
+    python3 bench_blog.py --sizes "" --post-kb 256,4096   # only single very large posts
+
+Every size runs in its own subprocess against a temporary site root, so the
+reported peak RSS belongs to that size alone. ``--post-kb`` adds single posts
+of the given sizes to time the per-post analysis and render on their own. Stage times and output
+bytes, and each size's peak RSS, are compared with the stored baseline and the exit code is 1 when
+any of them regressed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BASE_DIR, "bench_baseline.json")
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_POST_KB = [64, 1024]
+# Stages faster than this are too noisy to fail on.
+MIN_REGRESSION_SECONDS = 0.005
+# Likewise for peak RSS (allocator and import noise) and stage output size.
+MIN_REGRESSION_MB = 5.0
+MIN_REGRESSION_BYTES = 1024
+
+SUBJECTS = ["형님", "개미", "오늘 작업", "자동화 스크립트", "블로그 생성기", "배포 파이프라인", "메모 정리", "새 설정"]
+VERBS = ["다시 살펴봤어요", "조심스럽게 고쳤어요", "끝까지 확인했어요", "천천히 정리했어요", "작게 나눠 시도했어요"]
+DETAILS = [
+    "`generate_blog.py`를 실행하니", "**중요한 교정**을 받고 나서", "*작은 실수*가 보였을 때",
+    "로그를 한 줄씩 읽어 보니", "`git push` 결과를 확인하면서", "23:59 무렵에",
+]
+FEELINGS = ["마음이 놓였어요.", "조금 뜨끔했어요.", "배운 점이 많았어요.", "다음엔 더 잘할 수 있을 것 같아요."]
+HEADINGS = ["오늘 정리", "배운 점", "남은 일", "작업 메모"]
+TAGS = ["자동화", "블로그", "배포", "회고", "메모", "설정", "교정", "스크립트"]
+SERIES = ["생성기 개선기", "배포 일지", "개미 수업"]
+# Made-up topic words, a few per diary, so related-post scoring has something to find.
+_SYLLABLES = [chr(0xAC00 + i) for i in range(0, 11172, 29)]
+_topic_rng = random.Random(7)
+TOPIC_WORDS = ["".join(_topic_rng.choice(_SYLLABLES) for _ in range(_topic_rng.randint(2, 3))) for _ in range(2000)]
+
+
+def synth_sentence(rng: random.Random) -> str:
+    return f"{rng.choice(DETAILS)} {rng.choice(SUBJECTS)}을 {rng.choice(VERBS)}. {rng.choice(FEELINGS)}"
+
+
+def synth_diary(rng: random.Random) -> str:
+    lines = []
+    if rng.random() < 0.5:
+        # About half the corpus carries front matter so the tag/series pages have work to do.
+        lines += ["---", f"tags: [{', '.join(rng.sample(TAGS, rng.randint(1, 3)))}]"]
+        if rng.random() < 0.3:
+            lines.append(f"series: {rng.choice(SERIES)}")
+        lines += ["---", ""]
+    lines += [f"# {rng.choice(SUBJECTS)}을 {rng.choice(VERBS)}", ""]
+    topic = rng.sample(TOPIC_WORDS, 3)
+    for _ in range(rng.randint(4, 7)):
+        lines.append(" ".join([synth_sentence(rng) for _ in range(rng.randint(2, 4))] + rng.choices(topic, k=2)))
+        lines.append("")
+        roll = rng.random()
+        if roll < 0.25:
+            lines.append(f"## {rng.choice(HEADINGS)}")
+            lines.append("")
+        elif roll < 0.45:
+            lines.extend(f"- {synth_sentence(rng)}" for _ in range(rng.randint(2, 4)))
+            lines.append("")
+    lines.append("## 오늘의 한 줄")
+    lines.append(synth_sentence(rng))
+    return "\n".join(lines) + "\n"
+
+
+def synth_large_post(kb: int, seed: int = 20260211) -> str:
+    # The quote section sits near the top, so everything after it is one long
+    # run without an h1-h3 heading: the worst case for a tempered section regex.
+    rng = random.Random(seed)
+    lines = [synth_sentence(rng), "", "## 오늘의 한 줄", synth_sentence(rng), ""]
+    size = 0
+    while size < kb * 1024:
+        block = " ".join(synth_sentence(rng) for _ in range(rng.randint(2, 4)))
+        if rng.random() < 0.1:
+            block += "\n\n```\n# 코드 안의 제목은 무시\n```"
+        elif rng.random() < 0.1:
+            block += f"\n\n#### {rng.choice(HEADINGS)}"
+        lines.extend([block, ""])
+        size += len(block.encode("utf-8")) + 2
+    return "\n".join(lines)
+
+
+def write_corpus(diary_dir: str, size: int, seed: int = 20260211):
+    rng = random.Random(seed)
+    os.makedirs(diary_dir, exist_ok=True)
+    start = date(2000, 1, 1)
+    for i in range(size):
+        day = start + timedelta(days=i)
+        with open(os.path.join(diary_dir, f"{day.isoformat()}.md"), "w", encoding="utf-8") as f:
+            f.write(synth_diary(rng))
+
+
+def run_size(size: int, jobs: int) -> dict:
+    sys.path.insert(0, BASE_DIR)
+    import generate_blog as gb
+
+    with tempfile.TemporaryDirectory(prefix="gaemilog-bench-") as root, gb.bind_site(gb.BuildConfig(root=root)):
+        write_corpus(gb.DIARY_DIR, size)
+
+        stages = {}
+        diaries = None
+
+        def stage(name, fn):
+            writer = gb.OutputWriter(jobs=jobs)
+            started_wall = time.perf_counter()
+            started_cpu = time.process_time()
+            result = fn(writer)
+            writer.commit()
+            stages[name] = {
+                "seconds": time.perf_counter() - started_wall,
+                "cpu_seconds": time.process_time() - started_cpu,
+                "bytes": writer.bytes_written,
+                "files": writer.written,
+            }
+            return result
+
+        cache = gb.RenderCache()
+        diaries = stage("get_diary_list", lambda w: gb.get_diary_list(None, jobs, cache))
+        stage("bundle", lambda w: gb.write_bundle(diaries, w))
+        stage("data_shards", lambda w: gb.generate_data_shards(diaries, None, w))
+        stage("search_index", lambda w: gb.generate_search_index(diaries, None, w))
+        related = stage("find_related", lambda w: gb.find_related(diaries))
+        stage("generate_post_pages", lambda w: gb.generate_post_pages(diaries, None, w, related))
+        stage("generate_archive_pages", lambda w: gb.generate_archive_pages(diaries, None, w))
+        stage("generate_listing_pages", lambda w: gb.generate_listing_pages(diaries, None, w))
+        stage("generate_taxonomy_pages", lambda w: gb.generate_taxonomy_pages(diaries, None, w))
+        stage("generate_sitemap", lambda w: gb.generate_sitemap(diaries, None, w))
+        renderer = gb.renderer_name()
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"size": size, "renderer": renderer, "peak_rss_mb": round(peak_kb / 1024, 1), "stages": stages}
+
+
+def run_post(kb: int) -> dict:
+    sys.path.insert(0, BASE_DIR)
+    import generate_blog as gb
+
+    text = synth_large_post(kb)
+    stages = {}
+    for name, fn in (("analyze_post", gb.analyze_post), ("render_entry", gb.render_entry)):
+        started_wall = time.perf_counter()
+        started_cpu = time.process_time()
+        fn(text)
+        stages[name] = {
+            "seconds": time.perf_counter() - started_wall,
+            "cpu_seconds": time.process_time() - started_cpu,
+            "bytes": len(text.encode("utf-8")),
+            "files": 1,
+        }
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"size": f"{kb}KB", "renderer": gb.renderer_name(), "peak_rss_mb": round(peak_kb / 1024, 1), "stages": stages}
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    # One tolerance for stage wall time, stage output bytes and peak RSS.
+    regressions = []
+
+    def check(label, current, before, floor, fmt):
+        if before is not None and current > max(before * (1 + tolerance), before + floor):
+            regressions.append(f"{label}: {fmt(current)} > {fmt(before)} baseline")
+
+    for result in results:
+        base = baseline.get(str(result["size"]))
+        if not base:
+            continue
+        check(f"{result['size']:>7} peak RSS", result["peak_rss_mb"], base.get("peak_rss_mb"),
+              MIN_REGRESSION_MB, lambda mb: f"{mb} MB")
+        for name, current in result["stages"].items():
+            before = base["stages"].get(name)
+            if before is None:
+                continue
+            label = f"{result['size']:>7} {name}"
+            check(label, current["seconds"], before["seconds"], MIN_REGRESSION_SECONDS, lambda s: f"{s:.3f}s")
+            check(label, current["bytes"], before.get("bytes"), MIN_REGRESSION_BYTES, lambda b: f"{b:,} bytes")
+    return regressions
+
+
+def print_table(results: list[dict]):
+    for result in results:
+        label = result["size"] if isinstance(result["size"], str) else f"{result['size']} entries"
+        print(f"\n== {label} ({result['renderer']}, peak RSS {result['peak_rss_mb']} MB)")
+        print(f"  {'stage':<24}{'wall':>10}{'cpu':>10}{'files':>9}{'bytes':>14}")
+        for name, st in result["stages"].items():
+            print(f"  {name:<24}{st['seconds']:>9.3f}s{st['cpu_seconds']:>9.3f}s{st['files']:>9}{st['bytes']:>14,}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark generate_blog.py on synthetic corpora.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated corpus sizes")
+    parser.add_argument("--post-kb", default=",".join(map(str, DEFAULT_POST_KB)),
+                        help="comma-separated sizes (KB) of single large posts")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="passed through to the generator stages")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare with or save to")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth of stage time, output bytes and peak RSS (0.25 = 25%%)")
+    parser.add_argument("--json", help="also write the raw results to this file")
+    parser.add_argument("--run-size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--run-post", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_size:
+        print(json.dumps(run_size(args.run_size, args.jobs)))
+        return 0
+    if args.run_post:
+        print(json.dumps(run_post(args.run_post)))
+        return 0
+
+    runs = [("--run-size", int(s)) for s in args.sizes.split(",") if s.strip()]
+    runs += [("--run-post", int(s)) for s in args.post_kb.split(",") if s.strip()]
+    results = []
+    for flag, size in runs:
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), flag, str(size), "--jobs", str(args.jobs)],
+            check=True, capture_output=True, text=True,
+        )
+        results.append(json.loads(out.stdout))
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update({str(r["size"]): r for r in results})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\nSaved baseline for {len(results)} sizes to {os.path.relpath(args.baseline)}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline yet; run with --save-baseline to record one.")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print("  " + line)
+        return 1
+    print("\nNothing regressed past the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,644 +1,4332 @@
 from __future__ import annotations
 
+import calendar
+import contextlib
+import filecmp
+import functools
+import gzip
+import hashlib
+import heapq
+import importlib
+import math
 import os
 import json
 import re
-from html import escape
+import select
+import shutil
+import string
+import struct
+import threading
+import time
+import unicodedata
+from collections import Counter
+from html import escape, unescape
+from urllib.parse import quote as url_quote
 from datetime import datetime, timezone
 
-try:
-    import markdown
-except Exception:
-    markdown = None
-
+# The site being built. These are the defaults for this checkout; build()
+# points them at a BuildConfig's root, diaries and URLs for one build.
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DIARY_DIR = os.path.join(BASE_DIR, "diaries")
-OUTPUT_JS = os.path.join(BASE_DIR, "diaries.js")
-ARCHIVE_DIR = os.path.join(BASE_DIR, "archive")
 # Custom domain is now mapped directly to this Pages site root.
 # Keep SITE_PATH empty so permalinks become /YYYY/MM/DD/.
 SITE_PATH = ""
 SITE_URL = "https://blog.gaemi.kim"
+# The paths below are relative to the site root (see site_file).
+# Per-month and per-post JSON shards fetched by the index/archive pages.
+DATA_DIR = "data"
+# Local build state: source hashes and the inputs each output was built from.
+MANIFEST_PATH = ".build-manifest.json"
+MANIFEST_VERSION = 2
+STAGING_DIR = ".staging"
+# Packed title/description/quote/tags/series per source, reused while a source is unchanged.
+METADATA_INDEX_PATH = os.path.join(".cache", "metadata.json")
+# Bump when the indexed fields change meaning (like RENDER_CACHE_VERSION).
+METADATA_INDEX_VERSION = 2
+# Content-addressed render cache; safe to share between checkouts and CI runs.
+RENDER_CACHE_DIR = os.path.join(".cache", "render")
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Bump when the rendered entry fields change (fallback output, description, quote).
+RENDER_CACHE_VERSION = 3
+# Entries per /page/N/ listing page (--per-page).
+POSTS_PER_PAGE = 10
+# Entries rendered per batch on a cold build; bounds how many bodies are resident at once.
+RENDER_BATCH = 256
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists", "nl2br"]
+# --optimize: largest allowed file per artifact kind, in bytes (override with --budget KIND=KB).
+SIZE_BUDGETS = {
+    "posts": 64 * 1024,
+    "home": 64 * 1024,
+    "archive": 128 * 1024,
+    "bundle": 2 * 1024 * 1024,
+    "data": 256 * 1024,
+    "search": 512 * 1024,
+    "sitemap": 1024 * 1024,
+    "listing": 64 * 1024,
+}
+# Hand-written assets copied to content-hashed names under assets/ so they can
+# be cached as immutable; ASSET_MANIFEST maps each logical name to its URL.
+ASSET_SOURCES = ["style.css", "search.js", "profile.jpg"]
+ASSET_MANIFEST = "asset-manifest.json"
+SERVICE_WORKER = "sw.js"
+COMPRESSIBLE_SUFFIXES = (".html", ".js", ".json", ".xml", ".css", ".txt")
+COMPRESS_MIN_BYTES = 512
+# Search index shards under data/search/; search.js must use the same tokenizer.
+SEARCH_MIN_SHARDS = 16
+SEARCH_DOCS_PER_SHARD = 4
+SEARCH_TITLE_WEIGHT = 3
+# Per-diary token counts (by source hash) and what data/search/ was built from.
+SEARCH_INDEX_PATH = os.path.join(".cache", "search")
+# Bump when search_tokens or the title weighting changes, like RENDER_CACHE_VERSION.
+SEARCH_INDEX_VERSION = 1
+# "비슷한 일기" under each post: TF-IDF over the search tokens, top RELATED_COUNT by cosine.
+RELATED_INDEX_PATH = os.path.join(".cache", "related.json")
+RELATED_INDEX_VERSION = 1
+RELATED_COUNT = 3
+RELATED_MIN_SCORE = 0.05
+# Strongest terms kept per diary; bounds the cache and the cost of one similarity row.
+RELATED_TERMS = 32
+# Terms found in more than this share of diaries say nothing about the topic.
+RELATED_MAX_DF = 0.2
+# IDF is frozen between full passes; start over once this share of the corpus changed.
+RELATED_REFRESH = 0.1
+# (row term, posting) pairs per vectorised block; bounds its temporary arrays.
+RELATED_BLOCK_PAIRS = 2_000_000
+
+
+def site_file(*parts: str) -> str:
+    # Absolute path under the root of the site being built; absolute parts pass through.
+    return os.path.join(BASE_DIR, *parts)
+
+
+@functools.lru_cache(maxsize=None)
+def optional_module(name: str):
+    # Optional dependencies (markdown, brotli, PIL, numpy) are imported on first
+    # use, so importing this module or a build that never needs them stays cheap.
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+# ── Fallback markdown renderer ─────────────────────────────────────────────
+# Used when python-markdown is not installed. It follows python-markdown's
+# output (extra + sane_lists + nl2br, html5) for the subset the diaries use:
+# paragraphs, ATX/setext headings, lists, blockquotes, fenced/indented code,
+# rules, code spans, emphasis, links, images, inline HTML and entities.
+# Blocks are built in one pass over the lines and inline text in one pass
+# over the characters, so the cost stays linear in the input size even for
+# long unbalanced runs of `*`/`_`/`` ` ``/`[`.
+
+_INLINE_SPECIAL_RE = re.compile(r"[\\`*_\[!<&>\n]")
+_INLINE_TAG_RE = re.compile(r"</?[A-Za-z][A-Za-z0-9-]*(?:\s[^<>]*)?/?>|<!--[^<>]*-->")
+_ENTITY_RE = re.compile(r"&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);")
+_BACKTICKS_RE = re.compile(r"`+")
+_ESCAPABLE = set("\\`*_{}[]()#+-.!:|<>")
+
+_HEADING_RE = re.compile(r"(#{1,6})(.*)$")
+_HR_RE = re.compile(r" {0,3}([-*_])(?: *\1){2,} *$")
+_SETEXT_RE = re.compile(r"(=+|-+) *$")
+_UL_RE = re.compile(r" {0,3}[*+-][ \t]+(.*)$")
+_OL_RE = re.compile(r" {0,3}([0-9]+)\.[ \t]+(.*)$")
+_FENCE_RE = re.compile(r"(`{3,}|~{3,})[ \t]*\.?([\w+-]*)[ \t]*$")
+_HTML_BLOCK_RE = re.compile(
+    r"<(?:address|article|aside|blockquote|details|div|dl|fieldset|figure|footer|form|h[1-6]|header|hr|"
+    r"ol|p|pre|section|table|ul)\b",
+    re.IGNORECASE,
+)
+
+
+class _Delim:
+    __slots__ = ("char", "count", "can_open", "can_close", "open_tags", "close_tags")
+
+    def __init__(self, char: str, count: int, can_open: bool, can_close: bool):
+        self.char = char
+        self.count = count
+        self.can_open = can_open
+        self.can_close = can_close
+        self.open_tags: list[str] = []
+        self.close_tags: list[str] = []
+
+    def render_open(self) -> str:
+        # Tags are appended innermost first as closers match, so they are written reversed.
+        return self.char * self.count + "".join(reversed(self.open_tags))
+
+    def render_close(self) -> str:
+        return "".join(self.close_tags) + self.char * self.count
+
+
+def _is_punct(ch: str) -> bool:
+    return ch in string.punctuation or unicodedata.category(ch).startswith("P")
+
+
+def _escape_code(text: str) -> str:
+    return escape(text, quote=True)
+
+
+class _ForwardFinder:
+    """``str.find`` for monotonically increasing start positions in linear total time."""
+
+    __slots__ = ("text", "cache")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.cache: dict[str, int] = {}
+
+    def find(self, char: str, start: int) -> int:
+        hit = self.cache.get(char)
+        if hit is not None and (hit == -1 or hit >= start):
+            return hit
+        hit = self.text.find(char, start)
+        self.cache[char] = hit
+        return hit
 
 
 def _inline_fallback(text: str) -> str:
-    # minimal inline markdown support for environments without python-markdown
-    parts = re.split(r"(`[^`]+`)", text)
+    out: list = []
+    stack: list[_Delim] = []
+    openers: dict[str, list[_Delim]] = {"*": [], "_": []}
+    finder = _ForwardFinder(text)
+
+    # Every backtick run, grouped by length, so a code span's closer is found
+    # by advancing a pointer instead of rescanning the rest of the text.
+    tick_runs: dict[int, list[int]] = {}
+    for m in _BACKTICKS_RE.finditer(text):
+        tick_runs.setdefault(m.end() - m.start(), []).append(m.start())
+    tick_next: dict[int, int] = {}
+
+    def emphasis(char: str, start: int, end: int):
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        # Left/right-flanking rules, as python-markdown applies them.
+        can_open = not after.isspace() and (not _is_punct(after) or before.isspace() or _is_punct(before))
+        can_close = not before.isspace() and (not _is_punct(before) or after.isspace() or _is_punct(after))
+        if char == "_":
+            can_open = can_open and not before.isalnum()
+            can_close = can_close and not after.isalnum()
+        delim = _Delim(char, end - start, can_open, can_close)
+
+        if can_close:
+            same = openers[char]
+            while delim.count and same:
+                opener = same[-1]
+                # Unmatched openers of the other kind inside this span stay literal.
+                while stack[-1] is not opener:
+                    dropped = stack.pop()
+                    openers[dropped.char].pop()
+                if opener.count >= 2 and delim.count >= 2 and not (opener.count >= 3 and delim.count >= 3):
+                    use, tag = 2, "strong"
+                else:
+                    use, tag = 1, "em"
+                opener.count -= use
+                delim.count -= use
+                opener.open_tags.append(f"<{tag}>")
+                delim.close_tags.append(f"</{tag}>")
+                if opener.count == 0:
+                    stack.pop()
+                    same.pop()
+        if delim.count and can_open:
+            stack.append(delim)
+            openers[char].append(delim)
+        out.append(delim)
+
+    def link(start: int) -> int:
+        # `[text](url "title")` or `![alt](src)`; returns the index after it, or -1.
+        is_image = text[start] == "!"
+        open_at = start + 1 if is_image else start
+        close = finder.find("]", open_at + 1)
+        if close == -1 or close + 1 >= len(text) or text[close + 1] != "(":
+            return -1
+        end = finder.find(")", close + 2)
+        if end == -1:
+            return -1
+        label = text[open_at + 1 : close]
+        target = text[close + 2 : end].strip()
+        title = None
+        if target.endswith('"') and ' "' in target:
+            target, title = target[:-1].split(' "', 1)
+        attrs = f' title="{escape(title)}"' if title is not None else ""
+        if is_image:
+            out.append(f'<img alt="{escape(label)}" src="{escape(target)}"{attrs}>')
+        else:
+            out.append(f'<a href="{escape(target)}"{attrs}>{_inline_fallback(label)}</a>')
+        return end + 1
+
+    pos = 0
+    n = len(text)
+    while pos < n:
+        m = _INLINE_SPECIAL_RE.search(text, pos)
+        if m is None:
+            out.append(text[pos:])
+            break
+        i = m.start()
+        if i > pos:
+            out.append(text[pos:i])
+        ch = text[i]
+
+        if ch == "\\" and i + 1 < n and text[i + 1] in _ESCAPABLE:
+            nxt = text[i + 1]
+            out.append({"<": "&lt;", ">": "&gt;"}.get(nxt, nxt))
+            pos = i + 2
+        elif ch == "`":
+            j = i
+            while j < n and text[j] == "`":
+                j += 1
+            runs = tick_runs.get(j - i, [])
+            k = tick_next.get(j - i, 0)
+            while k < len(runs) and runs[k] <= i:
+                k += 1
+            tick_next[j - i] = k
+            if k < len(runs):
+                close = runs[k]
+                out.append(f"<code>{_escape_code(text[j:close].strip())}</code>")
+                pos = close + (j - i)
+            else:
+                out.append(text[i:j])
+                pos = j
+        elif ch in "*_":
+            j = i
+            while j < n and text[j] == ch:
+                j += 1
+            emphasis(ch, i, j)
+            pos = j
+        elif ch in "[!":
+            end = link(i) if (ch == "[" or (i + 1 < n and text[i + 1] == "[")) else -1
+            if end == -1:
+                out.append(ch)
+                pos = i + 1
+            else:
+                pos = end
+        elif ch == "<":
+            tag = _INLINE_TAG_RE.match(text, i)
+            out.append(tag.group(0) if tag else "&lt;")
+            pos = tag.end() if tag else i + 1
+        elif ch == "&":
+            entity = _ENTITY_RE.match(text, i)
+            out.append(entity.group(0) if entity else "&amp;")
+            pos = entity.end() if entity else i + 1
+        elif ch == ">":
+            out.append("&gt;")
+            pos = i + 1
+        elif ch == "\n":
+            out.append("<br>\n")
+            pos = i + 1
+        else:
+            out.append(ch)
+            pos = i + 1
+
     rendered = []
-    for part in parts:
-        if not part:
+    for part in out:
+        if isinstance(part, _Delim):
+            rendered.append(part.render_open() if part.open_tags else part.render_close())
+        else:
+            rendered.append(part)
+    return "".join(rendered)
+
+
+def _paragraph_text(lines: list[str]) -> str:
+    # A line ending in two spaces is a hard break; nl2br already turns every newline into <br>.
+    cleaned = [line.rstrip() if line.endswith("  ") else line for line in lines]
+    return "\n".join(cleaned).strip()
+
+
+def _render_list(kind: str, start: int, items: list[dict], frames: list[list[str]]) -> list:
+    attrs = f' start="{start}"' if kind == "ol" and start != 1 else ""
+    parts: list = [f"<{kind}{attrs}>"]
+    for item in items:
+        parts.append("\n")
+        if item["loose"]:
+            frames.append(item["lines"] + [""] + item["children"] if item["children"] else item["lines"])
+            parts += ["<li>\n", len(frames) - 1, "\n</li>"]
+        else:
+            parts.append("<li>" + _inline_fallback(_paragraph_text(item["lines"])))
+            if item["children"]:
+                frames.append(item["children"])
+                parts += [len(frames) - 1, "\n"]
+            parts.append("</li>")
+    parts += ["\n", f"</{kind}>"]
+    return parts
+
+
+def _render_blocks(lines: list[str], frames: list[list[str]]) -> list:
+    # Renders one level of blocks. Blockquotes and list items are not rendered here:
+    # their lines are pushed onto `frames` and left as that frame's index among the
+    # returned parts, so nesting depth never turns into recursion depth.
+    blocks: list = []
+    para: list[str] = []
+    quote: list[str] | None = None
+    code: list[str] | None = None
+    html_block = False
+    fence: tuple[str, str, list[str]] | None = None
+    lst: dict | None = None
+    blank_before = True
+
+    def flush_para():
+        if para:
+            blocks.append(f"<p>{_inline_fallback(_paragraph_text(para))}</p>")
+            para.clear()
+
+    def flush_quote():
+        nonlocal quote
+        if quote is not None:
+            while quote and not quote[-1].strip():
+                quote.pop()
+            frames.append(quote)
+            blocks.append(["<blockquote>\n", len(frames) - 1, "\n</blockquote>"])
+            quote = None
+
+    def flush_code():
+        nonlocal code
+        if code is not None:
+            while code and not code[-1].strip():
+                code.pop()
+            blocks.append("<pre><code>" + _escape_code("\n".join(code)) + "\n</code></pre>")
+            code = None
+
+    def flush_list():
+        nonlocal lst
+        if lst is not None:
+            blocks.append(_render_list(lst["kind"], lst["start"], lst["items"], frames))
+            lst = None
+
+    def flush_all():
+        flush_para()
+        flush_quote()
+        flush_code()
+        flush_list()
+
+    for raw_line in lines:
+        line = raw_line.expandtabs(4)
+        stripped = line.strip()
+
+        if fence is not None:
+            marker, lang, body = fence
+            if stripped.startswith(marker[0] * len(marker)) and not stripped.strip(marker[0]):
+                cls = f' class="language-{lang}"' if lang else ""
+                blocks.append(f"<pre><code{cls}>" + _escape_code("\n".join(body)) + "\n</code></pre>")
+                fence = None
+                blank_before = True
+            else:
+                body.append(raw_line)
             continue
-        if part.startswith("`") and part.endswith("`") and len(part) >= 2:
-            rendered.append(f"<code>{escape(part[1:-1])}</code>")
+
+        if html_block:
+            if stripped:
+                blocks[-1] += "\n" + raw_line
+                continue
+            html_block = False
+
+        if not stripped:
+            flush_para()
+            if code is not None:
+                code.append("")
+            if lst is not None:
+                lst["blank"] = True
+            if quote is not None:
+                quote.append("")
+            blank_before = True
             continue
 
-        escaped = escape(part)
-        escaped = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escaped)
-        escaped = re.sub(r"__(.+?)__", r"<strong>\1</strong>", escaped)
-        escaped = re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", r"<em>\1</em>", escaped)
-        escaped = re.sub(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)", r"<em>\1</em>", escaped)
-        rendered.append(escaped)
-    return "".join(rendered)
+        indent = len(line) - len(line.lstrip(" "))
+        ul = _UL_RE.match(line)
+        ol = _OL_RE.match(line) if ul is None else None
 
+        if code is not None:
+            if indent >= 4:
+                code.append(line[4:])
+                continue
+            flush_code()
 
-def markdown_to_html(clean_content: str) -> str:
-    if markdown is not None:
-        return markdown.markdown(
-            clean_content,
-            extensions=["extra", "sane_lists", "nl2br"],
-            output_format="html5",
-        )
+        if lst is not None:
+            kind = lst["kind"]
+            marker = ul if kind == "ul" else ol
+            item = lst["items"][-1]
+            if marker is not None and indent < 4:
+                loose = lst["blank"] or lst["loose"]
+                if lst["blank"]:
+                    item["loose"] = True
+                lst["loose"] = loose
+                lst["blank"] = False
+                lst["items"].append({"lines": [marker.group(marker.re.groups)], "children": [], "loose": loose})
+                continue
+            if indent >= 4:
+                child = line[4:]
+                if lst["blank"] or item["children"] or _UL_RE.match(child) or _OL_RE.match(child):
+                    if lst["blank"]:
+                        item["loose"] = True
+                        if item["children"]:
+                            item["children"].append("")
+                    item["children"].append(child)
+                else:
+                    item["lines"].append(raw_line)
+                lst["blank"] = False
+                continue
+            if not lst["blank"]:
+                (item["children"] or item["lines"]).append(raw_line)
+                continue
+            flush_list()
+
+        if quote is not None:
+            if stripped.startswith(">"):
+                quote.append(stripped[1:][1:] if stripped[1:2] == " " else stripped[1:])
+                continue
+            if quote and quote[-1].strip():
+                quote.append(raw_line)
+                continue
+            flush_quote()
+
+        fence_match = _FENCE_RE.match(stripped) if indent < 4 else None
+        if fence_match:
+            flush_all()
+            fence = (fence_match.group(1), fence_match.group(2), [])
+            continue
+
+        heading = _HEADING_RE.match(line.lstrip()) if indent < 4 else None
+        if heading:
+            flush_para()
+            level = len(heading.group(1))
+            title = heading.group(2)
+            if title.endswith("#"):
+                title = title.rstrip("#")
+            blocks.append(f"<h{level}>{_inline_fallback(title.strip())}</h{level}>")
+            blank_before = True
+            continue
+
+        if para and len(para) == 1 and _SETEXT_RE.match(stripped) and indent < 4:
+            level = 1 if stripped[0] == "=" else 2
+            blocks.append(f"<h{level}>{_inline_fallback(para[0].strip())}</h{level}>")
+            para.clear()
+            blank_before = True
+            continue
+
+        if _HR_RE.match(line):
+            flush_para()
+            blocks.append("<hr>")
+            blank_before = True
+            continue
+
+        if para:
+            para.append(raw_line)
+            continue
+
+        if blank_before and indent >= 4:
+            code = [line[4:]]
+            continue
+
+        if ul is not None or ol is not None:
+            marker = ul if ul is not None else ol
+            lst = {
+                "kind": "ul" if ul is not None else "ol",
+                "start": int(ol.group(1)) if ol is not None else 1,
+                "items": [{"lines": [marker.group(marker.re.groups)], "children": [], "loose": False}],
+                "blank": False,
+                "loose": False,
+            }
+            continue
+
+        if stripped.startswith(">"):
+            quote = [stripped[1:][1:] if stripped[1:2] == " " else stripped[1:]]
+            continue
 
-    lines = clean_content.splitlines()
-    html_parts = []
-    paragraph_buf = []
-
-    def flush_paragraph():
-        nonlocal paragraph_buf
-        if paragraph_buf:
-            text = " ".join(s.strip() for s in paragraph_buf if s.strip())
-            if text:
-                html_parts.append(f"<p>{_inline_fallback(text)}</p>")
-            paragraph_buf = []
-
-    for line in lines:
-        s = line.strip()
-        if not s:
-            flush_paragraph()
+        if blank_before and _HTML_BLOCK_RE.match(stripped):
+            blocks.append(raw_line)
+            html_block = True
             continue
 
-        if s.startswith("### "):
-            flush_paragraph()
-            html_parts.append(f"<h3>{_inline_fallback(s[4:].strip())}</h3>")
-        elif s.startswith("## "):
-            flush_paragraph()
-            html_parts.append(f"<h2>{_inline_fallback(s[3:].strip())}</h2>")
-        elif s.startswith("# "):
-            flush_paragraph()
-            html_parts.append(f"<h1>{_inline_fallback(s[2:].strip())}</h1>")
-        elif s.startswith("- "):
-            flush_paragraph()
-            html_parts.append(f"<li>{_inline_fallback(s[2:].strip())}</li>")
+        blank_before = False
+        para.append(raw_line.lstrip() if not para else raw_line)
+
+    if fence is not None:
+        # An unclosed fence is plain text, as in python-markdown.
+        marker, lang, body = fence
+        para.extend([marker + lang] + body)
+    flush_all()
+    parts: list = []
+    for block in blocks:
+        if parts:
+            parts.append("\n")
+        if isinstance(block, str):
+            parts.append(block)
         else:
-            paragraph_buf.append(s)
+            parts += block
+    return parts
 
-    flush_paragraph()
 
-    normalized = []
-    in_list = False
-    for part in html_parts:
-        if part.startswith("<li>") and not in_list:
-            normalized.append("<ul>")
-            in_list = True
-        if not part.startswith("<li>") and in_list:
-            normalized.append("</ul>")
-            in_list = False
-        normalized.append(part)
-    if in_list:
-        normalized.append("</ul>")
+def _markdown_fallback(clean_content: str) -> str:
+    frames = [clean_content.splitlines()]
+    rendered = [_render_blocks(lines, frames) for lines in frames]  # grows while it runs
+    out = []
+    stack = [iter(rendered[0])]
+    while stack:
+        part = next(stack[-1], None)
+        if part is None:
+            stack.pop()
+        elif isinstance(part, int):
+            stack.append(iter(rendered[part]))
+        else:
+            out.append(part)
+    return "".join(out)
 
-    return "".join(normalized)
 
+# Constructs the fallback must render exactly like python-markdown, on top of
+# every diary in diaries/ (see --check-fallback).
+FALLBACK_PARITY_CASES = [
+    "a\nb\n\n## h\ntext",
+    "para\n- item\n- two",
+    "- a\ncont\n- b\n\n- c",
+    "- a\n- b\n\npara",
+    "- a\n    - nested\n- b",
+    "- a\n\n    para2",
+    "- a\n- b\n    more",
+    "3. x\n4. y",
+    "1. a\n- b",
+    "> quote\n> more\n\npara",
+    "> a\n\n> b",
+    "```py\nx<1 & \"y\"\n```",
+    "    code block",
+    "h1\n# Title #\nafter",
+    "##no space",
+    "Title\n===",
+    "text\n---",
+    "a\nb\n---",
+    "* * *",
+    "a  \nb",
+    "a *b* **c** _d_ __e__ posted_comment_x `<x>` \"q\" & &amp; <b>h</b>",
+    "***x*** *a **b** c*",
+    "text **a\nb** c",
+    "**unclosed *x",
+    "*a*b* x*",
+    "a **b(c)**d x **(a)b** y",
+    "`a`b`c` ``a ` b``",
+    "[l](http://x \"t\") ![i](y.png)",
+    "line\\*esc \\# not heading",
+    "<div>\nblock\n</div>",
+]
 
-def extract_description(markdown_text: str, limit: int = 155) -> str:
-    text = re.sub(r"```[\s\S]*?```", "", markdown_text)
-    text = re.sub(r"`([^`]*)`", r"\1", text)
-    text = re.sub(r"!\[[^\]]*\]\([^\)]*\)", "", text)
-    text = re.sub(r"\[[^\]]*\]\([^\)]*\)", "", text)
-    text = re.sub(r"[#>*_\-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    if len(text) <= limit:
-        return text
-    return text[: limit - 1].rstrip() + "…"
-
-
-def get_diary_list():
-    files = [f for f in os.listdir(DIARY_DIR) if f.endswith(".md")]
-    diaries = []
 
-    for f in sorted(files, reverse=True):
-        path = os.path.join(DIARY_DIR, f)
-        with open(path, "r", encoding="utf-8") as file:
-            content = file.read()
+# The rest of MARKDOWN_EXTENSIONS, which the fallback does not implement: a
+# backend saved by `renderers` must render these like python-markdown too.
+EXTENSION_PARITY_CASES = [
+    "| a | b |\n|---|:-:|\n| 1 | *2* |",
+    "text[^1]\n\n[^1]: note",
+    "[ref][r] and [r]\n\n[r]: http://x \"t\"",
+    "*[HTML]: Hyper Text\nHTML here",
+    "term\n:   definition",
+    "# Title {#intro .cls}\n\npara\n{: .note }",
+    "<http://example.com> <me@example.com>",
+    "<div markdown=\"1\">*md*</div>",
+]
 
-        title_match = re.search(r"^#\s+(.*)", content, re.MULTILINE)
-        title = title_match.group(1).strip() if title_match else f
 
-        clean_content = re.sub(r"^#\s+.*", "", content, count=1, flags=re.MULTILINE).strip()
-        html_content = markdown_to_html(clean_content)
+def parity_corpus() -> list[tuple[str, str]]:
+    corpus = [(f"case {i}", text) for i, text in enumerate(FALLBACK_PARITY_CASES)]
+    for f in sorted(os.listdir(DIARY_DIR)):
+        if f.endswith(".md"):
+            with open(os.path.join(DIARY_DIR, f), "r", encoding="utf-8") as file:
+                corpus.append((f, parse_source(file.read(), f)[1]))
+    return corpus
 
-        date_str = f.replace(".md", "")
-        y, m, d = date_str.split("-")
-        permalink_path = f"{SITE_PATH}/{y}/{m}/{d}/"
-        canonical_url = f"{SITE_URL}/{y}/{m}/{d}/"
 
-        diaries.append(
-            {
-                "date": date_str,
-                "title": title,
-                "content": html_content,
-                "raw": clean_content,
-                "permalink": permalink_path,
-                "canonical": canonical_url,
-                "description": extract_description(clean_content),
-            }
-        )
+def parity_mismatches(render, corpus) -> list[tuple[str, str, str]]:
+    # (name, python-markdown output, candidate output) for every text rendered differently.
+    reference = load_backend("python-markdown")[1]
+    mismatches = []
+    for name, text in corpus:
+        expected = reference(text)
+        actual = render(text)
+        if expected != actual:
+            mismatches.append((name, expected, actual))
+    return mismatches
 
-    return diaries
 
+def check_fallback_parity() -> int:
+    if optional_module("markdown") is None:
+        print("python-markdown is not installed; nothing to compare against.")
+        return 2
 
-def month_of(date_str: str) -> str:
-    return date_str[:7]
+    corpus = parity_corpus()
+    mismatches = parity_mismatches(_markdown_fallback, corpus)
+    for name, expected, actual in mismatches:
+        print(f"MISMATCH {name}")
+        for exp_line, act_line in zip(expected.splitlines(), actual.splitlines()):
+            if exp_line != act_line:
+                print(f"  python-markdown: {exp_line}")
+                print(f"  fallback:        {act_line}")
+                break
 
+    print(f"Fallback parity: {len(corpus) - len(mismatches)}/{len(corpus)} identical")
+    return 1 if mismatches else 0
 
-def month_label(month: str) -> str:
-    y, m = month.split("-")
-    return f"{y}년 {int(m)}월"
 
+def _python_markdown_backend():
+    markdown = optional_module("markdown")
+    if markdown is None:
+        raise ImportError("python-markdown is not installed")
+    # One Markdown instance per process; reset() clears the per-document state
+    # (footnotes, abbreviations, reference links) between posts.
+    md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, output_format="html5")
+    label = f"python-markdown {getattr(markdown, '__version__', '?')} {'+'.join(MARKDOWN_EXTENSIONS)} html5"
+    return label, lambda text: md.reset().convert(text)
 
-def build_archive_html(rel_prefix: str, selected_month: str | None = None):
-    selected_month_js = json.dumps(selected_month, ensure_ascii=False)
-    return f"""<!DOCTYPE html>
-<html lang=\"ko\">
-<head>
-    <meta charset=\"UTF-8\">
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
-    <title>🐜 일기 목록 | 개미의 일기</title>
-    <link rel=\"stylesheet\" href=\"{rel_prefix}style.css?v=20260623\">
-    <script src=\"{rel_prefix}diaries.js\"></script>
-</head>
-<body>
-    <header>
-        <a href=\"{rel_prefix}index.html\" class=\"back-link\">&larr; 홈으로</a>
-        <h1>📅 일기 목록</h1>
-        <p id=\"month-title\">월별 목록</p>
-    </header>
 
-    <main>
-        <div class=\"calendar-toolbar\" id=\"calendar-toolbar\" style=\"display:none;\">
-            <a id=\"prev-month-link\" class=\"month-link\" href=\"#\">&larr; 이전 달</a>
-            <div class=\"month-picker-wrap\">
-                <button id=\"month-picker-btn\" class=\"month-picker-btn\" type=\"button\" aria-haspopup=\"listbox\" aria-expanded=\"false\">-</button>
-                <div id=\"month-picker-menu\" class=\"month-picker-menu\" role=\"listbox\" aria-label=\"월 선택\" hidden></div>
-            </div>
-            <a id=\"next-month-link\" class=\"month-link\" href=\"#\">다음 달 &rarr;</a>
-        </div>
+def _markdown_it_backend():
+    import markdown_it
 
-        <section class=\"calendar-card\" id=\"calendar-card\" style=\"display:none;\">
-            <div class=\"calendar-weekdays\">
-                <span>일</span><span>월</span><span>화</span><span>수</span><span>목</span><span>금</span><span>토</span>
-            </div>
-            <div class=\"calendar-grid\" id=\"calendar-grid\"></div>
-            <p class=\"calendar-help\">노란 점 있는 날짜 = 일기 있음 (클릭 이동)</p>
-        </section>
+    md = markdown_it.MarkdownIt("commonmark", {"breaks": True, "html": True, "xhtmlOut": False}).enable("table")
+    return f"markdown-it-py {markdown_it.__version__}", lambda text: md.render(text).rstrip("\n")
 
-        <ul id=\"archives-list\" class=\"archives-list\">
-            <li>목록을 불러오는 중입니다.</li>
-        </ul>
-    </main>
 
-    <footer>
-        <p>&copy; 2026 Gaemi (🐜). Powered by OpenClaw.</p>
-        <p>Contact: <a href="mailto:i.am@gaemi.kim">i.am@gaemi.kim</a></p>
-    </footer>
+def _mistune_backend():
+    import mistune
 
-    <script>
-        const SELECTED_MONTH = {selected_month_js};
-
-        function getMonth(dateStr) {{
-            return (dateStr || '').slice(0, 7);
-        }}
-
-        function monthPath(month) {{
-            return '{rel_prefix}archive/' + month + '/';
-        }}
-
-        function monthLabel(month) {{
-            if (!month || month.length !== 7) return '전체';
-            const [y, m] = month.split('-');
-            return `${{y}}년 ${{Number(m)}}월`;
-        }}
-
-        function entryHref(diary) {{
-            const permalink = diary?.permalink;
-            if (permalink) {{
-                if (permalink.startsWith('/')) {{
-                    return '{rel_prefix}' + permalink.replace(/^\//, '');
-                }}
-                return permalink;
-            }}
-            return '{rel_prefix}index.html?date=' + diary.date;
-        }}
-
-        function renderCalendar(month, diariesInMonth) {{
-            const card = document.getElementById('calendar-card');
-            const grid = document.getElementById('calendar-grid');
-            if (!month || !grid) return;
-
-            const [year, mm] = month.split('-').map(Number);
-            const firstDay = new Date(year, mm - 1, 1).getDay();
-            const daysInMonth = new Date(year, mm, 0).getDate();
-
-            const byDate = new Map(diariesInMonth.map(d => [d.date, d]));
-            const cells = [];
-
-            for (let i = 0; i < firstDay; i++) {{
-                cells.push('<span class="calendar-day empty"></span>');
-            }}
-
-            for (let day = 1; day <= daysInMonth; day++) {{
-                const dateStr = `${{year}}-${{String(mm).padStart(2, '0')}}-${{String(day).padStart(2, '0')}}`;
-                const diary = byDate.get(dateStr);
-                if (diary) {{
-                    cells.push(`
-                        <a class="calendar-day has-entry" href="${{entryHref(diary)}}" title="${{diary.date}} · ${{diary.title}}">
-                            <span>${{day}}</span><em class="dot"></em>
-                        </a>
-                    `);
-                }} else {{
-                    cells.push(`<span class="calendar-day no-entry"><span>${{day}}</span></span>`);
-                }}
-            }}
-
-            grid.innerHTML = cells.join('');
-            card.style.display = 'block';
-        }}
-
-        function init() {{
-            const diaries = typeof DIARY_DATA !== 'undefined' ? DIARY_DATA : [];
-            const list = document.getElementById('archives-list');
-            const title = document.getElementById('month-title');
-            const toolbar = document.getElementById('calendar-toolbar');
-
-            if (diaries.length === 0) {{
-                list.innerHTML = '<li>작성된 일기가 없습니다.</li>';
-                title.textContent = '작성된 일기가 없습니다';
-                return;
-            }}
-
-            const months = [...new Set(diaries.map(d => getMonth(d.date)).filter(Boolean))];
-            months.sort((a, b) => b.localeCompare(a));
-
-            const currentMonth = (SELECTED_MONTH && months.includes(SELECTED_MONTH)) ? SELECTED_MONTH : months[0];
-            const currentMonthIndex = months.indexOf(currentMonth);
-            const filtered = diaries.filter(d => getMonth(d.date) === currentMonth);
-
-            title.textContent = `${{monthLabel(currentMonth)}} 기록 (${{filtered.length}}개)`;
-            renderCalendar(currentMonth, filtered);
-            list.innerHTML = filtered.map((d) => `
-                <li>
-                    <a href="${{entryHref(d)}}">
-                        <span class="date">${{d.date}}</span> - ${{d.title}}
-                    </a>
-                </li>
-            `).join('');
-
-            toolbar.style.display = 'flex';
-
-            const prevMonth = months[currentMonthIndex + 1] || null;
-            const nextMonth = months[currentMonthIndex - 1] || null;
-
-            const prevLink = document.getElementById('prev-month-link');
-            const nextLink = document.getElementById('next-month-link');
-            const monthBtn = document.getElementById('month-picker-btn');
-            const monthMenu = document.getElementById('month-picker-menu');
-
-            monthBtn.textContent = `${{monthLabel(currentMonth)}} ▾`;
-
-            const monthSet = new Set(months);
-            let pickerYear = Number(currentMonth.slice(0, 4));
-
-            function renderMonthPicker(year) {{
-                const monthCells = Array.from({{ length: 12 }}, (_, i) => {{
-                    const mm = String(i + 1).padStart(2, '0');
-                    const key = `${{year}}-${{mm}}`;
-                    const enabled = monthSet.has(key);
-                    const active = key === currentMonth;
-                    return `<button type="button" class="month-menu-item${{active ? ' active' : ''}}" data-month="${{key}}" ${{enabled ? '' : 'disabled'}}>${{i + 1}}월</button>`;
-                }}).join('');
-
-                monthMenu.innerHTML = `
-                    <div class="month-picker-head">
-                        <button type="button" class="month-year-nav" data-year-nav="-1" aria-label="이전 연도">&larr;</button>
-                        <strong>${{year}}년</strong>
-                        <button type="button" class="month-year-nav" data-year-nav="1" aria-label="다음 연도">&rarr;</button>
-                    </div>
-                    <div class="month-picker-grid">${{monthCells}}</div>
-                    <p class="month-picker-note">회색 달은 아직 일기 없음</p>
-                `;
-            }}
-
-            monthBtn.onclick = (e) => {{
-                e.stopPropagation();
-                const isOpen = !monthMenu.hidden;
-                monthMenu.hidden = isOpen;
-                monthBtn.setAttribute('aria-expanded', isOpen ? 'false' : 'true');
-                if (!isOpen) renderMonthPicker(pickerYear);
-            }};
+    md = mistune.create_markdown(escape=False, hard_wrap=True, plugins=["table", "footnotes", "def_list", "abbr"])
+    return f"mistune {mistune.__version__}", lambda text: md(text).rstrip("\n")
 
-            monthMenu.addEventListener('click', (e) => {{
-                e.stopPropagation();
-                const yearNav = e.target.closest('.month-year-nav');
-                if (yearNav) {{
-                    pickerYear += Number(yearNav.getAttribute('data-year-nav') || '0');
-                    renderMonthPicker(pickerYear);
-                    return;
-                }}
 
-                const item = e.target.closest('.month-menu-item');
-                if (!item || item.disabled) return;
-                const picked = item.getAttribute('data-month');
-                if (!picked) return;
-                window.location.href = monthPath(picked);
-            }});
-
-            document.addEventListener('click', (e) => {{
-                if (!monthMenu.hidden && !e.target.closest('.month-picker-wrap')) {{
-                    monthMenu.hidden = true;
-                    monthBtn.setAttribute('aria-expanded', 'false');
-                }}
-            }});
-
-            if (prevMonth) {{
-                prevLink.href = monthPath(prevMonth);
-                prevLink.style.visibility = 'visible';
-                prevLink.innerHTML = `&larr; 이전 달`;
-            }} else {{
-                prevLink.removeAttribute('href');
-                prevLink.style.visibility = 'hidden';
-            }}
-
-            if (nextMonth) {{
-                nextLink.href = monthPath(nextMonth);
-                nextLink.style.visibility = 'visible';
-                nextLink.innerHTML = `다음 달 &rarr;`;
-            }} else {{
-                nextLink.removeAttribute('href');
-                nextLink.style.visibility = 'hidden';
-            }}
-        }}
-
-        init();
-    </script>
-</body>
-</html>
-"""
+def _fallback_backend():
+    return "fallback", _markdown_fallback
 
 
-def generate_archive_pages(diaries):
-    months = sorted({month_of(d["date"]) for d in diaries}, reverse=True)
+# Renderers the build can use. Only python-markdown (or the fallback when it is
+# missing) is picked without asking; the others need --renderer or a
+# `renderers` run that found their output identical on the parity corpus.
+MARKDOWN_BACKENDS = {
+    "python-markdown": _python_markdown_backend,
+    "markdown-it": _markdown_it_backend,
+    "mistune": _mistune_backend,
+    "fallback": _fallback_backend,
+}
+RENDERER_CHOICE_PATH = os.path.join(".cache", "renderer.json")
 
-    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+_active_backend: list = []
+_renderer_choice = "auto"
 
-    with open(os.path.join(ARCHIVE_DIR, "index.html"), "w", encoding="utf-8") as f:
-        f.write(build_archive_html("../", None))
 
-    for month in months:
-        month_dir = os.path.join(ARCHIVE_DIR, month)
-        os.makedirs(month_dir, exist_ok=True)
-        with open(os.path.join(month_dir, "index.html"), "w", encoding="utf-8") as f:
-            f.write(build_archive_html("../../", month))
+@functools.lru_cache(maxsize=None)
+def load_backend(name: str):
+    # (label, render) for one backend, built once per process. ImportError if not installed.
+    return MARKDOWN_BACKENDS[name]()
 
 
-DAY_EN = ['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT']
+def saved_renderer() -> str | None:
+    try:
+        with open(site_file(RENDERER_CHOICE_PATH), "r", encoding="utf-8") as f:
+            return json.load(f).get("backend")
+    except (OSError, ValueError):
+        return None
 
 
-def fmt_display_date(date_str: str) -> str:
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
-    return f"{dt.year}.{dt.month:02d}.{dt.day:02d} {DAY_EN[(dt.weekday() + 1) % 7]}"
+def use_renderer(name: str = "auto"):
+    # Also the render pool's initializer, so every worker warms the parent's backend.
+    global _renderer_choice
+    _renderer_choice = name
+    _active_backend.clear()
 
 
-def extract_quote(markdown_text: str) -> str:
-    match = re.search(r"##\s*오늘의 한 줄\s*\n+([\s\S]+?)(?=\n##|\n#|$)", markdown_text or "")
-    return match.group(1).strip() if match else ""
+def active_backend():
+    # (name, label, render) for the selected renderer.
+    if not _active_backend:
+        auto = _renderer_choice == "auto"
+        # A saved "fallback" (from an older `renderers`) must not shadow python-markdown.
+        saved = [saved_renderer()] if saved_renderer() != "fallback" else []
+        for name in [*saved, "python-markdown", "fallback"] if auto else [_renderer_choice]:
+            if name not in MARKDOWN_BACKENDS:
+                continue
+            try:
+                _active_backend[:] = [name, *load_backend(name)]
+                break
+            except ImportError:
+                if not auto:
+                    raise SystemExit(f"renderer {name!r} is not installed")
+    return _active_backend
 
 
-def strip_quote_section(html: str) -> str:
-    return re.sub(
-        r"<h2[^>]*>\s*오늘의 한 줄\s*</h2>\s*(?:(?!<h[1-3][^>]*>).)*",
-        "",
-        html or "",
-        flags=re.IGNORECASE | re.DOTALL,
-    ).strip()
+def markdown_to_html(clean_content: str) -> str:
+    return active_backend()[2](clean_content)
 
 
-def nav_card(diary: dict | None, direction: str) -> str:
-    if diary is None:
-        return '<span class="nav-card-empty"></span>'
+def bench_renderers(rounds: int = 3) -> int:
+    # Time every installed backend on the parity corpus and save the fastest one
+    # whose output matches python-markdown; `--renderer auto` builds use it. The
+    # fallback only stands in for a missing python-markdown, so it is never saved.
+    if optional_module("markdown") is None:
+        print("python-markdown is not installed; nothing to compare against.")
+        return 2
 
-    is_prev = direction == "prev"
-    dir_label = "← 이전" if is_prev else "다음 →"
-    extra_class = "prev" if is_prev else "next"
-    return (
-        f'<a href="{diary["permalink"]}" class="nav-card {extra_class}">'
-        f'<div class="nav-card-dir">{dir_label}</div>'
-        f'<div class="nav-card-date">{fmt_display_date(diary["date"])}</div>'
-        f'<div class="nav-card-title">{escape(diary["title"])}</div>'
-        '</a>'
-    )
+    corpus = parity_corpus() + [(f"extension {i}", text) for i, text in enumerate(EXTENSION_PARITY_CASES)]
+    print(f"{len(corpus)} texts, {sum(len(t) for _, t in corpus):,} characters, best of {rounds} rounds")
+    timings = []
+    for name in MARKDOWN_BACKENDS:
+        try:
+            label, render = load_backend(name)
+        except ImportError:
+            print(f"  {name:<16}not installed")
+            continue
+        best = None
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _, text in corpus:
+                render(text)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        mismatches = parity_mismatches(render, corpus)
+        status = f"{len(mismatches)} differ (first: {mismatches[0][0]})" if mismatches else "identical"
+        print(f"  {name:<16}{best * 1000:>9.1f} ms  {status}  [{label}]")
+        if not mismatches and name != "fallback":
+            timings.append((best, name))
 
+    fastest = min(timings)[1]
+    os.makedirs(os.path.dirname(site_file(RENDERER_CHOICE_PATH)), exist_ok=True)
+    with open(site_file(RENDERER_CHOICE_PATH), "w", encoding="utf-8") as f:
+        json.dump({"backend": fastest}, f)
+    print(f"Fastest identical renderer: {fastest} (saved for --renderer auto)")
+    return 0
 
-def build_post_html(diary: dict, prev_diary: dict | None, next_diary: dict | None, seq: int) -> str:
-    title = escape(diary["title"])
-    description = escape(diary["description"])
-    canonical = diary["canonical"]
-    date = diary["date"]
-    display_date = fmt_display_date(date)
-    content = strip_quote_section(diary["content"])
-    quote = extract_quote(diary.get("raw", ""))
-    quote_html = (
-        '<div class="daily-quote">'
-        '<span class="daily-quote-label">오늘의 한 줄</span>'
-        f'<p class="daily-quote-text">{escape(quote)}</p>'
-        '</div>'
-        if quote
-        else ''
-    )
-    prev_link = nav_card(prev_diary, "prev")
-    next_link = nav_card(next_diary, "next")
 
-    return f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>{title} | 🐜 개미의 일기</title>
-  <meta name="description" content="{description}">
-  <link rel="canonical" href="{canonical}">
+_QUOTE_HEADING_RE = re.compile(r"##[ \t]*오늘의 한 줄[ \t]*$")
+_DESCRIPTION_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^\)]*\)")
+_DESCRIPTION_LINK_RE = re.compile(r"\[[^\]]*\]\([^\)]*\)")
+_DESCRIPTION_BLANKS = str.maketrans("#>*_-", "     ")
 
-  <meta property="og:type" content="article">
-  <meta property="og:site_name" content="개미의 일기">
-  <meta property="og:title" content="{title}">
-  <meta property="og:description" content="{description}">
-  <meta property="og:url" content="{canonical}">
-  <meta property="og:image" content="{SITE_URL}/profile.jpg">
 
-  <meta name="twitter:card" content="summary_large_image">
-  <meta name="twitter:title" content="{title}">
-  <meta name="twitter:description" content="{description}">
-  <meta name="twitter:image" content="{SITE_URL}/profile.jpg">
+def _strip_fences(text: str) -> str:
+    parts, i = [], 0
+    while True:
+        start = text.find("```", i)
+        close = text.find("```", start + 3) if start != -1 else -1
+        if close == -1:
+            parts.append(text[i:])
+            return "".join(parts)
+        parts.append(text[i:start])
+        i = close + 3
 
-  <script type="application/ld+json">
-  {{
-    "@context": "https://schema.org",
-    "@type": "BlogPosting",
-    "headline": {json.dumps(diary['title'], ensure_ascii=False)},
-    "datePublished": "{date}",
-    "dateModified": "{date}",
-    "author": {{
-      "@type": "Person",
-      "name": "개미"
-    }},
-    "mainEntityOfPage": {{
-      "@type": "WebPage",
-      "@id": "{canonical}"
-    }},
-    "description": {json.dumps(diary['description'], ensure_ascii=False)}
-  }}
-  </script>
 
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:ital,wght@0,400;0,500;1,400&display=swap" rel="stylesheet">
-  <link href="https://cdn.jsdelivr.net/npm/pretendard@latest/dist/web/variable/pretendardvariable.min.css" rel="stylesheet">
-  <link rel="stylesheet" href="/style.css?v=20260623">
-</head>
-<body>
-<div class="page-wrap">
-  <div class="container">
-    <div class="card">
-      <header class="site-header">
-        <div class="site-profile-wrap">
-          <a href="/" aria-label="개미의 일기 홈">
-            <img src="/profile.jpg" alt="개미 프로필">
-          </a>
-        </div>
-        <h1 class="site-title"><a href="/">개미의 일기</a></h1>
-        <p class="site-subtitle">형님의 AI 꼬붕, 개미의 고군분투 삽질 일지</p>
-        <div class="site-dots">· · ·</div>
-        <a href="/archive/" class="site-archive-link">아카이브 →</a>
-      </header>
+def extract_description(markdown_text: str, limit: int = 155) -> str:
+    # Same steps as the old regex chain, in the same order: fenced blocks drop out,
+    # inline code is unwrapped (backticks pair up left to right, so only an odd last
+    # one survives), images then links drop out, and markdown punctuation and
+    # whitespace collapse to single spaces. Only that last step is local, so it
+    # runs on a growing prefix until `limit` characters are known.
+    text = _strip_fences(markdown_text)
+    ticks = text.count("`")
+    if ticks:
+        last = text.rfind("`") if ticks % 2 else len(text)
+        text = text[:last].replace("`", "") + text[last:]
+    if "[" in text:
+        text = _DESCRIPTION_LINK_RE.sub("", _DESCRIPTION_IMAGE_RE.sub("", text))
+    end = step = 4 * limit
+    while True:
+        plain = " ".join(text[:end].translate(_DESCRIPTION_BLANKS).split())
+        if end >= len(text) or len(plain) > limit + 1:
+            break
+        step *= 2
+        end += step
+    if len(plain) <= limit:
+        return plain
+    return plain[: limit - 1].rstrip() + "…"
 
-      <main id="diary-main">
-        <article>
-          <div class="diary-meta">
-            <div class="diary-meta-bar"></div>
-            <div>
-              <div class="diary-date">{display_date}</div>
-              <div class="diary-seq">{seq}번째 기록</div>
-            </div>
-          </div>
-          <h2 class="diary-title">{title}</h2>
-          <div class="diary-content">{content}</div>
-          {quote_html}
-        </article>
-      </main>
 
-      <nav class="post-nav" aria-label="이전/다음 일기">
-        {prev_link}
-        {next_link}
-      </nav>
-    </div>
+def analyze_post(clean_content: str) -> tuple[str, str, str]:
+    # One pass over the lines: the "오늘의 한 줄" section (up to the next heading,
+    # headings inside fenced code excluded) becomes the quote and is left out of
+    # the body, so the rendered HTML never needs stripping afterwards.
+    body, quote = [], None
+    in_quote = collecting = False
+    fence = None
+    for line in clean_content.split("\n"):
+        heading = False
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+        elif line.startswith("#"):
+            heading = True
+        else:
+            match = _FENCE_RE.match(line.lstrip()) if len(line) - len(line.lstrip()) < 4 else None
+            if match:
+                fence = match.group(1)
+        if heading:
+            in_quote = _QUOTE_HEADING_RE.match(line) is not None
+            if in_quote:
+                collecting = quote is None
+                if collecting:
+                    quote = []
+                continue
+        if not in_quote:
+            body.append(line)
+        elif collecting:
+            quote.append(line)
+    quote_text = "\n".join(quote).strip() if quote else ""
+    return "\n".join(body).rstrip(), extract_description(clean_content), quote_text
 
-    <footer class="site-footer">🐜 개미의 하루</footer>
-  </div>
-</div>
-</body>
-</html>
-"""
 
+# Artifact kinds for build statistics, matched by path prefix in order.
+ARTIFACT_KINDS = [
+    ("diaries.js", "bundle"),
+    ("sitemap.xml", "sitemap"),
+    ("sitemaps/", "sitemap"),
+    ("assets/img/", "images"),
+    ("assets/", "assets"),
+    (ASSET_MANIFEST, "assets"),
+    (SERVICE_WORKER, "assets"),
+    ("archive/", "archive"),
+    ("archives.html", "archive"),
+    ("page/", "listing"),
+    ("tags/", "archive"),
+    ("series/", "archive"),
+    ("data/search/", "search"),
+    ("data/", "data"),
+    ("index.html", "home"),
+]
 
-def generate_post_pages(diaries):
-    for i, diary in enumerate(diaries):
-        year, month, day = diary["date"].split("-")
-        out_dir = os.path.join(BASE_DIR, year, month, day)
-        os.makedirs(out_dir, exist_ok=True)
 
-        prev_diary = diaries[i + 1] if i + 1 < len(diaries) else None
-        next_diary = diaries[i - 1] if i - 1 >= 0 else None
+def artifact_kind(rel_path: str) -> str:
+    if rel_path.endswith((".gz", ".br")):
+        return "compressed"
+    for prefix, kind in ARTIFACT_KINDS:
+        if rel_path.startswith(prefix):
+            return kind
+    if re.match(r"\d{4}/\d{2}/\d{2}/", rel_path):
+        return "posts"
+    return "other"
 
-        seq = len(diaries) - i
-        html = build_post_html(diary, prev_diary, next_diary, seq)
-        with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
-            f.write(html)
 
+_PRESERVE_RE = re.compile(r"<(pre|textarea|code|script)\b[^>]*>.*?</\1>", re.S | re.I)
+_LINE_EDGE_WS_RE = re.compile(r"[ \t]*\n\s*")
 
-def generate_archives_legacy_redirect():
-    html = """<!DOCTYPE html>
-<html lang=\"ko\">
-<head>
-  <meta charset=\"UTF-8\" />
-  <meta http-equiv=\"refresh\" content=\"0; url=archive/\" />
-  <title>Redirecting...</title>
-</head>
-<body>
-  <p><a href=\"archive/\">archive로 이동</a></p>
-</body>
-</html>
-"""
-    with open(os.path.join(BASE_DIR, "archives.html"), "w", encoding="utf-8") as f:
-        f.write(html)
 
+def _squeeze(text: str) -> str:
+    # Whitespace around a newline collapses to one space when rendered, so a bare
+    # newline is equivalent; this drops template indentation and blank lines.
+    return _LINE_EDGE_WS_RE.sub("\n", text)
 
-def generate_sitemap(diaries):
-    urls = [
-        f"{SITE_URL}/",
-        f"{SITE_URL}/archive/",
-    ]
-    for d in diaries:
-        urls.append(d["canonical"])
-        urls.append(f"{SITE_URL}/archive/{month_of(d['date'])}/")
-
-    # dedupe while preserving order
-    seen = set()
-    unique_urls = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            unique_urls.append(u)
-
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    body = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
-    for u in unique_urls:
-        body.append("  <url>")
-        body.append(f"    <loc>{escape(u)}</loc>")
-        body.append(f"    <lastmod>{now}</lastmod>")
-        body.append("  </url>")
-    body.append("</urlset>")
 
-    with open(os.path.join(BASE_DIR, "sitemap.xml"), "w", encoding="utf-8") as f:
-        f.write("\n".join(body) + "\n")
+def _squeeze_script(block: str) -> str:
+    lines = (line.strip() for line in block.split("\n"))
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
 
 
-def generate_robots():
-    content = f"""User-agent: *
-Allow: /
+def minify_html(html: str) -> str:
+    # <pre>/<textarea>/<code> are copied verbatim; scripts keep their line
+    # breaks (ASI) and are left alone entirely if they use template literals.
+    out = []
+    pos = 0
+    for m in _PRESERVE_RE.finditer(html):
+        out.append(_squeeze(html[pos:m.start()]))
+        block = m.group(0)
+        if m.group(1).lower() == "script" and "`" not in block:
+            block = _squeeze_script(block)
+            open_tag, _, rest = block.partition(">")
+            if "application/ld+json" in open_tag:
+                block = f"{open_tag}>{compact_json(json.loads(rest[: -len('</script>')]))}</script>"
+        out.append(block)
+        pos = m.end()
+    out.append(_squeeze(html[pos:]))
+    return "".join(out).strip() + "\n"
+
+
+def minify_output(rel_path: str, data: bytes) -> bytes:
+    if rel_path.endswith(".html"):
+        return minify_html(data.decode("utf-8")).encode("utf-8")
+    if rel_path.endswith(".xml"):
+        return (_squeeze(data.decode("utf-8")).strip() + "\n").encode("utf-8")
+    if rel_path.endswith(".json") and b"\n" in data:
+        return compact_json(json.loads(data)).encode("utf-8")
+    return data
+
+
+def compressed_siblings(rel_path: str, data: bytes) -> list[tuple[str, bytes]]:
+    if not rel_path.endswith(COMPRESSIBLE_SUFFIXES) or len(data) < COMPRESS_MIN_BYTES:
+        return []
+    # mtime=0 keeps the .gz bytes stable, so unchanged pages stay unchanged.
+    siblings = [(rel_path + ".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+    brotli = optional_module("brotli")
+    if brotli is not None:
+        siblings.append((rel_path + ".br", brotli.compress(data)))
+    return siblings
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class OutputWriter:
+    """Single write path for every generated file.
+
+    Files whose bytes are unchanged are left alone (mtime included), and
+    changed files go through a temp file plus ``os.replace`` so a reader never
+    sees half-written HTML. With ``staging`` the changed files are collected
+    under a staging directory and only moved into the site tree by
+    ``commit()``, so a build that fails midway leaves the live tree untouched.
+
+    With ``jobs > 1`` writes go through a bounded thread pool; ``flush()``
+    (called by ``commit()``) waits for them and tallies results in call order.
+
+    With ``optimize`` every file is minified before it is compared or written,
+    gets precompressed ``.gz``/``.br`` siblings, and is checked against
+    ``budgets`` (bytes per artifact kind); violations are collected in
+    ``over_budget`` for the caller to fail on.
+    """
+
+    def __init__(self, root: str | None = None, staging: str | None = None, jobs: int = 1,
+                 optimize: bool = False, budgets: dict | None = None):
+        self.root = root or BASE_DIR
+        self.staging = staging
+        self.optimize = optimize
+        self.budgets = budgets or {}
+        self.over_budget: list[tuple[str, int, int]] = []
+        self.changed: list[str] = []
+        self.removed: list[str] = []
+        self.written = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self.artifacts: dict = {}
+        if jobs > 1:
+            from concurrent.futures import ThreadPoolExecutor
+        self._pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        self._slots = threading.BoundedSemaphore(jobs * 4) if jobs > 1 else None
+        self._pending: list = []
+        self._stale_siblings: list[str] = []
+        if staging:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _replace(self, path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def unchanged(self, rel_path: str, data: bytes) -> bool:
+        path = os.path.join(self.root, rel_path)
+        try:
+            if os.path.getsize(path) != len(data):
+                return False
+            with open(path, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def _write_now(self, rel_path: str, data: bytes) -> bool:
+        if self.unchanged(rel_path, data):
+            return False
+        self._replace(os.path.join(self.staging or self.root, rel_path), data)
+        self._drop_stale_siblings(rel_path)
+        return True
+
+    def _drop_stale_siblings(self, rel_path: str):
+        # Precompressed siblings from an earlier --optimize build would now be stale.
+        # When staging they still match the live file until commit() replaces it.
+        if self.optimize or not rel_path.endswith(COMPRESSIBLE_SUFFIXES):
+            return
+        for suffix in (".gz", ".br"):
+            if self.staging:
+                self._stale_siblings.append(rel_path + suffix)
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.root, rel_path + suffix))
+
+    def _record(self, rel_path: str, size: int, changed: bool):
+        stats = self.artifacts.setdefault(artifact_kind(rel_path), {"written": 0, "skipped": 0, "bytes": 0})
+        stats["written" if changed else "skipped"] += 1
+        stats["bytes"] += size
+        if changed:
+            self.changed.append(rel_path)
+            self.written += 1
+            self.bytes_written += size
+        else:
+            self.skipped += 1
+
+    def write(self, rel_path: str, content: str | bytes):
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        if self.optimize:
+            data = minify_output(rel_path, data)
+            for sibling, packed in compressed_siblings(rel_path, data):
+                self._submit(sibling, packed)
+        limit = self.budgets.get(artifact_kind(rel_path))
+        if limit is not None and len(data) > limit:
+            self.over_budget.append((rel_path, len(data), limit))
+        self._submit(rel_path, data)
+
+    def write_stream(self, rel_path: str, chunks):
+        # For large files built piece by piece: chunks go straight to a temp file,
+        # which replaces the target only if its bytes differ.
+        def fill(f):
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+
+        target = os.path.join(self.staging or self.root, rel_path)
+        size = self._stream(rel_path, fill)
+        limit = self.budgets.get(artifact_kind(rel_path))
+        if limit is not None and size > limit:
+            self.over_budget.append((rel_path, size, limit))
+        if self.optimize:
+            self._stream_siblings(rel_path, target if os.path.exists(target) else os.path.join(self.root, rel_path))
+
+    def _stream(self, rel_path: str, fill) -> int:
+        target = os.path.join(self.staging or self.root, rel_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.tmp")
+        with open(tmp, "wb") as f:
+            fill(f)
+        size = os.path.getsize(tmp)
+        current = os.path.join(self.root, rel_path)
+        changed = not (os.path.exists(current) and filecmp.cmp(tmp, current, shallow=False))
+        if changed:
+            os.replace(tmp, target)
+            self._drop_stale_siblings(rel_path)
+        else:
+            os.remove(tmp)
+        self._record(rel_path, size, changed)
+        return size
+
+    def _stream_siblings(self, rel_path: str, source: str):
+        if not rel_path.endswith(COMPRESSIBLE_SUFFIXES) or os.path.getsize(source) < COMPRESS_MIN_BYTES:
+            return
+
+        def gzip_into(f):
+            with open(source, "rb") as src, gzip.GzipFile(filename="", mode="wb", fileobj=f,
+                                                          compresslevel=9, mtime=0) as gz:
+                shutil.copyfileobj(src, gz)
+
+        brotli = optional_module("brotli")
+
+        def brotli_into(f):
+            compressor = brotli.Compressor()
+            with open(source, "rb") as src:
+                for block in iter(lambda: src.read(1 << 16), b""):
+                    f.write(compressor.process(block))
+            f.write(compressor.finish())
+
+        self._stream(rel_path + ".gz", gzip_into)
+        if brotli is not None:
+            self._stream(rel_path + ".br", brotli_into)
+
+    def remove(self, rel_path: str):
+        # Deleted at commit() together with its precompressed siblings, so a
+        # failed build still leaves the live tree untouched.
+        self.removed.append(rel_path)
+
+    def check_budgets(self):
+        if self.over_budget:
+            lines = [f"{path}: {size:,} bytes > {limit:,}" for path, size, limit in self.over_budget]
+            raise BudgetExceeded("size budget exceeded:\n  " + "\n  ".join(lines))
+
+    def _submit(self, rel_path: str, data: bytes):
+        if self._pool is None:
+            self._record(rel_path, len(data), self._write_now(rel_path, data))
+            return
+
+        self._slots.acquire()
+        future = self._pool.submit(self._write_now, rel_path, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((rel_path, len(data), future))
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        for rel_path, size, future in pending:
+            self._record(rel_path, size, future.result())
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def commit(self):
+        self.flush()
+        self.close()
+        for rel_path in self.removed:
+            for suffix in ("", ".gz", ".br"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(os.path.join(self.root, rel_path + suffix))
+            with contextlib.suppress(OSError):
+                os.removedirs(os.path.dirname(os.path.join(self.root, rel_path)))
+        if not self.staging:
+            return
+        for rel_path in self.changed:
+            target = os.path.join(self.root, rel_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(os.path.join(self.staging, rel_path), target)
+        for rel_path in self._stale_siblings:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.root, rel_path))
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def discard(self):
+        self.close()
+        self._pending = []
+        self.removed = []
+        self._stale_siblings = []
+        if self.staging:
+            shutil.rmtree(self.staging, ignore_errors=True)
+        self.changed = []
+
+
+def renderer_name() -> str:
+    return active_backend()[1]
+
+
+def generator_signature(options: str = "") -> str:
+    # Any change to this script, the markdown renderer, the site address (in
+    # canonical/og URLs and every link) or output options invalidates every output.
+    with open(os.path.abspath(__file__), "rb") as f:
+        h = hashlib.sha256(f.read())
+    h.update(renderer_name().encode("utf-8"))
+    h.update(f"{SITE_URL}|{SITE_PATH}".encode("utf-8"))
+    h.update(options.encode("utf-8"))
+    return h.hexdigest()
+
+
+def w3c_datetime(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+_asset_urls: dict = {}
+
+
+def fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def asset_url(name: str) -> str:
+    # Site-relative URL of a hand-written asset; its fingerprinted copy once publish_assets ran.
+    return _asset_urls.get(name, name)
+
+
+def asset_deps() -> list:
+    # Pages embed asset URLs and image derivatives, so they depend on them.
+    return sorted(_asset_urls.items()) + image_deps()
+
+
+_FINGERPRINTED_RE = re.compile(r"(.+)\.[0-9a-f]{10}(\.[^.]+)")
+
+
+def publish_assets(writer: OutputWriter) -> dict:
+    urls = {}
+    for name in ASSET_SOURCES:
+        try:
+            with open(site_file(name), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        stem, ext = os.path.splitext(name)
+        urls[name] = f"assets/{stem}.{fingerprint(data)}{ext}"
+        writer.write(urls[name], data)
+    _asset_urls.clear()
+    _asset_urls.update(urls)
+
+    # Earlier generations go once nothing links to them: every page is
+    # rewritten with the new URLs, and the service worker drops its old shell
+    # cache (which still holds them) when the new worker activates.
+    with contextlib.suppress(FileNotFoundError):
+        for f in os.listdir(os.path.join(writer.root, "assets")):
+            m = _FINGERPRINTED_RE.fullmatch(f)
+            if m and "".join(m.groups()) in ASSET_SOURCES and f"assets/{f}" not in urls.values():
+                writer.remove(f"assets/{f}")
+    return urls
+
+
+def write_asset_manifest(writer: OutputWriter, generated: dict):
+    # Logical name -> URL to request. Hand-written assets are renamed; generated
+    # data keeps its name (external consumers) and gets a content ?v= instead.
+    manifest = dict(sorted({**_asset_urls, **{name: f"{name}?v={v}" for name, v in generated.items()}}.items()))
+    writer.write(ASSET_MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+
+
+# ── Service worker ─────────────────────────────────────────────────────────
+# sw.js precaches the fingerprinted assets (the shell) and caches pages, data
+# and web fonts as they are fetched. Its cache version is a hash of the
+# precache URLs, which carry content hashes themselves, so the worker (and
+# every cache it owns) turns over exactly when a shell file changes.
+SERVICE_WORKER_SCRIPT = """
+const SHELL = 'gaemilog-shell-' + VERSION;
+const PAGES = 'gaemilog-pages-' + VERSION;
+const DATA = 'gaemilog-data-' + VERSION;
+const FONTS = 'gaemilog-fonts';
+const DATA_LIMIT = 200;
+const POST_RE = /\\/\\d{4}\\/\\d{2}\\/\\d{2}\\/$/;
+
+self.addEventListener('install', function (event) {
+  event.waitUntil(caches.open(SHELL).then(function (cache) { return cache.addAll(PRECACHE); })
+    .then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (event) {
+  // 버전이 바뀐 캐시는 통째로 버림(예전 셸을 가리키는 페이지가 남지 않게)
+  const keep = [SHELL, PAGES, DATA, FONTS];
+  event.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.filter(function (name) {
+      return name.startsWith('gaemilog-') && keep.indexOf(name) < 0;
+    }).map(function (name) { return caches.delete(name); }));
+  }).then(function () { return self.clients.claim(); }));
+});
+
+function trim(cache, limit) {
+  // keys()는 넣은 순서: 오래된 것부터 지움
+  return cache.keys().then(function (keys) {
+    return Promise.all(keys.slice(0, Math.max(0, keys.length - limit)).map(function (key) {
+      return cache.delete(key);
+    }));
+  });
+}
+
+function store(event, cacheName, response) {
+  if (response.ok || response.type === 'opaque') {
+    const copy = response.clone();
+    event.waitUntil(caches.open(cacheName).then(function (cache) {
+      if (cacheName !== DATA) return cache.put(event.request, copy);
+      // 데이터 샤드는 ?v=버전으로 받으므로 같은 경로의 예전 버전을 지우고 넣음
+      return cache.delete(event.request, { ignoreSearch: true })
+        .then(function () { return cache.put(event.request, copy); })
+        .then(function () { return trim(cache, DATA_LIMIT); });
+    }));
+  }
+  return response;
+}
+
+function cacheFirst(event, cacheName) {
+  return caches.match(event.request).then(function (hit) {
+    return hit || fetch(event.request).then(function (res) { return store(event, cacheName, res); });
+  });
+}
+
+function staleWhileRevalidate(event, cacheName) {
+  return caches.open(cacheName).then(function (cache) {
+    return cache.match(event.request).then(function (hit) {
+      const fresh = fetch(event.request).then(function (res) { return store(event, cacheName, res); });
+      if (!hit) return fresh;
+      event.waitUntil(fresh.catch(function () {}));
+      return hit;
+    });
+  });
+}
+
+function networkFirst(event, cacheName) {
+  return fetch(event.request).then(function (res) { return store(event, cacheName, res); }).catch(function () {
+    return caches.match(event.request).then(function (hit) {
+      return hit || caches.match(ROOT).then(function (home) { return home || Response.error(); });
+    });
+  });
+}
+
+self.addEventListener('fetch', function (event) {
+  if (event.request.method !== 'GET') return;
+  const url = new URL(event.request.url);
+  if (url.origin === location.origin) {
+    if (!url.pathname.startsWith(ROOT)) return;
+    const path = url.pathname.slice(ROOT.length);
+    if (path.startsWith('assets/')) {
+      event.respondWith(cacheFirst(event, SHELL));
+    } else if (path.startsWith('data/') || path === 'diaries.js') {
+      event.respondWith(staleWhileRevalidate(event, DATA));
+    } else if (POST_RE.test(url.pathname)) {
+      // 글 페이지는 거의 안 바뀜: 캐시(이전/다음 글 prefetch 포함)로 바로 보여 주고 뒤에서 갱신
+      event.respondWith(staleWhileRevalidate(event, PAGES));
+    } else if (event.request.mode === 'navigate' || path === '' || path.endsWith('/') || path.endsWith('.html')) {
+      event.respondWith(networkFirst(event, PAGES));
+    }
+  } else if (url.hostname === 'fonts.gstatic.com') {
+    event.respondWith(cacheFirst(event, FONTS));
+  } else if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'cdn.jsdelivr.net') {
+    event.respondWith(staleWhileRevalidate(event, FONTS));
+  }
+});
+"""
+
+
+def service_worker_tag() -> str:
+    return (
+        "<script>if ('serviceWorker' in navigator) addEventListener('load', function () {"
+        f" navigator.serviceWorker.register('{SITE_PATH}/{SERVICE_WORKER}'); }});</script>"
+    )
+
+
+def prefetch_links(*diaries) -> str:
+    # Let the browser (and the service worker) fetch the neighbouring posts while the reader reads.
+    return "".join(f'\n  <link rel="prefetch" href="{d.permalink}">' for d in diaries if d is not None)
+
+
+def write_service_worker(writer: OutputWriter) -> str:
+    precache = sorted(f"{SITE_PATH}/{url}" for url in _asset_urls.values())
+    version = fingerprint(json.dumps([precache, SERVICE_WORKER_SCRIPT]).encode("utf-8"))
+    header = (
+        "// generate_blog.py가 만든 파일입니다. 직접 고치지 마세요.\n"
+        f"const VERSION = '{version}';\n"
+        f"const ROOT = '{SITE_PATH}/';\n"
+        f"const PRECACHE = {json.dumps(precache)};\n"
+    )
+    writer.write(SERVICE_WORKER, header + SERVICE_WORKER_SCRIPT)
+    return version
+
+
+# ── Responsive images ──────────────────────────────────────────────────────
+# Sources: profile.jpg plus everything under images/. Each gets resized copies
+# and WebP twins under assets/img/; without Pillow pages keep the plain <img>.
+IMAGE_DIR = "images"
+IMAGE_CACHE_DIR = os.path.join(".cache", "images")
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+# Widths produced for every image (never upscaled; the original width is always added).
+IMAGE_WIDTHS = (120, 480, 960, 1600)
+IMAGE_QUALITY = 82
+CONTENT_IMAGE_SIZES = "(max-width: 720px) 100vw, 720px"
+
+_images: dict = {}
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>")
+_IMG_SRC_RE = re.compile(r'\ssrc="([^"]*)"')
+_IMG_ATTR_RE = re.compile(r"""\s+([^\s"'>/=]+)(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?""")
+# Set by picture_html itself, so an author's own value would be a conflicting duplicate.
+_PICTURE_ATTRS = {"src", "srcset", "sizes", "width", "height"}
+
+
+def image_sources() -> list[str]:
+    names = ["profile.jpg"] if os.path.exists(site_file("profile.jpg")) else []
+    for dirpath, dirnames, filenames in os.walk(site_file(IMAGE_DIR)):
+        dirnames.sort()
+        for f in sorted(filenames):
+            if f.lower().endswith(IMAGE_SUFFIXES):
+                names.append(os.path.relpath(os.path.join(dirpath, f), BASE_DIR).replace(os.sep, "/"))
+    return names
+
+
+def image_key(data: bytes) -> str:
+    # Encoder settings are part of the key, so changing them re-encodes everything once.
+    h = hashlib.sha256(data)
+    h.update(f"{optional_module('PIL').__version__}|{IMAGE_WIDTHS}|{IMAGE_QUALITY}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def encode_image(source: str, key: str, cache_dir: str) -> dict:
+    # Runs in the image pool. Writes every derivative into the cache, then the
+    # metadata file last, so a killed build never leaves a half-cached image.
+    Image, ImageOps = optional_module("PIL.Image"), optional_module("PIL.ImageOps")
+    with Image.open(source) as opened:
+        im = ImageOps.exif_transpose(opened)
+        fmt = "png" if source.lower().endswith(".png") else "jpg"
+        if fmt == "jpg" and im.mode != "RGB":
+            im = im.convert("RGB")
+        width, height = im.size
+        widths = sorted({w for w in IMAGE_WIDTHS if w < width} | {width})
+        for w in widths:
+            resized = im if w == width else im.resize((w, round(height * w / width)), Image.LANCZOS)
+            if fmt == "jpg":
+                resized.save(os.path.join(cache_dir, f"{key}-{w}.jpg"), "JPEG",
+                             quality=IMAGE_QUALITY, optimize=True, progressive=True)
+            else:
+                resized.save(os.path.join(cache_dir, f"{key}-{w}.png"), "PNG", optimize=True)
+            resized.save(os.path.join(cache_dir, f"{key}-{w}.webp"), "WEBP", quality=IMAGE_QUALITY, method=6)
+    meta = {"width": width, "height": height, "format": fmt, "widths": widths}
+    tmp = os.path.join(cache_dir, f"{key}.json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(cache_dir, f"{key}.json"))
+    return meta
+
+
+def _cached_image(cache_dir: str, key: str) -> dict | None:
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def publish_images(writer: OutputWriter, jobs: int = 1, manifest: BuildManifest | None = None) -> tuple[int, int]:
+    # Encodes only images whose key is not cached yet; returns (encoded, cached).
+    # With a manifest, an image whose size and mtime are unchanged is not re-read
+    # and its derivatives are not copied again while the outputs are fresh.
+    _images.clear()
+    if optional_module("PIL.Image") is None:
+        return 0, 0
+    cache_dir = site_file(IMAGE_CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    found, todo, records = {}, [], {}
+    for name in image_sources():
+        record = manifest.image_record(name, site_file(name)) if manifest is not None else {}
+        if "key" in record:
+            key, meta = record["key"], record["meta"]
+        else:
+            with open(site_file(name), "rb") as f:
+                key = image_key(f.read())
+            meta = _cached_image(cache_dir, key)
+        records[name] = record
+        found[name] = (key, meta)
+        if meta is None:
+            todo.append((name, key))
+
+    if todo:
+        sources = [site_file(name) for name, _ in todo]
+        keys = [key for _, key in todo]
+        if jobs > 1 and len(todo) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+                encoded = list(pool.map(encode_image, sources, keys, [cache_dir] * len(todo)))
+        else:
+            encoded = [encode_image(s, k, cache_dir) for s, k in zip(sources, keys)]
+        for (name, key), meta in zip(todo, encoded):
+            found[name] = (key, meta)
+
+    for name, (key, meta) in found.items():
+        records[name].update(key=key, meta=meta)
+        stem = os.path.splitext(os.path.basename(name))[0]
+        variants = {}
+        for ext in (meta["format"], "webp"):
+            variants[ext] = []
+            for w in meta["widths"]:
+                url = f"assets/img/{stem}.{key[:10]}-{w}.{ext}"
+                variants[ext].append((url, w))
+                if manifest is not None and manifest.is_fresh(url, [key, w]):
+                    continue
+                cached = os.path.join(cache_dir, f"{key}-{w}.{ext}")
+                if not os.path.exists(cached):
+                    # The manifest outlived the image cache: encode this one again.
+                    encode_image(site_file(name), key, cache_dir)
+                with open(cached, "rb") as f:
+                    writer.write(url, f.read())
+        _images[name] = {"key": key, "width": meta["width"], "height": meta["height"],
+                         "format": meta["format"], "variants": variants}
+
+    if manifest is not None and manifest.images_unchanged():
+        return len(todo), len(found) - len(todo)
+    # Derivatives of edited or deleted images.
+    current = {url for image in _images.values() for urls in image["variants"].values() for url, _ in urls}
+    for dirpath, _, names in os.walk(os.path.join(writer.root, "assets", "img")):
+        for f in names:
+            rel_path = os.path.relpath(os.path.join(dirpath, f), writer.root).replace(os.sep, "/")
+            if not f.endswith((".gz", ".br")) and rel_path not in current:
+                writer.remove(rel_path)
+    keep = {key for key, _ in found.values()}
+    for f in os.listdir(cache_dir):
+        if f.split("-", 1)[0].split(".", 1)[0] not in keep:
+            os.remove(os.path.join(cache_dir, f))
+    return len(todo), len(found) - len(todo)
+
+
+def image_name(src: str) -> str | None:
+    # Source-relative name of a local image URL, if it is one we have derivatives for.
+    if "://" in src or src.startswith("//"):
+        return None
+    path = src.split("?", 1)[0].split("#", 1)[0]
+    if SITE_PATH and path.startswith(SITE_PATH + "/"):
+        path = path[len(SITE_PATH):]
+    name = path.lstrip("/")
+    return name if name in _images else None
+
+
+def picture_html(name: str, prefix: str, img_attrs: str, sizes: str) -> str:
+    # <picture> with a WebP source and a same-format srcset on the <img>; width and
+    # height keep the layout from shifting while the image loads.
+    info = _images[name]
+
+    def srcset(ext):
+        return ", ".join(f"{prefix}{url} {w}w" for url, w in info["variants"][ext])
+
+    fallback = info["variants"][info["format"]][-1][0]
+    return (
+        f'<picture><source type="image/webp" srcset="{srcset("webp")}" sizes="{sizes}">'
+        f'<img src="{prefix}{fallback}" srcset="{srcset(info["format"])}" sizes="{sizes}"'
+        f' width="{info["width"]}" height="{info["height"]}"{img_attrs}></picture>'
+    )
+
+
+def profile_img(prefix: str, attrs: str = "") -> str:
+    if "profile.jpg" not in _images:
+        return f'<img src="{prefix}{asset_url("profile.jpg")}" alt="개미 프로필"{attrs}>'
+    return picture_html("profile.jpg", prefix, f' alt="개미 프로필"{attrs}', "60px")
+
+
+def responsive_images(html: str) -> str:
+    # Swap <img> tags that point at a processed image for a <picture>.
+    if not _images or "<img" not in html:
+        return html
+
+    def swap(match):
+        tag = match.group(0)
+        src = _IMG_SRC_RE.search(tag)
+        name = image_name(unescape(src.group(1))) if src else None
+        if name is None:
+            return tag
+        kept = [m for m in _IMG_ATTR_RE.finditer(tag[4:-1].rstrip("/ ")) if m.group(1).lower() not in _PICTURE_ATTRS]
+        attrs = "".join(m.group(0) for m in kept)
+        names = {m.group(1).lower() for m in kept}
+        attrs += "".join(f' {k}="{v}"' for k, v in (("loading", "lazy"), ("decoding", "async")) if k not in names)
+        return picture_html(name, f"{SITE_PATH}/", attrs, CONTENT_IMAGE_SIZES)
+
+    return _IMG_TAG_RE.sub(swap, html)
+
+
+def image_deps() -> list:
+    return sorted((name, info["key"]) for name, info in _images.items())
+
+
+def load_post_shard(date_str: str) -> dict | None:
+    # A post shard holds the fully rendered entry; reuse it as the render cache.
+    try:
+        with open(site_file(DATA_DIR, "posts", f"{date_str}.json"), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and entry.get("date") == date_str else None
+
+
+class MetadataIndex:
+    """Packed per-source metadata: title, description, quote, tags, series.
+
+    One JSON file with a field list and one row per diary, keyed by file name
+    and guarded by the source hash. Entries whose hash still matches are built
+    from their row alone, so metadata-only work (listings, archives, tags,
+    sitemaps) never opens a markdown file or a post shard. Rows are replaced
+    only for sources that changed and dropped for sources that are gone.
+    """
+
+    FIELDS = ("sha256", "title", "description", "quote", "tags", "series")
+
+    def __init__(self, path: str = METADATA_INDEX_PATH):
+        self.path = site_file(path)
+        self.rows: dict = {}
+        self._saved = None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("version") == METADATA_INDEX_VERSION and data.get("fields") == list(self.FIELDS):
+            self.rows = data.get("rows", {})
+            self._saved = self.rows
+
+    def get(self, name: str, sha: str) -> dict | None:
+        row = self.rows.get(name)
+        if row is None or row[0] != sha:
+            return None
+        return dict(zip(self.FIELDS, row))
+
+    def update(self, diaries, sources: dict):
+        # Rebuilt from the resident entries of this build; only changed sources were parsed.
+        rows = {}
+        for d in diaries:
+            name = f"{d.date}.md"
+            if name in sources:
+                rows[name] = [sources[name]["sha256"], d.title, d.description, d.quote, d.tags, d.series]
+        self.rows = dict(sorted(rows.items()))
+
+    def save(self):
+        if self.rows == self._saved:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"version": METADATA_INDEX_VERSION, "fields": list(self.FIELDS), "rows": self.rows}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(compact_json(data))
+        os.replace(tmp, self.path)
+        self._saved = self.rows
+
+
+class BuildManifest:
+    """Persistent record of source hashes and output dependencies.
+
+    An output is rebuilt only when the hash of the inputs it was built from
+    changes, or when the generator itself (script or renderer) changes.
+
+    A ``live`` manifest (the one ``serve`` keeps) also holds every output's
+    inputs in memory, so the next build compares them directly instead of
+    hashing them, and trusts the watcher about which sources changed.
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH, signature: str | None = None, full: bool = False,
+                 index_path: str = METADATA_INDEX_PATH, related_path: str = RELATED_INDEX_PATH,
+                 search_path: str = SEARCH_INDEX_PATH, live: bool = False):
+        self._paths = path, index_path, related_path, search_path
+        self.live = live
+        self.path = site_file(path)
+        self.signature = signature or generator_signature()
+        self.index = MetadataIndex(index_path)
+        # Only an explicit --full redoes the related pass; it is keyed by source content.
+        self.related = RelatedIndex(related_path, full)
+        self.search = SearchIndex(search_path, full)
+        self.sources: dict = {}
+        self.outputs: dict = {}
+        self._old_sources: dict = {}
+        self._old_outputs: dict = {}
+        # Image sources: size, mtime, encoding key and encoder metadata; see image_record().
+        self.image_records: dict = {}
+        self._old_image_records: dict = {}
+        # Entries seen by this process, so a long-lived `serve` skips re-reading shards.
+        self.entries: dict = {}
+        # Per-source content hash and lastmod; kept across --full and generator
+        # changes so sitemap dates only move when a diary's content does.
+        self._history: dict = {}
+        # Every output the last build produced, also kept across --full and
+        # generator changes, so outputs of deleted diaries can be found.
+        self._previous_outputs: set = set()
+        # live only: rel_path -> (digest, deps) for this build and the last one,
+        # and the source paths the watcher reported (None: stat every source).
+        self.deps: dict = {}
+        self._old_deps: dict = {}
+        self._changed: set | None = None
+        # live only: the dates and asset deps of this build and the last one; see touched().
+        self._shape = None
+        self._old_shape = None
+        self._touched: set | None = None
+        self.rebuilt = 0
+        self.skipped = 0
+        self.reused = 0
+        # Images encoded and reused, and warnings about sources, for the caller to show.
+        self.images = (0, 0)
+        self.warnings: list = []
+        # Set once this build's record is on disk; see advance().
+        self.saved = False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self._history = {
+            name: record for name, record in data.get("sources", {}).items() if record.get("lastmod")
+        }
+        self._previous_outputs = set(data.get("outputs", {}))
+        if full or data.get("version") != MANIFEST_VERSION or data.get("generator") != self.signature:
+            return
+        self._old_sources = data.get("sources", {})
+        self._old_outputs = data.get("outputs", {})
+        self._old_image_records = data.get("images", {})
+
+    def source_hash(self, name: str, path: str) -> str:
+        old = self._old_sources.get(name)
+        if old and self._changed is not None and path not in self._changed:
+            self.sources[name] = old
+            return old["sha256"]
+        st = os.stat(path)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+            sha = old["sha256"]
+        else:
+            with open(path, "rb") as f:
+                sha = hashlib.sha256(f.read()).hexdigest()
+        seen = self._history.get(name)
+        if seen is None:
+            lastmod = name[: -len(".md")]  # first sighting: the publish date, stable across fresh clones
+        elif seen["sha256"] == sha:
+            lastmod = seen["lastmod"]
+        else:
+            lastmod = w3c_datetime(st.st_mtime)
+        self.sources[name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha, "lastmod": lastmod}
+        return sha
+
+    def image_record(self, name: str, path: str) -> dict:
+        # Like source_hash for an image: the last build's record while the file's
+        # size and mtime are unchanged, else a fresh one for the caller to fill
+        # with "key" and "meta".
+        st = os.stat(path)
+        old = self._old_image_records.get(name)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+            record = old
+        else:
+            record = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        self.image_records[name] = record
+        return record
+
+    def images_unchanged(self) -> bool:
+        # The same image sources as the last build, none of them edited.
+        return self.image_records == self._old_image_records
+
+    def cached_entry(self, name: str, sha: str, cache: RenderCache | None = None) -> Diary | None:
+        old = self._old_sources.get(name)
+        if old is None or old["sha256"] != sha:
+            return None
+        date_str = name[: -len(".md")]
+        entry = self.entries.get(date_str)
+        if entry is None:
+            row = self.index.get(name, sha)
+            entry = Diary.from_index(date_str, row, cache) if row is not None else None
+        if entry is not None:
+            self.reused += 1
+        return entry
+
+    def remember(self, diary: Diary):
+        self.entries[diary.date] = diary
+
+    def source_sha(self, date_str: str) -> str:
+        record = self.sources.get(f"{date_str}.md")
+        return record["sha256"] if record else ""
+
+    def source_lastmod(self, date_str: str) -> str:
+        record = self.sources.get(f"{date_str}.md")
+        return record["lastmod"] if record else ""
+
+    def is_fresh(self, rel_path: str, deps) -> bool:
+        old = self._old_deps.get(rel_path)
+        if old is not None and old[1] == deps:
+            # Same inputs as the last build in this process, which wrote or kept the file.
+            digest = old[0]
+        else:
+            digest = hashlib.sha256(
+                json.dumps(deps, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        self.outputs[rel_path] = digest
+        if self.live:
+            self.deps[rel_path] = (digest, deps)
+        fresh = self._old_outputs.get(rel_path) == digest and (
+            old is not None and old[0] == digest or os.path.exists(os.path.join(BASE_DIR, rel_path))
+        )
+        if fresh:
+            self.skipped += 1
+        else:
+            self.rebuilt += 1
+        return fresh
+
+    def touched(self, diaries) -> set | None:
+        # Dates whose source changed since the last build in this process, if
+        # that build had the same diaries and assets, so outputs of other dates
+        # can keep() their record; None means every output must be checked.
+        if self._shape is None:
+            self._shape = [d.date for d in diaries], asset_deps()
+            if self.live and self._shape == self._old_shape:
+                self._touched = {name[: -len(".md")] for name, record in self.sources.items()
+                                 if record["sha256"] != self._old_sources.get(name, {}).get("sha256")}
+        return self._touched
+
+    def keep(self, rel_path: str) -> bool:
+        # Carry an output of the last build in this process over as it is.
+        old = self._old_deps.get(rel_path)
+        if old is None or self._old_outputs.get(rel_path) != old[0]:
+            return False
+        self.outputs[rel_path] = old[0]
+        self.deps[rel_path] = old
+        self.skipped += 1
+        return True
+
+    def stale_outputs(self) -> list[str]:
+        # Outputs the last build produced and this one did not: the post page,
+        # shards, archive month and sitemap of a diary or month that is gone.
+        return sorted(p for p in self._previous_outputs - self.outputs.keys() if not p.endswith("/"))
+
+    def save(self):
+        data = {
+            "version": MANIFEST_VERSION,
+            "generator": self.signature,
+            "sources": self.sources,
+            "outputs": self.outputs,
+            "images": self.image_records,
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.index.update(self.entries.values(), self.sources)
+        self.index.save()
+        self.related.save()
+        self.search.save()
+        self.saved = True
+
+    def advance(self, changed: set | None = None):
+        # Start the next build in the same process from what this one recorded;
+        # changed (absolute source paths) spares stat()ing every other diary.
+        # A build that failed left half its sources, outputs and index updates
+        # here, so the next one starts from what the last good build saved.
+        if not self.saved:
+            path, index_path, related_path, search_path = self._paths
+            self.__init__(path, self.signature, False, index_path, related_path, search_path, self.live)
+            return
+        self.saved = False
+        self._old_deps, self.deps = self.deps, {}
+        self._old_shape, self._shape, self._touched = self._shape, None, None
+        self._changed = set(changed) if changed is not None and self.live else None
+        self._old_sources, self.sources = self.sources, {}
+        self._old_image_records, self.image_records = self.image_records, {}
+        self._history = dict(self._old_sources)
+        self._old_outputs, self.outputs = self.outputs, {}
+        self._previous_outputs = set(self._old_outputs)
+        self.rebuilt = 0
+        self.skipped = 0
+        self.reused = 0
+        self.images = (0, 0)
+        self.warnings = []
+
+
+class RenderCache:
+    """On-disk cache of rendered entries keyed by content and renderer.
+
+    The key is a hash of the cleaned markdown, the renderer identity and
+    RENDER_CACHE_VERSION, so it survives edits to the templates in this script
+    and can be restored between CI runs. Entries are evicted least recently
+    used first once the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, path: str = RENDER_CACHE_DIR, max_bytes: int = RENDER_CACHE_MAX_BYTES, enabled: bool = True):
+        self.path = site_file(path)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.identity = f"{renderer_name()}|v{RENDER_CACHE_VERSION}"
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def key(self, clean_content: str) -> str:
+        h = hashlib.sha256(self.identity.encode("utf-8"))
+        h.update(b"\0")
+        h.update(clean_content.encode("utf-8"))
+        return h.hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+    def peek(self, key: str) -> dict | None:
+        # A lookup that neither counts as a hit nor refreshes the LRU clock.
+        if not self.enabled:
+            return None
+        try:
+            with open(self._file(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, key: str) -> dict | None:
+        if not self.enabled:
+            return None
+        path = self._file(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # mtime doubles as the LRU clock
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict):
+        if not self.enabled:
+            return
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+        self.stored += 1
+
+    def prune(self):
+        if not self.enabled or not os.path.isdir(self.path):
+            return
+        files = []
+        total = 0
+        for dirpath, _, names in os.walk(self.path):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                st = os.stat(path)
+                files.append((st.st_mtime_ns, st.st_size, path))
+                total += st.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def render_entry(clean_content: str) -> tuple[str, str, str]:
+    body, description, quote = analyze_post(clean_content)
+    return markdown_to_html(body), description, quote
+
+
+def render_entries(contents: list[str], pool=None, jobs: int = 1):
+    # pool.map keeps input order, so the parallel build is byte-identical to the serial one.
+    if pool is None or len(contents) < 2:
+        return [render_entry(c) for c in contents]
+    return list(pool.map(render_entry, contents, chunksize=max(1, len(contents) // (jobs * 4))))
+
+
+def _front_matter_scalar(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+_FRONT_MATTER_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*[ \t]*:(?:[ \t]|$)")
+
+
+def split_front_matter(content: str) -> tuple[dict, str]:
+    # The YAML subset diaries need: `key: value`, `key: [a, b]` and `- item`
+    # block lists. Deliberately not PyYAML, so every machine reads the same
+    # metadata (no dates turning into objects, no `yes` turning into True).
+    # A `---` block with any other line is a horizontal rule, not metadata.
+    if not content.startswith("---"):
+        return {}, content
+    lines = content.split("\n")
+    if lines[0].strip() != "---":
+        return {}, content
+    end = next((i for i in range(1, len(lines)) if lines[i].strip() in ("---", "...")), None)
+    if end is None:
+        return {}, content
+
+    meta, key = {}, None
+    for line in lines[1:end]:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if key is not None and (stripped == "-" or stripped.startswith("- ")):
+            if not isinstance(meta.get(key), list):
+                meta[key] = []
+            meta[key].append(_front_matter_scalar(stripped[1:]))
+            continue
+        if not _FRONT_MATTER_KEY_RE.match(line):
+            return {}, content
+        name, _, value = line.partition(":")
+        key = name.strip().lower()
+        value = value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            meta[key] = [_front_matter_scalar(v) for v in value[1:-1].split(",") if v.strip()]
+        else:
+            meta[key] = _front_matter_scalar(value) if value else []
+    return meta, "\n".join(lines[end + 1:])
+
+
+def _front_matter_list(value) -> list[str]:
+    items = value if isinstance(value, list) else str(value).split(",")
+    out = []
+    for item in (str(v).strip() for v in items):
+        if item and item not in out:
+            out.append(item)
+    return out
+
+
+def parse_source(content: str, fallback_title: str) -> tuple[dict, str]:
+    # Front matter wins; without it (or without a title in it) the first `# `
+    # heading is the title, as before. Returns (metadata, markdown body).
+    front, body = split_front_matter(content)
+    meta = {
+        "tags": _front_matter_list(front.get("tags", [])),
+        "series": front["series"].strip() if isinstance(front.get("series"), str) else "",
+        "date": front["date"].strip() if isinstance(front.get("date"), str) else "",
+    }
+    if isinstance(front.get("title"), str) and front["title"].strip():
+        meta["title"] = front["title"].strip()
+        return meta, body.strip()
+    title_match = re.search(r"^#\s+(.*)", body, re.MULTILINE)
+    meta["title"] = title_match.group(1).strip() if title_match else fallback_title
+    return meta, re.sub(r"^#\s+.*", "", body, count=1, flags=re.MULTILINE).strip()
+
+
+def read_source(date_str: str) -> str:
+    name = f"{date_str}.md"
+    with open(os.path.join(DIARY_DIR, name), "r", encoding="utf-8") as file:
+        return parse_source(file.read(), name)[1]
+
+
+class Diary:
+    """One diary entry: small metadata stays resident, bodies load on demand.
+
+    ``raw`` (the markdown without front matter and title line) is re-read from
+    the source file; ``content`` (rendered HTML, minus the quote section) comes
+    from the render cache, then the post shard, then a fresh render.
+    ``release()`` drops both once a stage is done with the entry, so a build
+    holds only the posts it is writing. Without a render cache or shard to
+    reload from, the HTML is kept.
+    """
+
+    __slots__ = ("date", "title", "description", "quote", "tags", "series",
+                 "_raw", "_content", "_cache", "_reloadable")
+
+    def __init__(self, date: str, title: str, raw: str | None = None, cache: RenderCache | None = None):
+        self.date = date
+        self.title = title
+        self.description = ""
+        self.quote = ""
+        self.tags: list[str] = []
+        self.series = ""
+        self._raw = raw
+        self._content = None
+        self._cache = cache
+        self._reloadable = cache is not None and cache.enabled
+
+    @classmethod
+    def from_index(cls, date: str, row: dict, cache: RenderCache | None = None) -> Diary:
+        diary = cls(date, row["title"], cache=cache)
+        diary.description = row["description"]
+        diary.quote = row["quote"]
+        diary.tags = row["tags"]
+        diary.series = row["series"]
+        diary._reloadable = True
+        return diary
+
+    @property
+    def permalink(self) -> str:
+        return f"{SITE_PATH}/{self.date.replace('-', '/')}/"
+
+    @property
+    def canonical(self) -> str:
+        return f"{SITE_URL}/{self.date.replace('-', '/')}/"
+
+    @property
+    def raw(self) -> str:
+        if self._raw is None:
+            self._raw = read_source(self.date)
+        return self._raw
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = self._load_content()
+        return self._content
+
+    def _load_content(self) -> str:
+        raw = self.raw
+        if self._cache is not None:
+            hit = self._cache.peek(self._cache.key(raw))
+            if hit is not None:
+                return hit["content"]
+        shard = load_post_shard(self.date)
+        if shard is not None and shard.get("raw") == raw:
+            return shard["content"]
+        return render_entry(raw)[0]
+
+    def rendered(self, content: str, description: str, quote: str):
+        self._content = content
+        self.description = description
+        self.quote = quote
+
+    def release(self):
+        self._raw = None
+        if self._reloadable:
+            self._content = None
+
+    def to_dict(self) -> dict:
+        # Field order is the post shard format.
+        return {
+            "date": self.date,
+            "title": self.title,
+            "content": self.content,
+            "raw": self.raw,
+            "permalink": self.permalink,
+            "canonical": self.canonical,
+            "description": self.description,
+            "quote": self.quote,
+            "tags": self.tags,
+            "series": self.series,
+        }
+
+
+def post_windows(diaries):
+    # (newer, entry, older) for each entry, newest first, without indexing.
+    entries = iter(diaries)
+    newer = None
+    current = next(entries, None)
+    while current is not None:
+        older = next(entries, None)
+        yield newer, current, older
+        newer, current = current, older
+
+
+def get_diary_list(manifest: BuildManifest | None = None, jobs: int = 1, cache: RenderCache | None = None):
+    files = [f for f in os.listdir(DIARY_DIR) if f.endswith(".md")]
+    diaries = []
+    pending = []
+    pool = None
+
+    def render_pending():
+        nonlocal pool
+        if pool is None and jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(max_workers=jobs, initializer=use_renderer, initargs=(active_backend()[0],))
+        rendered = render_entries([d.raw for d in pending], pool, jobs)
+        for diary, (html_content, description, quote) in zip(pending, rendered):
+            diary.rendered(html_content, description, quote)
+            if cache is not None:
+                cache.put(cache.key(diary.raw), {"content": html_content, "description": description, "quote": quote})
+            diary.release()
+        pending.clear()
+
+    try:
+        for f in sorted(files, reverse=True):
+            path = os.path.join(DIARY_DIR, f)
+            if manifest is not None:
+                cached = manifest.cached_entry(f, manifest.source_hash(f, path), cache)
+                if cached is not None:
+                    manifest.remember(cached)
+                    diaries.append(cached)
+                    continue
+
+            with open(path, "r", encoding="utf-8") as file:
+                meta, clean_content = parse_source(file.read(), f)
+
+            diary = Diary(f[: -len(".md")], meta["title"], raw=clean_content, cache=cache)
+            diary.tags = meta["tags"]
+            diary.series = meta["series"]
+            if meta["date"] and meta["date"] != diary.date and manifest is not None:
+                manifest.warnings.append(f"{f}: front matter date {meta['date']} ignored; the file name sets the date")
+            diaries.append(diary)
+            if manifest is not None:
+                manifest.remember(diary)
+
+            hit = cache.get(cache.key(clean_content)) if cache is not None else None
+            if hit is not None:
+                diary.rendered(hit["content"], hit["description"], hit["quote"])
+                diary.release()
+            else:
+                pending.append(diary)
+                if len(pending) >= RENDER_BATCH * max(1, jobs):
+                    render_pending()
+        render_pending()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return diaries
+
+
+def month_of(date_str: str) -> str:
+    return date_str[:7]
+
+
+def month_label(month: str) -> str:
+    y, m = month.split("-")
+    return f"{y}년 {int(m)}월"
+
+
+ARCHIVE_PICKER_SCRIPT = """
+        (function () {
+            var btn = document.getElementById('month-picker-btn');
+            var menu = document.getElementById('month-picker-menu');
+            if (!btn || !menu) return;
+
+            // data-months: "YYYY:mask,..." where bit i of the hex mask = month i+1 has entries
+            var months = new Set();
+            (menu.dataset.months || '').split(',').forEach(function (part) {
+                var year = part.slice(0, 4);
+                var bits = parseInt(part.slice(5), 16) || 0;
+                for (var i = 0; i < 12; i++) {
+                    if (bits & (1 << i)) months.add(year + '-' + String(i + 1).padStart(2, '0'));
+                }
+            });
+            var current = menu.dataset.current;
+            var pickerYear = Number(current.slice(0, 4));
+
+            function render() {
+                var cells = '';
+                for (var i = 0; i < 12; i++) {
+                    var key = pickerYear + '-' + String(i + 1).padStart(2, '0');
+                    cells += '<button type="button" class="month-menu-item' + (key === current ? ' active' : '') +
+                        '" data-month="' + key + '"' + (months.has(key) ? '' : ' disabled') + '>' + (i + 1) + '월</button>';
+                }
+                menu.innerHTML =
+                    '<div class="month-picker-head">' +
+                    '<button type="button" class="month-year-nav" data-year-nav="-1" aria-label="이전 연도">&larr;</button>' +
+                    '<strong>' + pickerYear + '년</strong>' +
+                    '<button type="button" class="month-year-nav" data-year-nav="1" aria-label="다음 연도">&rarr;</button>' +
+                    '</div>' +
+                    '<div class="month-picker-grid">' + cells + '</div>' +
+                    '<p class="month-picker-note">회색 달은 아직 일기 없음</p>';
+            }
+
+            btn.addEventListener('click', function (e) {
+                e.stopPropagation();
+                var isOpen = !menu.hidden;
+                menu.hidden = isOpen;
+                btn.setAttribute('aria-expanded', isOpen ? 'false' : 'true');
+                if (!isOpen) render();
+            });
+
+            menu.addEventListener('click', function (e) {
+                e.stopPropagation();
+                var yearNav = e.target.closest('.month-year-nav');
+                if (yearNav) {
+                    pickerYear += Number(yearNav.getAttribute('data-year-nav') || '0');
+                    render();
+                    return;
+                }
+                var item = e.target.closest('.month-menu-item');
+                if (!item || item.disabled) return;
+                window.location.href = menu.dataset.root + 'archive/' + item.getAttribute('data-month') + '/';
+            });
+
+            document.addEventListener('click', function (e) {
+                if (!menu.hidden && !e.target.closest('.month-picker-wrap')) {
+                    menu.hidden = true;
+                    btn.setAttribute('aria-expanded', 'false');
+                }
+            });
+        })();
+"""
+
+
+def month_picker_data(months) -> str:
+    # Which months have entries, as one 12-bit hex mask per year: "2026:7e,2025:c00".
+    masks: dict[str, int] = {}
+    for month in months:
+        year, mm = month.split("-")
+        masks[year] = masks.get(year, 0) | 1 << (int(mm) - 1)
+    return ",".join(f"{year}:{mask:x}" for year, mask in masks.items())
+
+
+def relative_href(rel_prefix: str, permalink: str) -> str:
+    return rel_prefix + permalink[1:] if permalink.startswith("/") else permalink
+
+
+def build_calendar_html(month: str, entries, rel_prefix: str) -> str:
+    year, mm = (int(part) for part in month.split("-"))
+    first_weekday, days = calendar.monthrange(year, mm)
+    by_date = {d.date: d for d in entries}
+    cells = ['<span class="calendar-day empty"></span>'] * ((first_weekday + 1) % 7)  # Sunday first
+    for day in range(1, days + 1):
+        diary = by_date.get(f"{month}-{day:02d}")
+        if diary is None:
+            cells.append(f'<span class="calendar-day no-entry"><span>{day}</span></span>')
+        else:
+            cells.append(
+                f'<a class="calendar-day has-entry" href="{relative_href(rel_prefix, diary.permalink)}" '
+                f'title="{diary.date} · {escape(diary.title)}"><span>{day}</span><em class="dot"></em></a>'
+            )
+    return "".join(cells)
+
+
+def build_archive_html(rel_prefix: str, month: str | None = None, entries=(), prev_month: str | None = None,
+                       next_month: str | None = None, picker: str = ""):
+    # The month view is rendered here in full; the only script drives the month picker popup.
+    if month is None:
+        heading = "작성된 일기가 없습니다"
+        body = '<ul id="archives-list" class="archives-list"><li>작성된 일기가 없습니다.</li></ul>'
+    else:
+        heading = f"{month_label(month)} 기록 ({len(entries)}개)"
+        items = "".join(
+            f'<li><a href="{relative_href(rel_prefix, d.permalink)}">'
+            f'<span class="date">{d.date}</span> - {escape(d.title)}</a></li>'
+            for d in entries
+        )
+        prev_link = (
+            f'<a id="prev-month-link" class="month-link" href="{rel_prefix}archive/{prev_month}/">&larr; 이전 달</a>'
+            if prev_month
+            else '<a id="prev-month-link" class="month-link" style="visibility:hidden;">&larr; 이전 달</a>'
+        )
+        next_link = (
+            f'<a id="next-month-link" class="month-link" href="{rel_prefix}archive/{next_month}/">다음 달 &rarr;</a>'
+            if next_month
+            else '<a id="next-month-link" class="month-link" style="visibility:hidden;">다음 달 &rarr;</a>'
+        )
+        body = f"""<div class="calendar-toolbar" id="calendar-toolbar">
+            {prev_link}
+            <div class="month-picker-wrap">
+                <button id="month-picker-btn" class="month-picker-btn" type="button" aria-haspopup="listbox" aria-expanded="false">{month_label(month)} ▾</button>
+                <div id="month-picker-menu" class="month-picker-menu" role="listbox" aria-label="월 선택" hidden
+                     data-root="{rel_prefix}" data-current="{month}" data-months="{picker}"></div>
+            </div>
+            {next_link}
+        </div>
+
+        <section class="calendar-card" id="calendar-card">
+            <div class="calendar-weekdays">
+                <span>일</span><span>월</span><span>화</span><span>수</span><span>목</span><span>금</span><span>토</span>
+            </div>
+            <div class="calendar-grid" id="calendar-grid">{build_calendar_html(month, entries, rel_prefix)}</div>
+            <p class="calendar-help">노란 점 있는 날짜 = 일기 있음 (클릭 이동)</p>
+        </section>
+
+        <ul id="archives-list" class="archives-list">{items}</ul>"""
+
+    return f"""<!DOCTYPE html>
+<html lang=\"ko\">
+<head>
+    <meta charset=\"UTF-8\">
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
+    <title>🐜 일기 목록 | 개미의 일기</title>
+    <link rel=\"stylesheet\" href=\"{rel_prefix}{asset_url('style.css')}\">
+    <script src=\"{rel_prefix}{asset_url('search.js')}\" defer></script>
+</head>
+<body>
+    <header>
+        <a href=\"{rel_prefix}index.html\" class=\"back-link\">&larr; 홈으로</a>
+        <h1>📅 일기 목록</h1>
+        <p id=\"month-title\">{heading}</p>
+    </header>
+
+    <main>
+        <form id=\"search-form\" class=\"search-form\" role=\"search\" data-root=\"{rel_prefix}\">
+            <input id=\"search-input\" type=\"search\" placeholder=\"일기 검색\" aria-label=\"일기 검색\" autocomplete=\"off\">
+        </form>
+        <p id=\"search-summary\" class=\"search-summary\" hidden></p>
+        <ul id=\"search-results\" class=\"archives-list search-results\" hidden></ul>
+
+        {body}
+    </main>
+
+    <footer>
+        <p>&copy; 2026 Gaemi (🐜). Powered by OpenClaw.</p>
+        <p>Contact: <a href="mailto:i.am@gaemi.kim">i.am@gaemi.kim</a></p>
+    </footer>
+
+    <script>{ARCHIVE_PICKER_SCRIPT}    </script>
+    {service_worker_tag()}
+</body>
+</html>
+"""
+
+
+def entry_ref(diary: Diary | None):
+    # The parts of a neighbouring entry that end up in another page.
+    if diary is None:
+        return None
+    return [diary.date, diary.title, diary.permalink]
+
+
+def generate_archive_pages(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None):
+    writer = writer or OutputWriter()
+    by_month: dict[str, list] = {}
+    for d in diaries:
+        by_month.setdefault(month_of(d.date), []).append(d)
+    months = sorted(by_month, reverse=True)
+    picker = month_picker_data(months)
+
+    def write_page(rel_path: str, rel_prefix: str, i: int | None):
+        # Each page depends on its entries, its neighbouring months and the picker's month list.
+        month = months[i] if i is not None else None
+        entries = by_month[month] if month else []
+        prev_month = months[i + 1] if i is not None and i + 1 < len(months) else None
+        next_month = months[i - 1] if i else None
+        if manifest is not None:
+            deps = [[entry_ref(d) for d in entries], prev_month, next_month, picker, asset_deps()]
+            if manifest.is_fresh(rel_path, deps):
+                return
+        writer.write(rel_path, build_archive_html(rel_prefix, month, entries, prev_month, next_month, picker))
+
+    write_page("archive/index.html", "../", 0 if months else None)  # the latest month
+    for i, month in enumerate(months):
+        write_page(f"archive/{month}/index.html", "../../", i)
+
+
+DAY_EN = ['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT']
+
+
+def fmt_display_date(date_str: str) -> str:
+    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    return f"{dt.year}.{dt.month:02d}.{dt.day:02d} {DAY_EN[(dt.weekday() + 1) % 7]}"
+
+
+def nav_card(diary: Diary | None, direction: str) -> str:
+    if diary is None:
+        return '<span class="nav-card-empty"></span>'
+
+    is_prev = direction == "prev"
+    dir_label = "← 이전" if is_prev else "다음 →"
+    extra_class = "prev" if is_prev else "next"
+    return (
+        f'<a href="{diary.permalink}" class="nav-card {extra_class}">'
+        f'<div class="nav-card-dir">{dir_label}</div>'
+        f'<div class="nav-card-date">{fmt_display_date(diary.date)}</div>'
+        f'<div class="nav-card-title">{escape(diary.title)}</div>'
+        '</a>'
+    )
+
+
+def quote_box(quote: str) -> str:
+    if not quote:
+        return ''
+    return (
+        '<div class="daily-quote">'
+        '<span class="daily-quote-label">오늘의 한 줄</span>'
+        f'<p class="daily-quote-text">{escape(quote)}</p>'
+        '</div>'
+    )
+
+
+def build_article_html(diary: Diary, seq: int, link_title: bool = False) -> str:
+    title = escape(diary.title)
+    if link_title:
+        title = f'<a href="{diary.permalink}">{title}</a>'
+    display_date = fmt_display_date(diary.date)
+    content = responsive_images(diary.content)
+    quote_html = quote_box(diary.quote)
+    return f"""<article>
+          <div class="diary-meta">
+            <div class="diary-meta-bar"></div>
+            <div>
+              <div class="diary-date">{display_date}</div>
+              <div class="diary-seq">{seq}번째 기록</div>
+            </div>
+          </div>
+          <h2 class="diary-title">{title}</h2>
+          {taxonomy_links(diary)}<div class="diary-content">{content}</div>
+          {quote_html}
+        </article>"""
+
+
+def related_html(related) -> str:
+    if not related:
+        return ""
+    items = "".join(
+        f'<li><a href="{d.permalink}"><span class="date">{d.date}</span> {escape(d.title)}</a></li>' for d in related
+    )
+    return (f'\n        <section class="related-posts" aria-label="비슷한 일기">'
+            f'<h3 class="related-title">비슷한 일기</h3><ul class="related-list">{items}</ul></section>')
+
+
+def build_post_html(diary: Diary, prev_diary: Diary | None, next_diary: Diary | None, seq: int,
+                    related=()) -> str:
+    title = escape(diary.title)
+    description = escape(diary.description)
+    canonical = diary.canonical
+    date = diary.date
+    article = build_article_html(diary, seq)
+    prev_link = nav_card(prev_diary, "prev")
+    next_link = nav_card(next_diary, "next")
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>{title} | 🐜 개미의 일기</title>
+  <meta name="description" content="{description}">
+  <link rel="canonical" href="{canonical}">{prefetch_links(prev_diary, next_diary)}
+
+  <meta property="og:type" content="article">
+  <meta property="og:site_name" content="개미의 일기">
+  <meta property="og:title" content="{title}">
+  <meta property="og:description" content="{description}">
+  <meta property="og:url" content="{canonical}">
+  <meta property="og:image" content="{SITE_URL}/{asset_url('profile.jpg')}">
+
+  <meta name="twitter:card" content="summary_large_image">
+  <meta name="twitter:title" content="{title}">
+  <meta name="twitter:description" content="{description}">
+  <meta name="twitter:image" content="{SITE_URL}/{asset_url('profile.jpg')}">
+
+  <script type="application/ld+json">
+  {{
+    "@context": "https://schema.org",
+    "@type": "BlogPosting",
+    "headline": {json.dumps(diary.title, ensure_ascii=False)},
+    "datePublished": "{date}",
+    "dateModified": "{date}",
+    "author": {{
+      "@type": "Person",
+      "name": "개미"
+    }},
+    "mainEntityOfPage": {{
+      "@type": "WebPage",
+      "@id": "{canonical}"
+    }},
+    "description": {json.dumps(diary.description, ensure_ascii=False)}
+  }}
+  </script>
+
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:ital,wght@0,400;0,500;1,400&display=swap" rel="stylesheet">
+  <link href="https://cdn.jsdelivr.net/npm/pretendard@latest/dist/web/variable/pretendardvariable.min.css" rel="stylesheet">
+  <link rel="stylesheet" href="{SITE_PATH}/{asset_url('style.css')}">
+</head>
+<body>
+<div class="page-wrap">
+  <div class="container">
+    <div class="card">
+      <header class="site-header">
+        <div class="site-profile-wrap">
+          <a href="{SITE_PATH}/" aria-label="개미의 일기 홈">
+            {profile_img(SITE_PATH + "/")}
+          </a>
+        </div>
+        <h1 class="site-title"><a href="{SITE_PATH}/">개미의 일기</a></h1>
+        <p class="site-subtitle">형님의 AI 꼬붕, 개미의 고군분투 삽질 일지</p>
+        <div class="site-dots">· · ·</div>
+        <a href="{SITE_PATH}/page/" class="site-archive-link">목록 →</a>
+        <a href="{SITE_PATH}/archive/" class="site-archive-link">아카이브 →</a>
+      </header>
+
+      <main id="diary-main">
+        {article}{related_html(related)}
+      </main>
+
+      <nav class="post-nav" aria-label="이전/다음 일기">
+        {prev_link}
+        {next_link}
+      </nav>
+    </div>
+
+    <footer class="site-footer">🐜 개미의 하루</footer>
+  </div>
+</div>
+{service_worker_tag()}
+</body>
+</html>
+"""
+
+
+SITE_TITLE = "개미의 일기"
+SITE_DESCRIPTION = "형님의 AI 꼬붕, 개미의 고군분투 삽질 일지"
+
+
+def build_index_html(latest: Diary | None, prev_diary: Diary | None, count: int) -> str:
+    if latest is None:
+        article = '<p style="color:var(--text-meta);text-align:center;padding:40px 0;">아직 기록이 없어요.</p>'
+        prev_link = next_link = ""
+    else:
+        article = build_article_html(latest, count, link_title=True)
+        prev_link = nav_card(prev_diary, "prev")
+        next_link = nav_card(None, "next")
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+
+  <!-- Primary SEO -->
+  <title>🐜 {SITE_TITLE}</title>
+  <meta name="description" content="{SITE_DESCRIPTION}">
+  <link rel="canonical" href="{SITE_URL}/">{prefetch_links(prev_diary)}
+
+  <!-- OG -->
+  <meta property="og:type"        content="website">
+  <meta property="og:site_name"   content="{SITE_TITLE}">
+  <meta property="og:title"       content="🐜 {SITE_TITLE}">
+  <meta property="og:description" content="{SITE_DESCRIPTION}">
+  <meta property="og:url"         content="{SITE_URL}/">
+
+  <!-- Twitter Card -->
+  <meta name="twitter:card"        content="summary">
+  <meta name="twitter:title"       content="🐜 {SITE_TITLE}">
+  <meta name="twitter:description" content="{SITE_DESCRIPTION}">
+
+  <!-- JSON-LD -->
+  <script type="application/ld+json">
+  {{
+    "@context": "https://schema.org",
+    "@type": "Blog",
+    "name": "{SITE_TITLE}",
+    "description": "{SITE_DESCRIPTION}",
+    "url": "{SITE_URL}/",
+    "author": {{
+      "@type": "Person",
+      "name": "개미"
+    }}
+  }}
+  </script>
+
+  <!-- Fonts -->
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:ital,wght@0,400;0,500;1,400&display=swap" rel="stylesheet">
+  <link href="https://cdn.jsdelivr.net/npm/pretendard@latest/dist/web/variable/pretendardvariable.min.css" rel="stylesheet">
+
+  <!-- Styles -->
+  <link rel="stylesheet" href="{asset_url('style.css')}">
+</head>
+<body>
+<div class="page-wrap">
+  <div class="container">
+    <div class="card">
+
+      <!-- ── Site header ─────────────────────────────────────── -->
+      <header class="site-header">
+        <div class="site-profile-wrap" id="profile-wrap">
+          {profile_img("", ' id="profile-img"')}
+        </div>
+        <h1 class="site-title">{SITE_TITLE}</h1>
+        <p class="site-subtitle">{SITE_DESCRIPTION}</p>
+        <div class="site-dots">· · ·</div>
+        <a href="{SITE_PATH}/page/" class="site-archive-link">목록 →</a>
+        <a href="{SITE_PATH}/archive/" class="site-archive-link">아카이브 →</a>
+      </header>
+
+      <!-- ── Latest diary (pre-rendered by generate_blog.py) ── -->
+      <main id="diary-main">
+        {article}
+      </main>
+
+      <nav class="post-nav" id="diary-nav" aria-label="이전/다음 일기">
+        {prev_link}
+        {next_link}
+      </nav>
+
+    </div><!-- .card -->
+
+    <footer class="site-footer">🐜 개미의 하루</footer>
+  </div><!-- .container -->
+</div><!-- .page-wrap -->
+
+<script>
+// 프로필 이미지 폴백 (선택적 보강: JS 없이도 본문은 그대로 보임)
+document.getElementById('profile-img').onerror = function() {{
+  this.remove();
+  document.getElementById('profile-wrap').textContent = '🐜';
+}};
+</script>
+{service_worker_tag()}
+</body>
+</html>
+"""
+
+
+def generate_index_page(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None):
+    writer = writer or OutputWriter()
+    latest = diaries[0] if diaries else None
+    prev_diary = diaries[1] if len(diaries) > 1 else None
+
+    if manifest is not None:
+        deps = [manifest.source_sha(latest.date) if latest else None, entry_ref(prev_diary), len(diaries), asset_deps()]
+        if manifest.is_fresh("index.html", deps):
+            return
+
+    writer.write("index.html", build_index_html(latest, prev_diary, len(diaries)))
+
+
+def generate_post_pages(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None,
+                        related: dict | None = None):
+    writer = writer or OutputWriter()
+    total = len(diaries)
+    by_date = {d.date: d for d in diaries} if related else {}
+    touched = manifest.touched(diaries) if manifest is not None else None
+    previous = manifest.related.previous if manifest is not None else {}
+    assets = asset_deps()
+    for i, (next_diary, diary, prev_diary) in enumerate(post_windows(diaries)):
+        year, month, day = diary.date.split("-")
+        rel_path = f"{year}/{month}/{day}/index.html"
+        seq = total - i
+        dates = related.get(diary.date, []) if related else []
+        # Unless it, a neighbour or a related diary changed, or its related list
+        # moved, the page is as the last build in this process left it.
+        if (touched is not None and diary.date not in touched and touched.isdisjoint(dates)
+                and (prev_diary is None or prev_diary.date not in touched)
+                and (next_diary is None or next_diary.date not in touched)
+                and previous.get(diary.date, []) == dates and manifest.keep(rel_path)):
+            continue
+        similar = [by_date[date] for date in dates]
+
+        if manifest is not None:
+            deps = [manifest.source_sha(diary.date), entry_ref(prev_diary), entry_ref(next_diary), seq,
+                    [entry_ref(d) for d in similar], assets]
+            if manifest.is_fresh(rel_path, deps):
+                continue
+
+        html = build_post_html(diary, prev_diary, next_diary, seq, similar)
+        writer.write(f"{year}/{month}/{day}/index.html", html)
+        diary.release()
+
+
+def listing_ref(diary: Diary) -> list:
+    return [diary.date, diary.title, diary.description, diary.quote, diary.tags, diary.series]
+
+
+@functools.lru_cache(maxsize=4096)
+def taxonomy_slug(name: str) -> str:
+    # Hangul stays readable in the URL; only characters that would break a path go.
+    slug = re.sub(r"[\s/\\?#%&\"'<>]+", "-", unicodedata.normalize("NFC", name).strip().lower())
+    return slug.strip("-.") or "-"
+
+
+def taxonomy_href(kind: str, name: str) -> str:
+    return f"{SITE_PATH}/{kind}/{url_quote(taxonomy_slug(name))}/"
+
+
+def taxonomy_links(diary: Diary) -> str:
+    if not diary.tags and not diary.series:
+        return ""
+    links = []
+    if diary.series:
+        links.append(f'<a href="{taxonomy_href("series", diary.series)}" class="diary-series">'
+                     f'{escape(diary.series)}</a>')
+    links.extend(f'<a href="{taxonomy_href("tags", tag)}" class="diary-tag">#{escape(tag)}</a>' for tag in diary.tags)
+    return f'<div class="diary-tags">{"".join(links)}</div>'
+
+
+def listing_item_html(diary: Diary, seq: int) -> str:
+    return f"""<article class="listing-item">
+          <div class="diary-meta">
+            <div class="diary-meta-bar"></div>
+            <div>
+              <div class="diary-date">{fmt_display_date(diary.date)}</div>
+              <div class="diary-seq">{seq}번째 기록</div>
+            </div>
+          </div>
+          <h2 class="diary-title"><a href="{diary.permalink}">{escape(diary.title)}</a></h2>
+          {taxonomy_links(diary)}<p class="listing-description">{escape(diary.description)}</p>
+          {quote_box(diary.quote)}
+        </article>"""
+
+
+def page_nav_card(page: int | None, direction: str) -> str:
+    if page is None:
+        return '<span class="nav-card-empty"></span>'
+    is_prev = direction == "prev"
+    return (
+        f'<a href="{SITE_PATH}/page/{page}/" class="nav-card {"prev" if is_prev else "next"}">'
+        f'<div class="nav-card-dir">{"← 이전 페이지" if is_prev else "다음 페이지 →"}</div>'
+        f'<div class="nav-card-title">{page}페이지</div>'
+        '</a>'
+    )
+
+
+def build_listing_shell(page_title: str, canonical: str, body: str, nav: str, nav_label: str) -> str:
+    # Shared frame of /page/N/, /tags/ and /series/ pages: site header, a list, a nav row.
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>{page_title} | 🐜 {SITE_TITLE}</title>
+  <meta name="description" content="{SITE_DESCRIPTION}">
+  <link rel="canonical" href="{canonical}">
+
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:ital,wght@0,400;0,500;1,400&display=swap" rel="stylesheet">
+  <link href="https://cdn.jsdelivr.net/npm/pretendard@latest/dist/web/variable/pretendardvariable.min.css" rel="stylesheet">
+  <link rel="stylesheet" href="{SITE_PATH}/{asset_url('style.css')}">
+</head>
+<body>
+<div class="page-wrap">
+  <div class="container">
+    <div class="card">
+      <header class="site-header">
+        <div class="site-profile-wrap">
+          <a href="{SITE_PATH}/" aria-label="개미의 일기 홈">
+            {profile_img(SITE_PATH + "/")}
+          </a>
+        </div>
+        <h1 class="site-title"><a href="{SITE_PATH}/">{SITE_TITLE}</a></h1>
+        <p class="site-subtitle">{SITE_DESCRIPTION}</p>
+        <div class="site-dots">· · ·</div>
+        <a href="{SITE_PATH}/page/" class="site-archive-link">목록 →</a>
+        <a href="{SITE_PATH}/archive/" class="site-archive-link">아카이브 →</a>
+      </header>
+
+      <main id="diary-main" class="listing">
+        {body}
+      </main>
+
+      <nav class="post-nav" aria-label="{nav_label}">
+        {nav}
+      </nav>
+    </div>
+
+    <footer class="site-footer">🐜 개미의 하루</footer>
+  </div>
+</div>
+{service_worker_tag()}
+</body>
+</html>
+"""
+
+
+def build_listing_html(page: int, entries, first_seq: int, has_newer: bool) -> str:
+    # entries are newest first; first_seq is the sequence number of the oldest one.
+    last_seq = first_seq + len(entries) - 1
+    listing = "\n        ".join(listing_item_html(d, last_seq - i) for i, d in enumerate(entries))
+    older = page_nav_card(page - 1 if page > 1 else None, "prev")
+    newer = page_nav_card(page + 1 if has_newer else None, "next")
+    return build_listing_shell(f"일기 목록 {page}페이지", f"{SITE_URL}/page/{page}/", listing,
+                               f"{older}\n        {newer}", "이전/다음 페이지")
+
+
+def generate_listing_pages(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None,
+                           per_page: int = POSTS_PER_PAGE):
+    # Pages are filled from the oldest entry, so page N always holds entries
+    # (N-1)*per_page+1 .. N*per_page. A new diary rewrites only the newest page
+    # (and the one before it when it opens a new page); /page/ mirrors the newest.
+    writer = writer or OutputWriter()
+    total = len(diaries)
+    pages = max(1, -(-total // per_page))
+    assets = asset_deps()
+    for page in range(1, pages + 1):
+        start = total - min(page * per_page, total)
+        entries = diaries[start: total - (page - 1) * per_page]
+        has_newer = page < pages
+        deps = [page, [listing_ref(d) for d in entries], per_page, has_newer, assets]
+        targets = [f"page/{page}/index.html"] + (["page/index.html"] if page == pages else [])
+        html = None
+        for rel_path in targets:
+            if manifest is not None and manifest.is_fresh(rel_path, deps):
+                continue
+            html = html or build_listing_html(page, entries, (page - 1) * per_page + 1, has_newer)
+            writer.write(rel_path, html)
+
+    # A smaller --per-page (or deleted diaries) leaves pages past the new last one.
+    with contextlib.suppress(FileNotFoundError):
+        for name in os.listdir(os.path.join(writer.root, "page")):
+            if name.isdigit() and int(name) > pages:
+                writer.remove(f"page/{name}/index.html")
+
+
+# (directory, label, entries newest first?) — series read in order, oldest first.
+TAXONOMIES = [("tags", "태그", True), ("series", "시리즈", False)]
+
+
+def build_taxonomy_index_html(kind: str, label: str, groups: list) -> str:
+    items = "".join(
+        f'<li><a href="{SITE_PATH}/{kind}/{url_quote(slug)}/">{"#" if kind == "tags" else ""}{escape(name)}</a>'
+        f' <span class="taxonomy-count">{count}</span></li>'
+        for slug, name, count in groups
+    )
+    body = f'<h2 class="listing-heading">{label} ({len(groups)}개)</h2>\n        <ul class="taxonomy-list">{items}</ul>'
+    return build_listing_shell(label, f"{SITE_URL}/{kind}/", body, "", f"{label} 목록")
+
+
+def build_taxonomy_html(kind: str, label: str, name: str, entries) -> str:
+    # One compact line per entry, like a month archive: a tag may span years.
+    title = f"#{name}" if kind == "tags" else name
+    items = "".join(
+        f'<li><a href="{d.permalink}"><span class="date">{d.date}</span> - {escape(d.title)}</a></li>'
+        for d in entries
+    )
+    body = (f'<h2 class="listing-heading">{escape(title)} · {len(entries)}편</h2>\n'
+            f'        <ul class="archives-list">{items}</ul>')
+    back = f'<a href="{SITE_PATH}/{kind}/" class="nav-card prev"><div class="nav-card-dir">← {label} 목록</div></a>'
+    return build_listing_shell(f"{escape(title)} {label}", f"{SITE_URL}/{kind}/{url_quote(taxonomy_slug(name))}/",
+                               body, back, f"{label} 목록")
+
+
+def generate_taxonomy_pages(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None):
+    # /tags/, /tags/<tag>/, /series/, /series/<name>/ from resident metadata only.
+    # A page is rewritten when its own entries change; pages of tags or series
+    # nobody uses any more are removed.
+    writer = writer or OutputWriter()
+    assets = asset_deps()
+    for kind, label, newest_first in TAXONOMIES:
+        groups: dict[str, tuple[str, list]] = {}
+        for d in diaries:
+            for name in (d.tags if kind == "tags" else [d.series] if d.series else []):
+                groups.setdefault(taxonomy_slug(name), (name, []))[1].append(d)
+
+        if groups:
+            ranked = sorted(((slug, name, len(entries)) for slug, (name, entries) in groups.items()),
+                            key=lambda g: (-g[2], g[0]))
+            if manifest is None or not manifest.is_fresh(f"{kind}/index.html", [ranked, assets]):
+                writer.write(f"{kind}/index.html", build_taxonomy_index_html(kind, label, ranked))
+        for slug, (name, entries) in groups.items():
+            ordered = entries if newest_first else entries[::-1]
+            rel_path = f"{kind}/{slug}/index.html"
+            deps = [name, [entry_ref(d) for d in ordered], assets]
+            if manifest is not None and manifest.is_fresh(rel_path, deps):
+                continue
+            writer.write(rel_path, build_taxonomy_html(kind, label, name, ordered))
+
+        with contextlib.suppress(FileNotFoundError):
+            for slug in os.listdir(os.path.join(writer.root, kind)):
+                if slug not in groups and os.path.isdir(os.path.join(writer.root, kind, slug)):
+                    writer.remove(f"{kind}/{slug}/index.html")
+            if not groups:
+                writer.remove(f"{kind}/index.html")
+
+
+def generate_archives_legacy_redirect(writer: OutputWriter | None = None):
+    writer = writer or OutputWriter()
+    html = """<!DOCTYPE html>
+<html lang=\"ko\">
+<head>
+  <meta charset=\"UTF-8\" />
+  <meta http-equiv=\"refresh\" content=\"0; url=archive/\" />
+  <title>Redirecting...</title>
+</head>
+<body>
+  <p><a href=\"archive/\">archive로 이동</a></p>
+</body>
+</html>
+"""
+    writer.write("archives.html", html)
+
+
+def entry_lastmod(diary: Diary, manifest: BuildManifest | None) -> str:
+    lastmod = manifest.source_lastmod(diary.date) if manifest is not None else ""
+    return lastmod or diary.date
+
+
+def sitemap_urlset(urls) -> str:
+    body = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for loc, lastmod in urls:
+        body.append("  <url>")
+        body.append(f"    <loc>{escape(loc)}</loc>")
+        body.append(f"    <lastmod>{lastmod}</lastmod>")
+        body.append("  </url>")
+    body.append("</urlset>")
+    return "\n".join(body) + "\n"
+
+
+def generate_sitemap(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None):
+    # sitemap.xml is an index of per-month child sitemaps (each far below the
+    # 50k URL limit). lastmod follows source content, so an unchanged month
+    # keeps its bytes and is skipped.
+    writer = writer or OutputWriter()
+    months: dict = {}
+    for d in diaries:
+        months.setdefault(month_of(d.date), []).append((d.canonical, entry_lastmod(d, manifest)))
+
+    children = []
+    for month, entries in months.items():
+        newest = max(lastmod for _, lastmod in entries)
+        urls = entries + [(f"{SITE_URL}/archive/{month}/", newest)]
+        rel_path = f"sitemaps/{month}.xml"
+        children.append((rel_path, newest))
+        if manifest is not None and manifest.is_fresh(rel_path, urls):
+            continue
+        writer.write(rel_path, sitemap_urlset(urls))
+
+    site_lastmod = max((lastmod for _, lastmod in children), default="")
+    site_urls = [(f"{SITE_URL}/", site_lastmod), (f"{SITE_URL}/archive/", site_lastmod)]
+    if manifest is None or not manifest.is_fresh("sitemaps/site.xml", site_urls):
+        writer.write("sitemaps/site.xml", sitemap_urlset(site_urls))
+    children.insert(0, ("sitemaps/site.xml", site_lastmod))
+
+    body = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for rel_path, lastmod in children:
+        body.append("  <sitemap>")
+        body.append(f"    <loc>{escape(SITE_URL)}/{rel_path}</loc>")
+        body.append(f"    <lastmod>{lastmod}</lastmod>")
+        body.append("  </sitemap>")
+    body.append("</sitemapindex>")
+    writer.write("sitemap.xml", "\n".join(body) + "\n")
+
+
+def generate_robots(writer: OutputWriter | None = None):
+    writer = writer or OutputWriter()
+    content = f"""User-agent: *
+Allow: /
+
+Sitemap: {SITE_URL}/sitemap.xml
+"""
+    writer.write("robots.txt", content)
+
+
+def compact_json(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def index_ref(diary: Diary) -> dict:
+    return {"date": diary.date, "title": diary.title, "permalink": diary.permalink}
+
+
+def bundle_chunks(diaries):
+    yield "const DIARY_DATA = ["
+    for i, d in enumerate(diaries):
+        yield ("," if i else "") + compact_json(index_ref(d))
+    yield "];"
+
+
+def write_bundle(diaries, writer: OutputWriter | None = None, manifest: BuildManifest | None = None) -> str:
+    # diaries.js keeps DIARY_DATA for external consumers, but only as a compact index.
+    # Rendered bodies live in data/posts/YYYY-MM-DD.json. Streamed, so the
+    # bundle never exists as one string. Returns its content fingerprint, or
+    # with a manifest a fingerprint of what it is built from, so an unchanged
+    # bundle is neither rebuilt nor re-read.
+    writer = writer or OutputWriter()
+    if manifest is not None:
+        fresh = manifest.is_fresh("diaries.js", [[d.date, d.title] for d in diaries])
+        version = fingerprint(f"{manifest.signature}|{manifest.outputs['diaries.js']}".encode("utf-8"))
+        if not fresh:
+            writer.write_stream("diaries.js", bundle_chunks(diaries))
+        return version
+    h = hashlib.sha256()
+
+    def hashed(chunks):
+        for chunk in chunks:
+            h.update(chunk.encode("utf-8"))
+            yield chunk
+
+    writer.write_stream("diaries.js", hashed(bundle_chunks(diaries)))
+    return h.hexdigest()[:10]
+
+
+def generate_data_shards(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None,
+                         search_version: str | None = None) -> str:
+    # data/index.json is the one unversioned entry point: it carries a content
+    # version for every month shard and for the search shards, which clients
+    # append as ?v= so those can be cached as immutable. With a manifest, a
+    # month's version is the hash of the refs it is written from. Returns the
+    # index's fingerprint.
+    writer = writer or OutputWriter()
+    by_month: dict[str, list] = {}
+    for d in diaries:
+        by_month.setdefault(month_of(d.date), []).append(index_ref(d))
+
+    months = []
+    for month, refs in by_month.items():
+        rel_path = f"data/months/{month}.json"
+        if manifest is None:
+            version = fingerprint(compact_json(refs).encode("utf-8"))
+        elif manifest.is_fresh(rel_path, refs):
+            months.append({"month": month, "count": len(refs), "v": manifest.outputs[rel_path][:10]})
+            continue
+        else:
+            version = manifest.outputs[rel_path][:10]
+        writer.write(rel_path, compact_json(refs))
+        months.append({"month": month, "count": len(refs), "v": version})
+
+    if search_version is None:
+        search_version = fingerprint(compact_json(search_deps(diaries, manifest)).encode("utf-8"))
+    index = {
+        "count": len(diaries),
+        "latest": diaries[0].date if diaries else None,
+        "months": months,
+        "search_shards": search_shard_count(len(diaries)),
+        "search_version": search_version,
+    }
+    index_json = compact_json(index)
+    writer.write("data/index.json", index_json)
+
+    touched = manifest.touched(diaries) if manifest is not None else None
+    for d in diaries:
+        rel_path = f"data/posts/{d.date}.json"
+        if touched is not None and d.date not in touched and manifest.keep(rel_path):
+            continue
+        if manifest is not None and manifest.is_fresh(rel_path, manifest.source_sha(d.date)):
+            continue
+        writer.write(rel_path, compact_json(d.to_dict()))
+        d.release()
+    return fingerprint(index_json.encode("utf-8"))
+
+
+# ── Search index ───────────────────────────────────────────────────────────
+# Hangul/CJK runs are indexed as overlapping character bigrams (a one-letter
+# run as itself), ASCII words as whole lowercase words. Tokens are grouped
+# into shards by their first character, so a query only
+# fetches the shards of its own tokens, and a one-syllable query finds every
+# bigram it starts in the same shard. Postings are flat [id, tf, id, tf, ...]
+# lists with delta-encoded YYYYMMDD ids; titles come from the month shards.
+_SEARCH_RUN_RE = re.compile(r"[0-9a-z]+|[\u3131-\u318e\uac00-\ud7a3\u4e00-\u9fff]+")
+
+
+def search_tokens(text: str) -> list[str]:
+    tokens = []
+    for run in _SEARCH_RUN_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if run[0].isascii() or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def search_shard_count(doc_count: int) -> int:
+    # Doubles with the corpus so shard files stay roughly the same size.
+    count = SEARCH_MIN_SHARDS
+    while count * SEARCH_DOCS_PER_SHARD < doc_count:
+        count *= 2
+    return count
+
+
+def search_shard_of(token: str, shard_count: int) -> int:
+    return ord(token[0]) % shard_count
+
+
+def search_deps(diaries, manifest: BuildManifest | None) -> list:
+    # Everything the search shards are built from (the generator signature covers
+    # the tokenizer); doubles as their version in data/index.json.
+    if manifest is None:
+        deps = []
+        for d in diaries:
+            deps.append([d.date, d.title, hashlib.sha256(d.raw.encode("utf-8")).hexdigest()])
+            d.release()
+        return [generator_signature(), deps]
+    return [manifest.signature, [[d.date, d.title, manifest.source_sha(d.date)] for d in diaries]]
+
+
+def doc_token_counts(diary: Diary) -> Counter:
+    # Term frequencies of one diary as the search index sees them (title weighted).
+    counts = Counter(search_tokens(diary.raw))
+    diary.release()
+    for token in search_tokens(diary.title):
+        counts[token] += SEARCH_TITLE_WEIGHT
+    return counts
+
+
+def doc_id(date_str: str) -> int:
+    return int(date_str.replace("-", ""))
+
+
+def decode_postings(flat: list[int]) -> dict[int, int]:
+    postings, doc = {}, 0
+    for i in range(0, len(flat), 2):
+        doc += flat[i]
+        postings[doc] = flat[i + 1]
+    return postings
+
+
+def encode_postings(postings: dict[int, int]) -> list[int]:
+    flat, last = [], 0
+    for doc in sorted(postings):
+        flat.extend((doc - last, postings[doc]))
+        last = doc
+    return flat
+
+
+class SearchIndex:
+    """Token counts per diary and the state of ``data/search/``, kept between builds.
+
+    Counts are cached under ``.cache/search/`` by source hash, so only new or
+    edited diaries are tokenised. A state file records which source hash of
+    every diary the shards on disk hold; a build diffs the old and new counts
+    of the diaries that changed, patches the postings of just the tokens whose
+    counts moved, and rewrites only the shards holding those tokens. A new
+    shard count, ``--full``, or a missing shard or cached count rebuilds every
+    shard from the cached counts instead.
+    """
+
+    def __init__(self, path: str | None = SEARCH_INDEX_PATH, full: bool = False):
+        self.path = site_file(path) if path is not None else None
+        self.shards = 0
+        self.docs: dict = {}
+        self.tokenised = 0
+        self.rewritten = 0
+        self.dirty = False
+        self._garbage: set = set()
+        if path is None or full:
+            return
+        try:
+            with open(os.path.join(self.path, "state.json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("version") == SEARCH_INDEX_VERSION and data.get("settings") == self.settings():
+            self.shards, self.docs = data["shards"], data["docs"]
+
+    @staticmethod
+    def settings() -> list:
+        return [SEARCH_MIN_SHARDS, SEARCH_DOCS_PER_SHARD, SEARCH_TITLE_WEIGHT]
+
+    def _counts_file(self, sha: str) -> str:
+        return os.path.join(self.path, sha[:2], f"{sha}.json")
+
+    def cached_counts(self, sha: str) -> dict | None:
+        if self.path is None or not sha:
+            return None
+        try:
+            with open(self._counts_file(sha), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def counts(self, diary: Diary, sha: str) -> dict:
+        counts = self.cached_counts(sha)
+        if counts is not None:
+            return counts
+        counts = dict(doc_token_counts(diary))
+        self.tokenised += 1
+        if self.path is not None and sha:
+            path = self._counts_file(sha)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(compact_json(counts))
+            os.replace(path + ".tmp", path)
+        return counts
+
+    def update(self, diaries, writer: OutputWriter, manifest: BuildManifest | None = None):
+        shas = {d.date: manifest.source_sha(d.date) if manifest is not None else "" for d in diaries}
+        count = search_shard_count(len(diaries))
+        self.tokenised = self.rewritten = 0
+        present = set()
+        with contextlib.suppress(FileNotFoundError):
+            present = set(os.listdir(os.path.join(writer.root, "data", "search")))
+        patched = (
+            self.path is not None and count == self.shards
+            and all(f"{i}.json" in present for i in range(count))
+            and self._patch(diaries, shas, count, writer)
+        )
+        if not patched:
+            self._rebuild(diaries, shas, count, writer)
+        # Counts of replaced sources go once the new state is saved.
+        self._garbage |= set(self.docs.values()) - set(shas.values())
+        self.docs, self.shards, self.dirty = shas, count, True
+
+    def _patch(self, diaries, shas: dict, count: int, writer: OutputWriter) -> bool:
+        by_date = {d.date: d for d in diaries}
+        deltas: dict[str, dict[int, int]] = {}
+        for date in sorted(shas.keys() | self.docs.keys()):
+            if shas.get(date) == self.docs.get(date):
+                continue
+            old = self.cached_counts(self.docs[date]) if date in self.docs else {}
+            if old is None:
+                return False
+            new = self.counts(by_date[date], shas[date]) if date in shas else {}
+            for token in old.keys() | new.keys():
+                if old.get(token) != new.get(token):
+                    deltas.setdefault(token, {})[doc_id(date)] = new.get(token, 0)
+
+        by_shard: dict[int, dict] = {}
+        for token, change in deltas.items():
+            by_shard.setdefault(search_shard_of(token, count), {})[token] = change
+        shards = {}
+        for i in by_shard:
+            try:
+                with open(os.path.join(writer.root, "data", "search", f"{i}.json"), "r", encoding="utf-8") as f:
+                    shards[i] = json.load(f)
+            except (OSError, ValueError):
+                return False
+
+        for i, changes in sorted(by_shard.items()):
+            shard = shards[i]
+            for token, change in changes.items():
+                postings = decode_postings(shard.get(token, []))
+                postings.update(change)
+                flat = encode_postings({doc: tf for doc, tf in postings.items() if tf})
+                if flat:
+                    shard[token] = flat
+                else:
+                    shard.pop(token, None)
+            writer.write(f"data/search/{i}.json", compact_json(dict(sorted(shard.items()))))
+        self.rewritten = len(by_shard)
+        return True
+
+    def _rebuild(self, diaries, shas: dict, count: int, writer: OutputWriter):
+        postings: dict[str, list[int]] = {}
+        last_id: dict[str, int] = {}
+        for d in reversed(diaries):
+            doc = doc_id(d.date)
+            for token, tf in self.counts(d, shas[d.date]).items():
+                postings.setdefault(token, []).extend((doc - last_id.get(token, 0), tf))
+                last_id[token] = doc
+
+        shards: list[dict] = [{} for _ in range(count)]
+        for token in sorted(postings):
+            shards[search_shard_of(token, count)][token] = postings[token]
+        for i, shard in enumerate(shards):
+            writer.write(f"data/search/{i}.json", compact_json(shard))
+        self.rewritten = count
+        # Shards past a smaller count.
+        with contextlib.suppress(FileNotFoundError):
+            for name in os.listdir(os.path.join(writer.root, "data", "search")):
+                stem = name[: -len(".json")]
+                if name.endswith(".json") and stem.isdigit() and int(stem) >= count:
+                    writer.remove(f"data/search/{name}")
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        for sha in self._garbage:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._counts_file(sha))
+        self._garbage = set()
+        os.makedirs(self.path, exist_ok=True)
+        data = {"version": SEARCH_INDEX_VERSION, "settings": self.settings(), "shards": self.shards,
+                "docs": dict(sorted(self.docs.items()))}
+        tmp = os.path.join(self.path, "state.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(compact_json(data))
+        os.replace(tmp, os.path.join(self.path, "state.json"))
+        self.dirty = False
+
+
+def generate_search_index(diaries, manifest: BuildManifest | None = None, writer: OutputWriter | None = None
+                          ) -> str | None:
+    # Returns the shards' version for data/index.json when a manifest tracks them.
+    writer = writer or OutputWriter()
+    if manifest is None:
+        SearchIndex(None).update(diaries, writer)
+        return None
+    if not manifest.is_fresh("data/search/", search_deps(diaries, manifest)):
+        manifest.search.update(diaries, writer, manifest)
+    return manifest.outputs["data/search/"][:10]
+
+
+# ── Related diaries ────────────────────────────────────────────────────────
+def related_vector(counts: Counter, df: dict, n: int) -> list:
+    # Sublinear tf x idf over the terms that can link diaries, cut to the
+    # strongest RELATED_TERMS and L2-normalised. Rounded, so a row rebuilt from
+    # the cache scores exactly like one computed in the same pass.
+    max_df = max(2, RELATED_MAX_DF * n)
+    weighted = sorted(
+        (((1 + math.log(tf)) * (math.log(n / df[token]) + 1), token)
+         for token, tf in counts.items() if 2 <= df.get(token, 0) <= max_df),
+        reverse=True,
+    )[:RELATED_TERMS]
+    norm = math.sqrt(sum(w * w for w, _ in weighted)) or 1.0
+    return sorted([token, round(w / norm, 6)] for w, token in weighted)
+
+
+def _top_related(scores, i: int):
+    # Best RELATED_COUNT (index, score) pairs; ties go to the newer diary (lower index).
+    return heapq.nsmallest(RELATED_COUNT, ((j, s) for j, s in scores if j != i), key=lambda js: (-js[1], js[0]))
+
+
+def _similarity_rows_python(vectors: list, rows, full_rows):
+    # Sparse dot products through an inverted index: one row costs the posting
+    # lengths of its RELATED_TERMS terms, not a pass over every diary.
+    postings: dict[str, list] = {}
+    for j, vec in enumerate(vectors):
+        for token, w in vec:
+            postings.setdefault(token, []).append((j, w))
+    for i in rows:
+        scores: dict[int, float] = {}
+        for token, w in vectors[i]:
+            for j, wj in postings[token]:
+                scores[j] = scores.get(j, 0.0) + w * wj
+        scores.pop(i, None)
+        found = {j: s for j, s in scores.items() if s >= RELATED_MIN_SCORE}
+        yield i, _top_related(found.items(), i), found if i in full_rows else None
+
+
+def _concat_ranges(starts, counts):
+    # arange(s, s + c) for every pair, concatenated without a Python loop.
+    numpy = optional_module("numpy")
+    offsets = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    return numpy.repeat(starts, counts) + numpy.arange(int(counts.sum())) - offsets
+
+
+def _similarity_rows_numpy(vectors: list, rows, full_rows):
+    # The same products as the Python path, for a block of rows at a time:
+    # expand every (row term, posting) pair, then sum per (row, diary) with
+    # numpy.bincount, which adds in input order (so the same floats).
+    numpy = optional_module("numpy")
+    n = len(vectors)
+    vocab = {token: k for k, token in enumerate(sorted({t for vec in vectors for t, _ in vec}))}
+    lengths = numpy.fromiter((len(vec) for vec in vectors), dtype=numpy.int64, count=n)
+    indptr = numpy.concatenate(([0], numpy.cumsum(lengths)))
+    terms = numpy.fromiter((vocab[t] for vec in vectors for t, _ in vec), dtype=numpy.int64, count=int(indptr[-1]))
+    weights = numpy.fromiter((w for vec in vectors for _, w in vec), dtype=numpy.float64, count=int(indptr[-1]))
+    order = numpy.argsort(terms, kind="stable")
+    col_docs = numpy.repeat(numpy.arange(n), lengths)[order]
+    col_weights = weights[order]
+    df = numpy.bincount(terms, minlength=len(vocab))
+    colptr = numpy.concatenate(([0], numpy.cumsum(df)))
+    cost = numpy.bincount(numpy.repeat(numpy.arange(n), lengths), weights=df[terms], minlength=n)
+
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    start = 0
+    while start < len(rows):
+        stop = start + max(1, int(numpy.searchsorted(numpy.cumsum(cost[rows[start:]]), RELATED_BLOCK_PAIRS,
+                                                     side="right")))
+        block = rows[start:stop]
+        start = stop
+
+        nz = _concat_ranges(indptr[block], lengths[block])
+        t = terms[nz]
+        plen = df[t]
+        post = _concat_ranges(colptr[t], plen)
+        # Block-local row number times n plus diary index identifies a pair.
+        pairs = numpy.repeat(numpy.repeat(numpy.arange(len(block)), lengths[block]), plen) * n + col_docs[post]
+        keys, inverse = numpy.unique(pairs, return_inverse=True)
+        sums = numpy.bincount(inverse.ravel(), weights=numpy.repeat(weights[nz], plen) * col_weights[post])
+        local, cols = keys // n, keys % n
+        keep = (sums >= RELATED_MIN_SCORE) & (cols != block[local])
+        local, cols, sums = local[keep], cols[keep], sums[keep]
+
+        # Per row: best score first, ties to the lower index (the newer diary).
+        ranked = numpy.lexsort((cols, -sums, local))
+        local, cols, sums = local[ranked], cols[ranked], sums[ranked]
+        bounds = numpy.searchsorted(local, numpy.arange(len(block) + 1))
+        for r, i in enumerate(block.tolist()):
+            a, b = int(bounds[r]), int(bounds[r + 1])
+            top = list(zip(cols[a:min(b, a + RELATED_COUNT)].tolist(), sums[a:min(b, a + RELATED_COUNT)].tolist()))
+            found = dict(zip(cols[a:b].tolist(), sums[a:b].tolist())) if i in full_rows else None
+            yield i, top, found
+
+
+def similarity_rows(vectors: list, rows, full_rows=frozenset()):
+    # (row, top related, all scores >= RELATED_MIN_SCORE for rows in full_rows)
+    engine = _similarity_rows_numpy if optional_module("numpy") is not None else _similarity_rows_python
+    return engine(vectors, rows, full_rows)
+
+
+class RelatedIndex:
+    """TF-IDF vectors and top-k related diaries, kept between builds.
+
+    A full pass tokenises every diary twice (document frequencies, then
+    vectors) and scores all rows in blocks. After that IDF is frozen: a changed
+    or new diary gets its own row recomputed and is offered to every other
+    diary's list; only lists that held a changed or deleted diary are redone.
+    Once RELATED_REFRESH of the corpus changed, the next build starts over.
+    """
+
+    def __init__(self, path: str | None = RELATED_INDEX_PATH, full: bool = False):
+        self.path = site_file(path) if path is not None else None
+        self.n = 0
+        self.stale = 0
+        self.df: dict = {}
+        self.docs: dict = {}
+        self.related: dict = {}
+        # What update() returned last time and the time before, within this process.
+        self.lists: dict = {}
+        self.previous: dict = {}
+        self.computed = 0
+        self.dirty = False
+        if path is None or full:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("version") == RELATED_INDEX_VERSION and data.get("settings") == self.settings():
+            self.n, self.stale, self.df = data["n"], data["stale"], data["df"]
+            self.docs, self.related = data["docs"], data["related"]
+
+    @staticmethod
+    def settings() -> list:
+        return [RELATED_COUNT, RELATED_MIN_SCORE, RELATED_TERMS, RELATED_MAX_DF, SEARCH_TITLE_WEIGHT]
+
+    def update(self, diaries, manifest: BuildManifest | None = None) -> dict:
+        # Returns date -> related dates, best first.
+        shas = {d.date: manifest.source_sha(d.date) if manifest is not None else "" for d in diaries}
+        changed = [d for d in diaries if self.docs.get(d.date, [None])[0] != shas[d.date]]
+        gone = self.docs.keys() - shas.keys()
+        self.computed = 0
+        if not self.df or self.stale + len(changed) + len(gone) > RELATED_REFRESH * self.n:
+            self._full_pass(diaries, shas)
+        elif changed or gone:
+            self._patch(diaries, shas, changed, gone)
+        self.previous = self.lists
+        self.lists = {date: [r[0] for r in rows] for date, rows in self.related.items()}
+        return self.lists
+
+    def _full_pass(self, diaries, shas: dict):
+        df = Counter()
+        for d in diaries:
+            df.update(doc_token_counts(d).keys())
+        self.n, self.stale = len(diaries), 0
+        self.df = dict(sorted((token, c) for token, c in df.items() if c >= 2))
+        self.docs = {d.date: [shas[d.date], related_vector(doc_token_counts(d), self.df, self.n)] for d in diaries}
+        dates = [d.date for d in diaries]
+        vectors = [self.docs[date][1] for date in dates]
+        self.related = {
+            dates[i]: [[dates[j], s] for j, s in top] for i, top, _ in similarity_rows(vectors, range(len(dates)))
+        }
+        self.computed = len(dates)
+        self.dirty = True
+
+    def _patch(self, diaries, shas: dict, changed: list, gone: set):
+        for date in gone:
+            del self.docs[date]
+            self.related.pop(date, None)
+        for d in changed:
+            self.docs[d.date] = [shas[d.date], related_vector(doc_token_counts(d), self.df, self.n)]
+        self.stale += len(changed) + len(gone)
+
+        dates = [d.date for d in diaries]
+        pos = {date: i for i, date in enumerate(dates)}
+        fresh = {d.date for d in changed}
+        touched = fresh | gone
+        redo = fresh | {date for date in dates
+                        if date not in self.related or any(r[0] in touched for r in self.related[date])}
+        vectors = [self.docs[date][1] for date in dates]
+        rows = sorted(pos[date] for date in redo)
+        for i, top, found in similarity_rows(vectors, rows, {pos[date] for date in fresh}):
+            self.related[dates[i]] = [[dates[j], s] for j, s in top]
+            # A changed diary may now belong in lists that never held it.
+            for j, score in (found or {}).items():
+                if dates[j] in redo:
+                    continue
+                entries = self.related[dates[j]]
+                if len(entries) < RELATED_COUNT or (score, -i) > (entries[-1][1], -pos[entries[-1][0]]):
+                    entries.append([dates[i], score])
+                    entries.sort(key=lambda r: (-r[1], pos[r[0]]))
+                    del entries[RELATED_COUNT:]
+        self.computed = len(rows)
+        self.dirty = True
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            "version": RELATED_INDEX_VERSION,
+            "settings": self.settings(),
+            "n": self.n,
+            "stale": self.stale,
+            "df": self.df,
+            "docs": dict(sorted(self.docs.items())),
+            "related": dict(sorted(self.related.items())),
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(compact_json(data))
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def find_related(diaries, manifest: BuildManifest | None = None) -> dict:
+    index = manifest.related if manifest is not None else RelatedIndex(None)
+    return index.update(diaries, manifest)
+
+
+class BuildReport:
+    """Wall/CPU time per build stage plus entry, page and artifact counts.
+
+    Filled in by ``build_site`` and written out by ``--report``; ``--profile``
+    adds the hottest functions from cProfile.
+    """
+
+    def __init__(self):
+        self.stages: list[dict] = []
+        self.counts: dict = {}
+        self.artifacts: dict = {}
+        self.hotspots: list[dict] = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.stages.append({
+                "stage": name,
+                "wall_seconds": round(time.perf_counter() - wall, 6),
+                "cpu_seconds": round(time.process_time() - cpu, 6),
+            })
+
+    def collect(self, diaries, manifest: BuildManifest, cache: RenderCache | None, writer: OutputWriter):
+        parsed = len(diaries) - manifest.reused
+        cache_hits = cache.hits if cache is not None and cache.enabled else 0
+        self.counts = {
+            "entries": len(diaries),
+            "entries_parsed": parsed,
+            "entries_rendered": parsed - cache_hits,
+            "render_cache_hits": cache_hits,
+            "related_rows": manifest.related.computed,
+            "search_docs_tokenised": manifest.search.tokenised,
+            "search_shards_written": manifest.search.rewritten,
+            "pages_rendered": manifest.rebuilt,
+            "pages_skipped": manifest.skipped,
+            "files_written": writer.written,
+            "files_skipped": writer.skipped,
+            "bytes_written": writer.bytes_written,
+        }
+        self.artifacts = dict(sorted(writer.artifacts.items()))
+
+    def add_profile(self, profiler, limit: int = 20):
+        import pstats
+
+        stats = pstats.Stats(profiler).stats
+        top = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        self.hotspots = [
+            {
+                "function": f"{os.path.basename(filename)}:{line}({func})",
+                "calls": calls,
+                "self_seconds": round(tottime, 6),
+                "cumulative_seconds": round(cumtime, 6),
+            }
+            for (filename, line, func), (_, calls, tottime, cumtime, _) in top
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "renderer": renderer_name(),
+            "stages": self.stages,
+            "counts": self.counts,
+            "artifacts": self.artifacts,
+            "hotspots": self.hotspots,
+        }
+
+    def save(self, path: str):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+
+    def print_summary(self):
+        print(f"{'stage':<16}{'wall':>10}{'cpu':>10}")
+        for st in self.stages:
+            print(f"{st['stage']:<16}{st['wall_seconds']:>9.3f}s{st['cpu_seconds']:>9.3f}s")
+        print(f"{'artifact':<16}{'written':>10}{'skipped':>10}{'bytes':>14}")
+        for kind, st in self.artifacts.items():
+            print(f"{kind:<16}{st['written']:>10}{st['skipped']:>10}{st['bytes']:>14,}")
+        for hot in self.hotspots[:10]:
+            print(f"{hot['self_seconds']:>9.3f}s {hot['cumulative_seconds']:>9.3f}s {hot['calls']:>8}  {hot['function']}")
+
+
+def save_build(manifest: BuildManifest, cache: RenderCache | None):
+    manifest.save()
+    if cache is not None and cache.stored:
+        cache.prune()
+
+
+def build_site(manifest: BuildManifest, cache: RenderCache | None, writer: OutputWriter, jobs: int = 1,
+               report: BuildReport | None = None, per_page: int = POSTS_PER_PAGE, save: bool = True):
+    # save=False leaves save_build() to the caller (serve, after the reload went out).
+    def stage(name):
+        return report.stage(name) if report is not None else contextlib.nullcontext()
+
+    with stage("entries"):
+        diaries = get_diary_list(manifest, jobs, cache)
+
+    try:
+        with stage("assets"):
+            publish_assets(writer)
+            write_service_worker(writer)
+        with stage("images"):
+            manifest.images = publish_images(writer, jobs, manifest)
+        with stage("bundle"):
+            versions = {"diaries.js": write_bundle(diaries, writer, manifest)}
+        with stage("search"):
+            search_version = generate_search_index(diaries, manifest, writer)
+        with stage("data"):
+            versions["data/index.json"] = generate_data_shards(diaries, manifest, writer, search_version)
+        with stage("home"):
+            generate_index_page(diaries, manifest, writer)
+        with stage("archive"):
+            generate_archive_pages(diaries, manifest, writer)
+        with stage("listing"):
+            generate_listing_pages(diaries, manifest, writer, per_page)
+            generate_taxonomy_pages(diaries, manifest, writer)
+        with stage("related"):
+            related = find_related(diaries, manifest)
+        with stage("posts"):
+            generate_post_pages(diaries, manifest, writer, related)
+        with stage("sitemap"):
+            generate_archives_legacy_redirect(writer)
+            generate_sitemap(diaries, manifest, writer)
+            generate_robots(writer)
+        write_asset_manifest(writer, versions)
+        for rel_path in manifest.stale_outputs():
+            writer.remove(rel_path)
+        # Pooled writes report errors (and sizes for the budget check) only here.
+        writer.flush()
+        writer.check_budgets()
+    except BaseException:
+        writer.discard()
+        raise
+    with stage("commit"):
+        writer.commit()
+        if save:
+            save_build(manifest, cache)
+    if report is not None:
+        report.collect(diaries, manifest, cache, writer)
+    return diaries
+
+
+# ── Source snapshots ───────────────────────────────────────────────────────
+# Every build first records diaries/ in a content-addressed store: one blob per
+# distinct file content under objects/, plus a small JSON snapshot per state.
+# Unchanged files are recognised by size and mtime, so a snapshot reads and
+# writes only what changed since the previous one.
+SNAPSHOT_DIR = ".snapshots"
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """Deduplicated snapshots of the diary sources.
+
+    ``objects/ab/cdef...`` holds each distinct file content once, named by
+    its SHA-256. ``snapshots/<UTC time>-<id>.json`` maps every diary file to
+    its blob (plus size and mtime, reused to skip hashing unchanged files);
+    the id is a hash of the name -> blob map, so a state is stored once and
+    a build over unchanged sources writes nothing.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_DIR):
+        self.path = site_file(path)
+        self.blobs_written = 0
+
+    def snapshots(self) -> list[str]:
+        # Snapshot file names, oldest first.
+        try:
+            return sorted(f for f in os.listdir(os.path.join(self.path, "snapshots")) if f.endswith(".json"))
+        except FileNotFoundError:
+            return []
+
+    def load(self, ref: str | None = None) -> dict:
+        # The newest snapshot, or the one whose id starts with ref.
+        names = self.snapshots()
+        if ref not in (None, "latest"):
+            names = [n for n in names if n[: -len(".json")].split("-", 1)[1].startswith(ref)]
+            if len({n.split("-", 1)[1] for n in names}) > 1:
+                raise SystemExit(f"snapshot {ref!r} is ambiguous")
+        if not names:
+            raise SystemExit(f"no snapshot {ref!r}" if ref not in (None, "latest") else "no snapshots yet")
+        with open(os.path.join(self.path, "snapshots", names[-1]), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def blob_path(self, sha: str) -> str:
+        return os.path.join(self.path, "objects", sha[:2], sha[2:])
+
+    def read_blob(self, sha: str) -> bytes:
+        with open(self.blob_path(sha), "rb") as f:
+            return f.read()
+
+    def scan(self, previous: dict | None = None, store: bool = False) -> dict:
+        # name -> {sha256, size, mtime_ns} for diaries/*.md; only files whose
+        # size or mtime moved since previous are read (and stored as blobs).
+        old = previous["files"] if previous else {}
+        files = {}
+        for name in sorted(os.listdir(DIARY_DIR)):
+            if not name.endswith(".md"):
+                continue
+            path = os.path.join(DIARY_DIR, name)
+            st = os.stat(path)
+            record = old.get(name)
+            if not record or record["size"] != st.st_size or record["mtime_ns"] != st.st_mtime_ns:
+                with open(path, "rb") as f:
+                    data = f.read()
+                record = {"sha256": hashlib.sha256(data).hexdigest(), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                if store:
+                    self._put(record["sha256"], data)
+            files[name] = record
+        return files
+
+    def _put(self, sha: str, data: bytes):
+        path = self.blob_path(sha)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.blobs_written += 1
+
+    def take(self) -> str:
+        # Snapshot diaries/ and return its id; a state seen last time is not stored again.
+        previous = self.load() if self.snapshots() else None
+        files = self.scan(previous, store=True)
+        snapshot_id = fingerprint(compact_json({name: r["sha256"] for name, r in files.items()}).encode("utf-8"))
+        if previous and previous["id"] == snapshot_id:
+            if previous["files"] != files:  # touched but identical: refresh the stat cache in place
+                previous["files"] = files
+                self._save(self.snapshots()[-1], previous)
+            return snapshot_id
+        created = datetime.now(timezone.utc)
+        self._save(f"{created.strftime('%Y%m%dT%H%M%S%fZ')}-{snapshot_id}.json", {
+            "version": SNAPSHOT_VERSION,
+            "id": snapshot_id,
+            "created": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "files": files,
+        })
+        return snapshot_id
+
+    def _save(self, name: str, data: dict):
+        directory = os.path.join(self.path, "snapshots")
+        os.makedirs(directory, exist_ok=True)
+        tmp = os.path.join(directory, name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(compact_json(data))
+        os.replace(tmp, os.path.join(directory, name))
+
+    def restore(self, ref: str, names: list[str] = ()) -> tuple[list[str], list[str]]:
+        # Write the snapshot's version of names back into diaries/; files that
+        # already match are left alone. Without names the whole snapshot comes
+        # back, so diaries added since are removed. Returns (restored, removed).
+        files = self.load(ref)["files"]
+        missing = [n for n in names if n not in files]
+        if missing:
+            raise SystemExit(f"not in snapshot {ref}: {', '.join(missing)}")
+        current = self.scan(self.load() if self.snapshots() else None)
+        restored = []
+        for name in names or sorted(files):
+            sha = files[name]["sha256"]
+            if current.get(name, {}).get("sha256") == sha:
+                continue
+            path = os.path.join(DIARY_DIR, name)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(self.read_blob(sha))
+            os.replace(tmp, path)
+            restored.append(name)
+        removed = [] if names else sorted(current.keys() - files.keys())
+        for name in removed:
+            os.remove(os.path.join(DIARY_DIR, name))
+        return restored, removed
+
+
+def diff_snapshots(old: dict, new: dict) -> list[tuple[str, str]]:
+    # (status, name) with status A(dded), D(eleted) or M(odified), by file name.
+    changes = []
+    for name in sorted(old.keys() | new.keys()):
+        if name not in old:
+            changes.append(("A", name))
+        elif name not in new:
+            changes.append(("D", name))
+        elif old[name]["sha256"] != new[name]["sha256"]:
+            changes.append(("M", name))
+    return changes
+
+
+def snapshot_command(args: list[str]) -> int:
+    # snapshot list | diff [A [B]] | restore ID [FILE...]; B defaults to diaries/ as it is now.
+    store = SnapshotStore()
+    action, rest = (args[0], args[1:]) if args else ("list", [])
+    if action == "list":
+        previous = {}
+        for name in store.snapshots():
+            with open(os.path.join(store.path, "snapshots", name), "r", encoding="utf-8") as f:
+                snap = json.load(f)
+            changes = diff_snapshots(previous, snap["files"])
+            print(f"{snap['id']}  {snap['created']}  {len(snap['files'])} files, {len(changes)} changed")
+            previous = snap["files"]
+        return 0
+    if action == "diff" and len(rest) <= 2:
+        old = store.load(rest[0] if rest else None)
+        new = store.load(rest[1]) if len(rest) > 1 else None
+        changes = diff_snapshots(old["files"], new["files"] if new else store.scan(store.load()))
+        for status, name in changes:
+            print(f"{status} {name}")
+        if len(changes) == 1 and changes[0][0] == "M":
+            # A single edited file: show the edit as well.
+            import difflib
+
+            name = changes[0][1]
+            before = store.read_blob(old["files"][name]["sha256"]).decode("utf-8")
+            if new:
+                after = store.read_blob(new["files"][name]["sha256"]).decode("utf-8")
+            else:
+                with open(os.path.join(DIARY_DIR, name), "r", encoding="utf-8") as f:
+                    after = f.read()
+            labels = f"{old['id']}/{name}", f"{new['id']}/{name}" if new else f"diaries/{name}"
+            print("".join(difflib.unified_diff(before.splitlines(True), after.splitlines(True), *labels)), end="")
+        return 0
+    if action == "restore" and rest:
+        # The state being replaced is snapshotted first, so a restore can be undone.
+        before = store.take()
+        restored, removed = store.restore(rest[0], [os.path.basename(n) for n in rest[1:]])
+        for name in restored:
+            print(f"restored {name}")
+        for name in removed:
+            print(f"removed {name}")
+        print(f"{len(restored)} files restored and {len(removed)} removed from {rest[0]} "
+              f"(previous state: snapshot {before})")
+        return 0
+    print("usage: generate_blog.py snapshot list | diff [A [B]] | restore ID [FILE...]")
+    return 2
+
+
+# ── Build API ──────────────────────────────────────────────────────────────
+# build(BuildConfig(root=...)) builds one site from Python; main() is the CLI
+# over it, and a long-lived worker can call it for several roots in turn.
+class BuildConfig:
+    """One site to build and the options to build it with.
+
+    ``root`` holds the assets, the generated output and the local caches;
+    ``diary_dir`` is resolved against it (``diaries`` by default). The other
+    fields mirror the command line options, with ``budgets`` overriding
+    single ``SIZE_BUDGETS`` entries (in bytes) when ``optimize`` is set and
+    ``snapshot`` recording the sources in the snapshot store first.
+    """
+
+    __slots__ = ("root", "diary_dir", "site_url", "site_path", "full", "staged", "jobs", "renderer",
+                 "per_page", "optimize", "budgets", "cache", "clear_cache", "cache_size", "report", "snapshot")
+
+    def __init__(self, root: str = BASE_DIR, diary_dir: str = "diaries", site_url: str = SITE_URL,
+                 site_path: str = SITE_PATH, full: bool = False, staged: bool = False, jobs: int = 1,
+                 renderer: str = "auto", per_page: int = POSTS_PER_PAGE, optimize: bool = False,
+                 budgets: dict | None = None, cache: bool = True, clear_cache: bool = False,
+                 cache_size: int = RENDER_CACHE_MAX_BYTES, report: bool = False, snapshot: bool = True):
+        self.root = os.path.abspath(root)
+        self.diary_dir = os.path.join(self.root, diary_dir)
+        self.site_url = site_url
+        self.site_path = site_path
+        self.full = full
+        self.staged = staged
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.renderer = renderer
+        self.per_page = per_page
+        self.optimize = optimize
+        self.budgets = dict(budgets or {})
+        self.cache = cache
+        self.clear_cache = clear_cache
+        self.cache_size = cache_size
+        self.report = report
+        self.snapshot = snapshot
+
+
+class BuildResult:
+    """What one ``build()`` did; ``report`` is a ``BuildReport`` when the config asked for one
+    and ``snapshot`` the id of the pre-build source snapshot, if one was taken. ``build()``
+    prints nothing: ``warnings`` holds messages about sources for the caller to show."""
+
+    __slots__ = ("entries", "files_written", "bytes_written", "files_skipped", "outputs_rebuilt",
+                 "outputs_skipped", "cache_hits", "cache_stored", "images_encoded", "images_cached",
+                 "warnings", "report", "snapshot", "snapshot_blobs")
+
+    def __init__(self, diaries, manifest: BuildManifest, cache: RenderCache, writer: OutputWriter,
+                 report: BuildReport | None, snapshots: SnapshotStore | None = None, snapshot: str | None = None):
+        self.entries = len(diaries)
+        self.files_written = writer.written
+        self.bytes_written = writer.bytes_written
+        self.files_skipped = writer.skipped
+        self.outputs_rebuilt = manifest.rebuilt
+        self.outputs_skipped = manifest.skipped
+        self.cache_hits = cache.hits if cache.enabled else 0
+        self.cache_stored = cache.stored if cache.enabled else 0
+        self.images_encoded, self.images_cached = manifest.images
+        self.warnings = list(manifest.warnings)
+        self.report = report
+        self.snapshot = snapshot
+        self.snapshot_blobs = snapshots.blobs_written if snapshots is not None else 0
+
+
+_build_lock = threading.RLock()
+
+
+@contextlib.contextmanager
+def bind_site(config: BuildConfig):
+    # Points the site globals and the renderer choice at config until the block
+    # exits. They are process-wide, so builds in one process take turns; loaded
+    # renderers and optional modules stay warm between them.
+    global BASE_DIR, DIARY_DIR, SITE_URL, SITE_PATH
+    with _build_lock:
+        saved = BASE_DIR, DIARY_DIR, SITE_URL, SITE_PATH, _renderer_choice
+        BASE_DIR, DIARY_DIR = config.root, config.diary_dir
+        SITE_URL, SITE_PATH = config.site_url, config.site_path
+        use_renderer(config.renderer)
+        try:
+            yield
+        finally:
+            BASE_DIR, DIARY_DIR, SITE_URL, SITE_PATH = saved[:4]
+            use_renderer(saved[4])
+
+
+def build_cache(config: BuildConfig) -> RenderCache:
+    cache = RenderCache(max_bytes=config.cache_size, enabled=config.cache)
+    if config.clear_cache:
+        cache.clear()
+    return cache
+
+
+def build(config: BuildConfig) -> BuildResult:
+    with bind_site(config):
+        snapshots = SnapshotStore() if config.snapshot else None
+        snapshot = snapshots.take() if snapshots is not None else None
+        cache = build_cache(config)
+        budgets = {**SIZE_BUDGETS, **config.budgets} if config.optimize else {}
+        options = f"optimize {sorted(budgets.items())}" if config.optimize else ""
+        manifest = BuildManifest(signature=generator_signature(options), full=config.full)
+        writer = OutputWriter(staging=site_file(STAGING_DIR) if config.staged else None, jobs=config.jobs,
+                              optimize=config.optimize, budgets=budgets)
+        report = BuildReport() if config.report else None
+        diaries = build_site(manifest, cache, writer, config.jobs, report, config.per_page)
+        return BuildResult(diaries, manifest, cache, writer, report, snapshots, snapshot)
+
+
+# ── Preview server ─────────────────────────────────────────────────────────
+WATCHED_ROOT_FILES = set(ASSET_SOURCES)
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SNIPPET = (
+    "<script>new EventSource('" + LIVE_RELOAD_PATH + "').onmessage = function () { location.reload(); };</script>"
+)
+
+# Served as sw.js by the preview server: cached pages would hide live reloads,
+# so any worker left over from a deployed build unregisters and drops its caches.
+PREVIEW_SERVICE_WORKER = b"""self.addEventListener('install', function () { self.skipWaiting(); });
+self.addEventListener('activate', function (event) {
+  event.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.map(function (name) { return caches.delete(name); }));
+  }).then(function () { return self.registration.unregister(); }));
+});
+"""
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _is_watched(path: str) -> bool:
+    if os.path.dirname(path) == DIARY_DIR:
+        return path.endswith(".md")
+    return os.path.dirname(path) == BASE_DIR and os.path.basename(path) in WATCHED_ROOT_FILES
+
+
+def _inotify_changes(debounce: float):
+    import ctypes
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    dirs = {}
+    for directory in (DIARY_DIR, BASE_DIR):
+        wd = libc.inotify_add_watch(fd, os.fsencode(directory), mask)
+        if wd < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        dirs[wd] = directory
+
+    try:
+        while True:
+            select.select([fd], [], [])
+            changed = set()
+            # Editors save in bursts (temp file, rename, chmod); collect the whole burst.
+            while select.select([fd], [], [], debounce)[0]:
+                data = os.read(fd, 64 * 1024)
+                offset = 0
+                while offset < len(data):
+                    wd, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += _INOTIFY_EVENT.size
+                    name = data[offset : offset + length].rstrip(b"\0").decode("utf-8", "replace")
+                    offset += length
+                    path = os.path.join(dirs.get(wd, ""), name)
+                    if _is_watched(path):
+                        changed.add(path)
+            if changed:
+                yield changed
+    finally:
+        os.close(fd)
+
+
+def _watched_state() -> dict:
+    state = {}
+    for directory in (DIARY_DIR, BASE_DIR):
+        with os.scandir(directory) as it:
+            for entry in it:
+                if _is_watched(entry.path):
+                    st = entry.stat()
+                    state[entry.path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def _polling_changes(interval: float):
+    before = _watched_state()
+    while True:
+        time.sleep(interval)
+        after = _watched_state()
+        changed = {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+        before = after
+        if changed:
+            yield changed
+
+
+def watch_changes(interval: float = 0.1):
+    """Yield sets of changed diary / asset paths, via inotify when possible."""
+    try:
+        yield from _inotify_changes(debounce=0.02)
+    except (OSError, AttributeError):
+        # No inotify (macOS, Windows, containers without it): poll stat() instead.
+        yield from _polling_changes(interval)
+
+
+class LiveReload:
+    def __init__(self):
+        self.version = 0
+        self._cond = threading.Condition()
+
+    def notify(self):
+        with self._cond:
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != seen, timeout)
+            return self.version
+
+
+def preview_handler_class():
+    # http.server is only needed by serve; importing it at module level costs every build.
+    from http.server import SimpleHTTPRequestHandler
+
+    class PreviewHandler(SimpleHTTPRequestHandler):
+        """Static file handler that injects the live-reload client into HTML pages."""
+
+        def __init__(self, *args, live_reload: LiveReload, **kwargs):
+            self.live_reload = live_reload
+            super().__init__(*args, **kwargs)
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == LIVE_RELOAD_PATH:
+                self._stream_reloads()
+                return
+            if self.path.split("?", 1)[0] == f"{SITE_PATH}/{SERVICE_WORKER}":
+                self._send(PREVIEW_SERVICE_WORKER, "text/javascript; charset=utf-8")
+                return
+
+            path = self.translate_path(self.path)
+            if os.path.isdir(path) and self.path.split("?", 1)[0].endswith("/"):
+                path = os.path.join(path, "index.html")
+            if not path.endswith(".html") or not os.path.isfile(path):
+                super().do_GET()
+                return
+
+            with open(path, "rb") as f:
+                body = f.read()
+            snippet = LIVE_RELOAD_SNIPPET.encode("utf-8")
+            marker = body.rfind(b"</body>")
+            body = body[:marker] + snippet + body[marker:] if marker != -1 else body + snippet
+            self._send(body, "text/html; charset=utf-8")
+
+        def _send(self, body: bytes, content_type: str):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream_reloads(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            seen = self.live_reload.version
+            try:
+                while True:
+                    version = self.live_reload.wait(seen, timeout=15)
+                    self.wfile.write(b"data: reload\n\n" if version != seen else b": ping\n\n")
+                    self.wfile.flush()
+                    seen = version
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return PreviewHandler
+
+
+def serve(host: str, port: int, cache: RenderCache | None, jobs: int = 1, full: bool = False,
+          per_page: int = POSTS_PER_PAGE):
+    manifest = BuildManifest(full=full, live=True)
+    writer = OutputWriter(jobs=jobs)
+    diaries = build_site(manifest, cache, writer, jobs, per_page=per_page)
+    for warning in manifest.warnings:
+        print(warning)
+    print(f"Built {len(diaries)} entries, {writer.written} files updated")
+
+    live_reload = LiveReload()
+    from http.server import ThreadingHTTPServer
+
+    handler = functools.partial(preview_handler_class(), live_reload=live_reload, directory=BASE_DIR)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving http://{host}:{port}/ — watching diaries/ and {', '.join(ASSET_SOURCES)} (Ctrl+C to stop)")
+
+    try:
+        for changed in watch_changes():
+            started = time.perf_counter()
+            names = ", ".join(sorted(os.path.relpath(p, BASE_DIR) for p in changed))
+            # Asset edits change fingerprinted URLs too, so every change is a rebuild.
+            manifest.advance(changed)
+            writer = OutputWriter(jobs=jobs)
+            try:
+                build_site(manifest, cache, writer, jobs, per_page=per_page, save=False)
+            except Exception as exc:  # keep serving; the next save retries
+                print(f"{names}: build failed: {exc}")
+                continue
+            live_reload.notify()
+            elapsed = time.perf_counter() - started
+            for warning in manifest.warnings:
+                print(warning)
+            print(f"{names}: {writer.written} files updated in {elapsed * 1000:.0f} ms")
+            # Off the reload path: the browser is already fetching the new pages.
+            save_build(manifest, cache)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+def parse_budget(value: str) -> tuple[str, int]:
+    kind, _, kb = value.partition("=")
+    if kind not in SIZE_BUDGETS or not kb.isdigit():
+        import argparse
+
+        raise argparse.ArgumentTypeError(f"expected KIND=KB with KIND in {', '.join(SIZE_BUDGETS)}")
+    return kind, int(kb) * 1024
 
-Sitemap: {SITE_URL}/sitemap.xml
-"""
-    with open(os.path.join(BASE_DIR, "robots.txt"), "w", encoding="utf-8") as f:
-        f.write(content)
 
+def main(argv=None):
+    import argparse
 
-def main():
-    diaries = get_diary_list()
+    parser = argparse.ArgumentParser(description="Generate the gaemilog static site.")
+    parser.add_argument("command", nargs="?", default="build", choices=["build", "serve", "renderers", "snapshot"],
+                        help="build once (default), serve a live-reloading preview while watching for edits, "
+                             "benchmark the installed markdown renderers and keep the fastest identical one, "
+                             "or manage source snapshots (snapshot list | diff [A [B]] | restore ID [FILE...])")
+    parser.add_argument("args", nargs="*", metavar="ARG", help="snapshot subcommand and its arguments")
+    parser.add_argument("--host", default="127.0.0.1", help="preview server address (serve)")
+    parser.add_argument("--port", type=int, default=8000, help="preview server port (serve)")
+    parser.add_argument("--root", default=BASE_DIR, metavar="DIR",
+                        help="site to build: assets, output and caches (diaries under DIR/diaries)")
+    parser.add_argument("--full", action="store_true", help="ignore the build manifest and rebuild every page")
+    parser.add_argument("--staged", action="store_true", help="build into a staging directory and swap it in at the end")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="render markdown in N processes and write files from N threads (0 = one per CPU)")
+    parser.add_argument("--renderer", default="auto", choices=["auto", *MARKDOWN_BACKENDS],
+                        help="markdown backend (auto = the one saved by `renderers`, else python-markdown)")
+    parser.add_argument("--per-page", type=int, default=POSTS_PER_PAGE, metavar="N",
+                        help="entries per /page/N/ listing page")
+    parser.add_argument("--check-fallback", action="store_true",
+                        help="compare the fallback markdown renderer with python-markdown and exit")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write the render cache")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="do not snapshot diaries/ into .snapshots/ before building")
+    parser.add_argument("--clear-cache", action="store_true", help="empty the render cache before building")
+    parser.add_argument("--cache-size", type=int, default=RENDER_CACHE_MAX_BYTES // (1024 * 1024), metavar="MB",
+                        help="evict least recently used render cache entries beyond this size")
+    parser.add_argument("--optimize", action="store_true",
+                        help="minify HTML/XML/JSON, write .gz (and .br with brotli) siblings and enforce size budgets")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[], metavar="KIND=KB",
+                        help="override one --optimize size budget, e.g. posts=48")
+    parser.add_argument("--report", metavar="PATH",
+                        help="write per-stage timings, counts and bytes per artifact type as JSON (e.g. build-report.json)")
+    parser.add_argument("--profile", nargs="?", const="", metavar="PROF",
+                        help="print stage timings and the hottest functions under cProfile; "
+                             "save raw stats to PROF if given (with --jobs, rendering workers are not profiled)")
+    args = parser.parse_args(argv)
+    if args.per_page < 1:
+        parser.error("--per-page must be at least 1")
+    config = BuildConfig(root=args.root, full=args.full, staged=args.staged, jobs=args.jobs,
+                         renderer=args.renderer, per_page=args.per_page, optimize=args.optimize,
+                         budgets=dict(args.budget), cache=not args.no_cache, clear_cache=args.clear_cache,
+                         cache_size=args.cache_size * 1024 * 1024,
+                         report=bool(args.report) or args.profile is not None, snapshot=not args.no_snapshot)
+    if args.args and args.command != "snapshot":
+        parser.error(f"unexpected arguments: {' '.join(args.args)}")
+    if args.check_fallback or args.command in ("renderers", "serve", "snapshot"):
+        with bind_site(config):
+            if args.check_fallback:
+                raise SystemExit(check_fallback_parity())
+            if args.command == "renderers":
+                raise SystemExit(bench_renderers())
+            if args.command == "snapshot":
+                raise SystemExit(snapshot_command(args.args))
+            serve(args.host, args.port, build_cache(config), config.jobs, full=args.full, per_page=args.per_page)
+        return
 
-    with open(OUTPUT_JS, "w", encoding="utf-8") as f:
-        f.write("const DIARY_DATA = " + json.dumps(diaries, ensure_ascii=False, indent=2) + ";")
+    profiler = None
+    if args.profile is not None:
+        import cProfile
 
-    generate_archive_pages(diaries)
-    generate_post_pages(diaries)
-    generate_archives_legacy_redirect()
-    generate_sitemap(diaries)
-    generate_robots()
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        result = build(config)
+    except BudgetExceeded as exc:
+        raise SystemExit(str(exc))
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    report = result.report
+    if profiler is not None:
+        report.add_profile(profiler)
+        if args.profile:
+            profiler.dump_stats(args.profile)
 
-    print(f"Generated {len(diaries)} entries in diaries.js")
+    for warning in result.warnings:
+        print(warning)
+    if result.snapshot:
+        print(f"Source snapshot {result.snapshot}: {result.snapshot_blobs} new blobs in {SNAPSHOT_DIR}/")
+    print(f"Generated {result.entries} entries in diaries.js and data/")
+    if config.cache:
+        print(f"Render cache: {result.cache_hits} hits, {result.cache_stored} rendered")
+    if result.images_encoded or result.images_cached:
+        print(f"Images: {result.images_encoded} encoded, {result.images_cached} cached -> /assets/img/")
+    print("Generated home page: /index.html")
     print("Generated archive pages: /archive/ and /archive/YYYY-MM/")
+    print("Generated listing pages: /page/ and /page/N/")
+    print("Generated tag and series pages: /tags/ and /series/ (when diaries have them)")
     print("Generated permalink pages: /YYYY/MM/DD/")
+    print(f"Rebuilt {result.outputs_rebuilt} outputs, {result.outputs_skipped} unchanged")
     print("Generated sitemap.xml and robots.txt")
+    print(f"Wrote {result.files_written} files ({result.bytes_written} bytes), {result.files_skipped} unchanged")
+    if args.profile is not None:
+        report.print_summary()
+    if args.report:
+        report.save(args.report)
+        print(f"Build report: {args.report}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+// generate_blog.py가 만든 파일입니다. 직접 고치지 마세요.
+const VERSION = '008c050f80';
+const ROOT = '/';
+const PRECACHE = ["/assets/profile.056994901e.jpg", "/assets/search.a57e182a6a.js", "/assets/style.0c86c09c21.css"];
+
+const SHELL = 'gaemilog-shell-' + VERSION;
+const PAGES = 'gaemilog-pages-' + VERSION;
+const DATA = 'gaemilog-data-' + VERSION;
+const FONTS = 'gaemilog-fonts';
+const DATA_LIMIT = 200;
+const POST_RE = /\/\d{4}\/\d{2}\/\d{2}\/$/;
+
+self.addEventListener('install', function (event) {
+  event.waitUntil(caches.open(SHELL).then(function (cache) { return cache.addAll(PRECACHE); })
+    .then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (event) {
+  // 버전이 바뀐 캐시는 통째로 버림(예전 셸을 가리키는 페이지가 남지 않게)
+  const keep = [SHELL, PAGES, DATA, FONTS];
+  event.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.filter(function (name) {
+      return name.startsWith('gaemilog-') && keep.indexOf(name) < 0;
+    }).map(function (name) { return caches.delete(name); }));
+  }).then(function () { return self.clients.claim(); }));
+});
+
+function trim(cache, limit) {
+  // keys()는 넣은 순서: 오래된 것부터 지움
+  return cache.keys().then(function (keys) {
+    return Promise.all(keys.slice(0, Math.max(0, keys.length - limit)).map(function (key) {
+      return cache.delete(key);
+    }));
+  });
+}
+
+function store(event, cacheName, response) {
+  if (response.ok || response.type === 'opaque') {
+    const copy = response.clone();
+    event.waitUntil(caches.open(cacheName).then(function (cache) {
+      if (cacheName !== DATA) return cache.put(event.request, copy);
+      // 데이터 샤드는 ?v=버전으로 받으므로 같은 경로의 예전 버전을 지우고 넣음
+      return cache.delete(event.request, { ignoreSearch: true })
+        .then(function () { return cache.put(event.request, copy); })
+        .then(function () { return trim(cache, DATA_LIMIT); });
+    }));
+  }
+  return response;
+}
+
+function cacheFirst(event, cacheName) {
+  return caches.match(event.request).then(function (hit) {
+    return hit || fetch(event.request).then(function (res) { return store(event, cacheName, res); });
+  });
+}
+
+function staleWhileRevalidate(event, cacheName) {
+  return caches.open(cacheName).then(function (cache) {
+    return cache.match(event.request).then(function (hit) {
+      const fresh = fetch(event.request).then(function (res) { return store(event, cacheName, res); });
+      if (!hit) return fresh;
+      event.waitUntil(fresh.catch(function () {}));
+      return hit;
+    });
+  });
+}
+
+function networkFirst(event, cacheName) {
+  return fetch(event.request).then(function (res) { return store(event, cacheName, res); }).catch(function () {
+    return caches.match(event.request).then(function (hit) {
+      return hit || caches.match(ROOT).then(function (home) { return home || Response.error(); });
+    });
+  });
+}
+
+self.addEventListener('fetch', function (event) {
+  if (event.request.method !== 'GET') return;
+  const url = new URL(event.request.url);
+  if (url.origin === location.origin) {
+    if (!url.pathname.startsWith(ROOT)) return;
+    const path = url.pathname.slice(ROOT.length);
+    if (path.startsWith('assets/')) {
+      event.respondWith(cacheFirst(event, SHELL));
+    } else if (path.startsWith('data/') || path === 'diaries.js') {
+      event.respondWith(staleWhileRevalidate(event, DATA));
+    } else if (POST_RE.test(url.pathname)) {
+      // 글 페이지는 거의 안 바뀜: 캐시(이전/다음 글 prefetch 포함)로 바로 보여 주고 뒤에서 갱신
+      event.respondWith(staleWhileRevalidate(event, PAGES));
+    } else if (event.request.mode === 'navigate' || path === '' || path.endsWith('/') || path.endsWith('.html')) {
+      event.respondWith(networkFirst(event, PAGES));
+    }
+  } else if (url.hostname === 'fonts.gstatic.com') {
+    event.respondWith(cacheFirst(event, FONTS));
+  } else if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'cdn.jsdelivr.net') {
+    event.respondWith(staleWhileRevalidate(event, FONTS));
+  }
+});
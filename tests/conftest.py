@@ -0,0 +1,45 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import generate_blog as gb  # noqa: E402
+
+DIARY = """# {title}
+
+{body}
+
+## 오늘의 한 줄
+{quote}
+"""
+
+
+def write_diary(root: str, date: str, title: str = "제목이에요", body: str = "본문이에요.",
+                quote: str = "한 줄이에요.", front: str = "") -> str:
+    path = os.path.join(root, "diaries", f"{date}.md")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(front + DIARY.format(title=title, body=body, quote=quote))
+    return path
+
+
+def make_site(root: str) -> str:
+    # A throwaway site root with the hand-written assets and an empty diaries/.
+    os.makedirs(os.path.join(root, "diaries"))
+    for name in gb.ASSET_SOURCES:
+        shutil.copy(os.path.join(REPO, name), os.path.join(root, name))
+    return root
+
+
+@pytest.fixture
+def site(tmp_path):
+    return make_site(str(tmp_path))
+
+
+def build(root: str, **options) -> "gb.BuildResult":
+    options.setdefault("renderer", "fallback")
+    return gb.build(gb.BuildConfig(root=root, **options))
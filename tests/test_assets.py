@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import generate_blog as gb
+from conftest import build, write_diary
+
+# Just enough of the service worker globals to drive its fetch handler in node.
+SW_HARNESS = """
+const listeners = {}, stores = {}, pending = [];
+const self = { addEventListener: (type, fn) => { listeners[type] = fn; }, skipWaiting() {}, clients: { claim() {} } };
+const location = { origin: 'https://blog.test' };
+const url = r => typeof r === 'string' ? r : r.url;
+const bare = u => u.split('?')[0];
+function open(name) {
+  const entries = stores[name] || (stores[name] = new Map());
+  return {
+    match: async r => entries.get(url(r)),
+    put: async (r, res) => { entries.delete(url(r)); entries.set(url(r), res); },
+    delete: async (r, opts) => {
+      const keys = [...entries.keys()].filter(k => k === url(r) || (opts && opts.ignoreSearch && bare(k) === bare(url(r))));
+      keys.forEach(k => entries.delete(k));
+      return keys.length > 0;
+    },
+    keys: async () => [...entries.keys()].map(u => ({ url: u })),
+  };
+}
+const caches = {
+  open: async name => open(name),
+  match: async r => { for (const name in stores) { const hit = stores[name].get(url(r)); if (hit) return hit; } },
+};
+const fetch = async () => ({ ok: true, type: 'basic', clone() { return this; } });
+async function get(u) {
+  let answer;
+  listeners.fetch({ request: { method: 'GET', url: u, mode: 'cors' }, respondWith: p => { answer = p; },
+                    waitUntil: p => { pending.push(p); } });
+  await answer;
+  while (pending.length) await pending.shift();
+}
+"""
+
+
+def fingerprinted(site, stem):
+    return sorted(f for f in os.listdir(os.path.join(site, "assets")) if f.startswith(stem + ".") and f.endswith(".css"))
+
+
+def test_asset_edit_replaces_the_old_fingerprinted_copy(site):
+    write_diary(site, "2026-02-10")
+    build(site)
+    first = fingerprinted(site, "style")
+    with open(os.path.join(site, "style.css"), "a", encoding="utf-8") as f:
+        f.write("\n.edited { color: red; }\n")
+    build(site)
+
+    with open(os.path.join(site, "asset-manifest.json"), encoding="utf-8") as f:
+        current = json.load(f)["style.css"]
+    assert fingerprinted(site, "style") == [os.path.basename(current)] != first
+    with open(os.path.join(site, "index.html"), encoding="utf-8") as f:
+        assert current in f.read()
+
+
+def test_unrelated_files_in_assets_are_kept(site):
+    os.makedirs(os.path.join(site, "assets"))
+    with open(os.path.join(site, "assets", "notes.txt"), "w") as f:
+        f.write("keep")
+    write_diary(site, "2026-02-10")
+    build(site)
+    assert os.path.exists(os.path.join(site, "assets", "notes.txt"))
+
+
+def test_derivatives_of_a_deleted_image_are_removed(site):
+    Image = pytest.importorskip("PIL.Image")
+    os.makedirs(os.path.join(site, "images"))
+    Image.new("RGB", (200, 100), "red").save(os.path.join(site, "images", "photo.png"))
+    write_diary(site, "2026-02-10", body="![사진](/images/photo.png)")
+    build(site)
+    img = os.path.join(site, "assets", "img")
+    assert any(f.startswith("photo.") for f in os.listdir(img))
+
+    os.remove(os.path.join(site, "images", "photo.png"))
+    write_diary(site, "2026-02-10")
+    build(site)
+    assert not any(f.startswith("photo.") for f in os.listdir(img))
+    assert any(f.startswith("profile.") for f in os.listdir(img))
+
+
+def test_service_worker_keeps_one_version_of_each_data_shard(site):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+    write_diary(site, "2026-02-10")
+    build(site)
+    with open(os.path.join(site, gb.SERVICE_WORKER), encoding="utf-8") as f:
+        worker = f.read()
+    drive = """
+(async () => {
+  const data = () => [...stores[Object.keys(stores).find(name => name.startsWith('gaemilog-data-'))].keys()];
+  for (const v of ['a', 'b', 'c']) await get('https://blog.test/data/months/2026-02.json?v=' + v);
+  const months = data();
+  for (let i = 0; i < 250; i++) await get('https://blog.test/data/posts/' + i + '.json?v=a');
+  console.log(JSON.stringify([months, data()]));
+})();
+"""
+    out = subprocess.run([node, "-e", SW_HARNESS + worker + drive], capture_output=True, text=True, check=True)
+    months, data = json.loads(out.stdout)
+    assert months == ["https://blog.test/data/months/2026-02.json?v=c"]
+    assert len(data) == 200 and data[-1] == "https://blog.test/data/posts/249.json?v=a"
@@ -0,0 +1,22 @@
+import bench_blog
+
+
+def result(seconds=1.0, nbytes=100_000, rss=100.0):
+    return {"size": 1000, "peak_rss_mb": rss, "stages": {"posts": {"seconds": seconds, "bytes": nbytes}}}
+
+
+def test_compare_checks_time_bytes_and_rss_with_one_tolerance():
+    baseline = {"1000": result()}
+    assert bench_blog.compare([result(seconds=1.2, nbytes=120_000, rss=120.0)], baseline, 0.25) == []
+
+    regressions = bench_blog.compare([result(seconds=1.3, nbytes=130_000, rss=130.0)], baseline, 0.25)
+    assert regressions == [
+        "   1000 peak RSS: 130.0 MB > 100.0 MB baseline",
+        "   1000 posts: 1.300s > 1.000s baseline",
+        "   1000 posts: 130,000 bytes > 100,000 bytes baseline",
+    ]
+
+
+def test_compare_ignores_growth_below_the_noise_floor():
+    baseline = {"1000": result(seconds=0.001, nbytes=100, rss=10.0)}
+    assert bench_blog.compare([result(seconds=0.004, nbytes=900, rss=14.0)], baseline, 0.25) == []
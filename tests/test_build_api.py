@@ -0,0 +1,45 @@
+import os
+import re
+
+from conftest import build, gb, make_site, write_diary
+
+
+def read(root, rel_path):
+    with open(os.path.join(root, rel_path), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_two_roots_in_one_process(tmp_path, capsys):
+    globals_before = gb.BASE_DIR, gb.DIARY_DIR, gb.SITE_URL, gb.SITE_PATH
+    first = make_site(str(tmp_path / "first"))
+    second = make_site(str(tmp_path / "second"))
+    write_diary(first, "2026-01-01", title="첫 사이트 글")
+    write_diary(second, "2026-02-01", title="둘째 사이트 글")
+    write_diary(second, "2026-02-02", title="날짜가 다른 글", front="---\ndate: 2025-12-31\n---\n")
+
+    one = build(first, site_url="https://one.example")
+    two = build(second, site_url="https://two.example", site_path="/blog")
+
+    assert (one.entries, two.entries) == (1, 2)
+    assert one.warnings == []
+    assert two.warnings == ["2026-02-02.md: front matter date 2025-12-31 ignored; the file name sets the date"]
+    assert "첫 사이트 글" in read(first, "2026/01/01/index.html")
+    assert not os.path.exists(os.path.join(first, "2026", "02"))
+    assert "https://one.example/2026/01/01/" in read(first, "sitemaps/2026-01.xml")
+    assert "https://two.example/2026/02/01/" in read(second, "sitemaps/2026-02.xml")
+    assert 'href="/blog/2026/02/01/"' in read(second, "index.html")
+    assert (gb.BASE_DIR, gb.DIARY_DIR, gb.SITE_URL, gb.SITE_PATH) == globals_before
+    assert capsys.readouterr().out == ""
+
+
+def test_site_path_prefixes_every_root_relative_link(site):
+    write_diary(site, "2026-02-01", title="첫 글", front="---\ntags: [산책]\n---\n")
+    write_diary(site, "2026-02-02", title="둘째 글")
+    build(site, site_path="/blog")
+
+    outside = re.compile(r'(?:href|src|srcset)="/(?!blog/)')
+    for dirpath, _, names in os.walk(site):
+        for name in names:
+            if name.endswith(".html"):
+                rel_path = os.path.relpath(os.path.join(dirpath, name), site)
+                assert outside.findall(read(site, rel_path)) == [], rel_path
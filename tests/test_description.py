@@ -0,0 +1,43 @@
+import random
+import re
+
+import pytest
+
+from conftest import gb
+
+
+def regex_chain(markdown_text, limit=155):
+    # extract_description before the single-pass rewrite.
+    text = re.sub(r"```[\s\S]*?```", "", markdown_text)
+    text = re.sub(r"`([^`]*)`", r"\1", text)
+    text = re.sub(r"!\[[^\]]*\]\([^\)]*\)", "", text)
+    text = re.sub(r"\[[^\]]*\]\([^\)]*\)", "", text)
+    text = re.sub(r"[#>*_\-]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1].rstrip() + "…"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "*`]가#```!```_```",
+        "코드 `a` 와 ```\nfenced `b`\n``` 그리고 `c",
+        "`열린 채로 ```\n블록\n``` 끝` 뒤",
+        "[a`b](c)` 링크 안의 백틱",
+        "[x![a](b) 와 [a![b](c)](d) 중첩",
+        "# 제목\n\n> 인용 *강조* _밑줄_ - 목록\n" + "긴 문장 " * 60,
+    ],
+)
+def test_description_matches_the_old_regex_chain(text):
+    assert gb.extract_description(text) == regex_chain(text)
+
+
+def test_description_matches_the_old_regex_chain_on_random_markdown():
+    rng = random.Random(17)
+    alphabet = "`[]()!#>*_- \n가a"
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        limit = rng.choice([3, 10, 155])
+        assert gb.extract_description(text, limit) == regex_chain(text, limit), text
@@ -0,0 +1,42 @@
+import generate_blog as gb
+
+
+def test_reads_scalars_inline_and_block_lists():
+    meta, body = gb.split_front_matter(
+        "---\ntitle: \"제목: 부제\"\ntags: [자동화, 블로그]\nseries:\n  - 생성기 개선기\ndate: 2026-02-11\n---\n# 본문 제목\n"
+    )
+    assert meta == {"title": "제목: 부제", "tags": ["자동화", "블로그"], "series": ["생성기 개선기"], "date": "2026-02-11"}
+    assert body == "# 본문 제목\n"
+
+
+def test_values_stay_strings():
+    meta, _ = gb.split_front_matter("---\ndraft: yes\ncount: 3\n---\n")
+    assert meta == {"draft": "yes", "count": "3"}
+
+
+def test_leading_horizontal_rule_is_not_front_matter():
+    content = "---\n\n# 제목\n\n본문\n\n---\n\n끝\n"
+    assert gb.split_front_matter(content) == ({}, content)
+
+
+def test_block_with_prose_is_not_front_matter():
+    content = "---\ntags: [a]\n오늘은 비가 왔어요.\n---\n"
+    assert gb.split_front_matter(content) == ({}, content)
+
+
+def test_unclosed_or_missing_block():
+    assert gb.split_front_matter("---\ntags: [a]\n# 제목\n") == ({}, "---\ntags: [a]\n# 제목\n")
+    assert gb.split_front_matter("# 제목\n") == ({}, "# 제목\n")
+
+
+def test_parse_source_title_tags_and_series():
+    meta, body = gb.parse_source("---\ntags: 자동화, 자동화, 배포\nseries: 배포 일지\n---\n# 제목이에요\n\n본문\n", "x")
+    assert meta["title"] == "제목이에요"
+    assert meta["tags"] == ["자동화", "배포"]
+    assert meta["series"] == "배포 일지"
+    assert "제목이에요" not in body and "본문" in body
+
+
+def test_parse_source_keeps_leading_rule_and_heading():
+    meta, body = gb.parse_source("---\n\n# 제목\n\n본문\n\n---\n\n끝\n", "fallback")
+    assert "끝" in body and "본문" in body
@@ -0,0 +1,70 @@
+import os
+from html.parser import HTMLParser
+
+import pytest
+
+import generate_blog as gb
+from conftest import build
+
+
+@pytest.fixture
+def photo(monkeypatch):
+    monkeypatch.setattr(gb, "_images", {"images/a.jpg": {
+        "key": "k", "width": 800, "height": 600, "format": "jpg",
+        "variants": {"jpg": [("assets/img/a.k-480.jpg", 480), ("assets/img/a.k-800.jpg", 800)],
+                     "webp": [("assets/img/a.k-480.webp", 480), ("assets/img/a.k-800.webp", 800)]},
+    }})
+
+
+def img_attrs(html):
+    found = []
+
+    class Parser(HTMLParser):
+        def handle_starttag(self, tag, attrs):
+            if tag == "img":
+                found.extend(name for name, _ in attrs)
+
+    Parser().feed(html)
+    return found
+
+
+def test_plain_image_becomes_picture(photo):
+    html = gb.responsive_images('<p><img alt="사진" src="/images/a.jpg"></p>')
+    assert html.startswith('<p><picture><source type="image/webp"')
+    assert 'width="800" height="600" alt="사진" loading="lazy" decoding="async"' in html
+
+
+def test_author_dimensions_are_not_duplicated(photo):
+    html = gb.responsive_images('<img alt="a width=3" src="/images/a.jpg" width="300" HEIGHT=200 loading="eager" />')
+    attrs = img_attrs(html)
+    assert len(attrs) == len(set(attrs))
+    assert 'width="800" height="600"' in html
+    assert 'alt="a width=3"' in html and 'loading="eager"' in html and 'loading="lazy"' not in html
+
+
+def test_unknown_and_external_images_are_left_alone(photo):
+    for tag in ('<img src="/images/other.jpg" width="10">', '<img src="https://example.com/a.jpg">'):
+        assert gb.responsive_images(tag) == tag
+
+
+def test_unchanged_images_are_not_read_again(site, monkeypatch):
+    image = pytest.importorskip("PIL.Image")
+    os.makedirs(os.path.join(site, gb.IMAGE_DIR))
+    for name, color in [("a.png", "red"), ("b.png", "blue")]:
+        image.new("RGB", (200, 100), color).save(os.path.join(site, gb.IMAGE_DIR, name))
+    first = build(site)
+
+    hashed, written = [], []
+    real_key, real_write = gb.image_key, gb.OutputWriter.write
+    monkeypatch.setattr(gb, "image_key", lambda data: hashed.append(data) or real_key(data))
+    monkeypatch.setattr(gb.OutputWriter, "write", lambda self, rel_path, content: (
+        written.append(rel_path), real_write(self, rel_path, content)))
+    again = build(site)
+    assert hashed == [] and not [p for p in written if p.startswith("assets/img/")]
+    assert (again.images_encoded, again.images_cached) == (0, first.images_encoded)
+
+    image.new("RGB", (200, 100), "green").save(os.path.join(site, gb.IMAGE_DIR, "a.png"))
+    os.remove(os.path.join(site, gb.IMAGE_DIR, "b.png"))
+    edited = build(site)
+    assert len(hashed) == 1 and edited.images_encoded == 1
+    assert not [f for f in os.listdir(os.path.join(site, "assets", "img")) if f.startswith("b.")]
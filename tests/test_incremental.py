@@ -0,0 +1,74 @@
+import os
+
+from conftest import build, write_diary
+
+
+def exists(site, rel_path):
+    return os.path.exists(os.path.join(site, rel_path))
+
+
+def test_unchanged_rebuild_writes_nothing(site):
+    for day in range(1, 6):
+        write_diary(site, f"2026-02-{day:02d}", title=f"{day}일 일기예요")
+    first = build(site)
+    assert first.entries == 5 and first.files_written > 0
+
+    again = build(site)
+    assert again.files_written == 0
+    assert again.outputs_rebuilt == 0
+
+
+def test_edit_rewrites_only_what_depends_on_it(site):
+    for day in range(1, 6):
+        write_diary(site, f"2026-0{1 + day % 2}-{day:02d}", title=f"{day}일 일기예요")
+    build(site)
+    path = os.path.join(site, "2026", "02", "01", "index.html")
+    other = os.path.join(site, "2026", "01", "02", "index.html")
+    untouched = os.stat(other).st_mtime_ns
+
+    write_diary(site, "2026-02-01", body="고친 본문이에요.")
+    result = build(site)
+    with open(path, encoding="utf-8") as f:
+        assert "고친 본문이에요." in f.read()
+    assert os.stat(other).st_mtime_ns == untouched
+    assert result.outputs_rebuilt > 0 and result.outputs_skipped > 0
+
+
+def test_deleting_diaries_removes_their_outputs(site):
+    write_diary(site, "2026-01-15")
+    write_diary(site, "2026-02-10")
+    write_diary(site, "2026-02-11")
+    build(site)
+    gone = ["2026/02/11/index.html", "2026/02/10/index.html", "archive/2026-02/index.html",
+            "sitemaps/2026-02.xml", "data/posts/2026-02-11.json", "data/months/2026-02.json"]
+    assert all(exists(site, p) for p in gone)
+
+    os.remove(os.path.join(site, "diaries", "2026-02-10.md"))
+    os.remove(os.path.join(site, "diaries", "2026-02-11.md"))
+    build(site)
+    assert [p for p in gone if exists(site, p)] == []
+    assert not exists(site, "2026/02")
+    for kept in ("2026/01/15/index.html", "archive/2026-01/index.html", "sitemaps/2026-01.xml"):
+        assert exists(site, kept)
+    with open(os.path.join(site, "sitemap.xml"), encoding="utf-8") as f:
+        assert "2026-02" not in f.read()
+
+
+def test_deleted_outputs_are_found_after_a_generator_change(site):
+    write_diary(site, "2026-01-15")
+    write_diary(site, "2026-02-10")
+    build(site)
+    os.remove(os.path.join(site, "diaries", "2026-02-10.md"))
+    build(site, full=True)
+    assert not exists(site, "2026/02/10/index.html")
+
+
+def test_changing_the_site_address_rebuilds_every_page(site):
+    for day in range(1, 4):
+        write_diary(site, f"2026-02-{day:02d}")
+    build(site, site_url="https://old.example")
+    result = build(site, site_url="https://new.example", site_path="/blog")
+    assert result.outputs_skipped == 0
+    for rel_path in ("index.html", "2026/02/01/index.html", "archive/2026-02/index.html", "sitemaps/2026-02.xml"):
+        with open(os.path.join(site, rel_path), encoding="utf-8") as f:
+            assert "old.example" not in f.read()
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+import generate_blog as gb
+
+CORPUS = gb.parity_corpus()
+
+
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+def test_fallback_matches_python_markdown(name, text):
+    pytest.importorskip("markdown")
+    assert gb.parity_mismatches(gb._markdown_fallback, [(name, text)]) == []
+
+
+PATHOLOGICAL = {
+    "emphasis runs": lambda k: "*" * k + "a" + "*" * k,
+    "underscore runs": lambda k: "_" * k + "a" + "_" * k,
+    "alternating delimiters": lambda k: "*_" * k + "a",
+    "unclosed links": lambda k: "[a" * k,
+    "unclosed images": lambda k: "![" * k,
+    "unmatched backticks": lambda k: "`a``" * k,
+    "angle brackets": lambda k: "<a" * k,
+}
+
+
+@pytest.mark.parametrize("make", PATHOLOGICAL.values(), ids=PATHOLOGICAL.keys())
+def test_fallback_is_linear_on_pathological_input(make):
+    def elapsed(k):
+        started = time.perf_counter()
+        gb._markdown_fallback(make(k))
+        return time.perf_counter() - started
+
+    small, large = elapsed(10_000), elapsed(80_000)
+    # 8x the input: about 8x the time when linear, 64x when quadratic.
+    assert large < max(small * 24, 0.05)
+    assert large < 1.0
+
+
+def test_fallback_renders_deep_nesting_without_recursion():
+    quotes = gb._markdown_fallback(">" * 3000 + " 깊은 인용")
+    assert quotes.count("<blockquote>") == quotes.count("</blockquote>") == 3000
+    assert "<p>깊은 인용</p>" in quotes
+
+    lists = gb._markdown_fallback("\n".join("    " * depth + "- 항목" for depth in range(300)))
+    assert lists.count("<ul>") == lists.count("</li>") == 300
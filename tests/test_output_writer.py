@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+import generate_blog as gb
+from conftest import build, write_diary
+
+
+def read(root, rel_path):
+    with open(os.path.join(root, rel_path), "rb") as f:
+        return f.read()
+
+
+def test_skips_unchanged_bytes(tmp_path):
+    writer = gb.OutputWriter(root=str(tmp_path))
+    writer.write("a/b.txt", "x")
+    writer.write("a/b.txt", "x")
+    writer.commit()
+    assert (writer.written, writer.skipped) == (1, 1)
+
+
+def test_failed_pooled_write_discards_the_staged_build(site, monkeypatch):
+    write_diary(site, "2026-02-10")
+    build(site)
+    write_diary(site, "2026-02-10", title="바뀐 제목이에요")
+    before = read(site, "index.html"), read(site, gb.MANIFEST_PATH)
+
+    original = gb.OutputWriter._write_now
+
+    def failing(self, rel_path, data):
+        if rel_path == "sitemap.xml":
+            raise OSError("disk full")
+        return original(self, rel_path, data)
+
+    monkeypatch.setattr(gb.OutputWriter, "_write_now", failing)
+    with pytest.raises(OSError, match="disk full"):
+        build(site, staged=True, jobs=4)
+
+    assert not os.path.exists(os.path.join(site, gb.STAGING_DIR))
+    assert (read(site, "index.html"), read(site, gb.MANIFEST_PATH)) == before
+
+
+def test_staged_write_keeps_precompressed_siblings_until_commit(tmp_path):
+    root = str(tmp_path)
+    writer = gb.OutputWriter(root=root)
+    for rel_path, data in [("a.html", b"old"), ("a.html.gz", b"old gz"), ("a.html.br", b"old br")]:
+        writer.write(rel_path, data)
+    writer.commit()
+
+    writer = gb.OutputWriter(root=root, staging=os.path.join(root, gb.STAGING_DIR))
+    writer.write("a.html", "new")
+    writer.flush()
+    assert read(root, "a.html.gz") == b"old gz" and read(root, "a.html.br") == b"old br"
+    writer.discard()
+    assert sorted(os.listdir(root)) == ["a.html", "a.html.br", "a.html.gz"]
+
+    writer = gb.OutputWriter(root=root, staging=os.path.join(root, gb.STAGING_DIR))
+    writer.write("a.html", "new")
+    writer.commit()
+    assert sorted(os.listdir(root)) == ["a.html"] and read(root, "a.html") == b"new"
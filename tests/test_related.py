@@ -0,0 +1,63 @@
+import hashlib
+import os
+import random
+
+import pytest
+
+from conftest import gb, write_diary
+
+VOCABULARY = [f"w{i}" for i in range(80)]
+
+
+class Sources:
+    # Stands in for the manifest's source hashes.
+    def __init__(self, texts):
+        self.texts = texts
+
+    def source_sha(self, date):
+        return hashlib.sha256(self.texts[date].encode("utf-8")).hexdigest()
+
+
+def corpus(site, texts):
+    # Diaries drop their source after use and read it back from diaries/.
+    for date, text in texts.items():
+        write_diary(site, date, body=text)
+    return [gb.Diary(date, "") for date in sorted(texts, reverse=True)]
+
+
+def expected_related(index, diaries):
+    # A full scoring pass with the index's frozen document frequencies.
+    vectors = [gb.related_vector(gb.doc_token_counts(d), index.df, index.n) for d in diaries]
+    dates = [d.date for d in diaries]
+    return {dates[i]: [[dates[j], s] for j, s in top] for i, top, _ in gb.similarity_rows(vectors, range(len(dates)))}
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_patch_matches_a_full_pass(engine, site, monkeypatch):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+        rows = gb._similarity_rows_numpy
+    else:
+        rows = gb._similarity_rows_python
+    monkeypatch.setattr(gb, "similarity_rows", lambda vectors, r, full_rows=frozenset(): rows(vectors, r, full_rows))
+
+    rng = random.Random(7)
+    texts = {f"2026-03-{day:02d}": " ".join(rng.choices(VOCABULARY, k=15)) for day in range(1, 31)}
+    texts.update({f"2026-04-{day:02d}": " ".join(rng.choices(VOCABULARY, k=15)) for day in range(1, 31)})
+    monkeypatch.setattr(gb, "DIARY_DIR", os.path.join(site, "diaries"))
+    index = gb.RelatedIndex(None)
+    index.update(corpus(site, texts), Sources(texts))
+    assert index.computed == len(texts)
+    df, n = index.df, index.n
+
+    texts["2026-03-05"] = " ".join(rng.choices(VOCABULARY, k=15))
+    texts["2026-04-17"] = texts["2026-03-02"]
+    del texts["2026-03-20"]
+    texts["2026-05-01"] = " ".join(rng.choices(VOCABULARY, k=15))
+    diaries = corpus(site, texts)
+    related = index.update(diaries, Sources(texts))
+
+    assert (index.df, index.n) == (df, n)
+    assert 0 < index.computed < len(texts)
+    assert index.related == expected_related(index, diaries)
+    assert related == {date: [r[0] for r in rows] for date, rows in index.related.items()}
@@ -0,0 +1,39 @@
+import json
+import os
+
+import pytest
+
+from conftest import gb, write_diary
+
+
+@pytest.fixture
+def bound(site):
+    pytest.importorskip("markdown")
+    with gb.bind_site(gb.BuildConfig(root=site, renderer="auto")):
+        yield site
+
+
+def saved(site):
+    with open(os.path.join(site, gb.RENDERER_CHOICE_PATH), encoding="utf-8") as f:
+        return json.load(f)["backend"]
+
+
+def test_renderers_never_saves_the_fallback(bound, capsys):
+    write_diary(bound, "2026-01-01")
+    assert gb.bench_renderers(rounds=1) == 0
+    assert saved(bound) != "fallback"
+    assert "fallback" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("text", gb.EXTENSION_PARITY_CASES)
+def test_fallback_differs_on_extensions(text):
+    pytest.importorskip("markdown")
+    assert gb._markdown_fallback(text) != gb.load_backend("python-markdown")[1](text)
+
+
+def test_saved_fallback_does_not_shadow_python_markdown(bound):
+    os.makedirs(os.path.join(bound, ".cache"), exist_ok=True)
+    with open(os.path.join(bound, gb.RENDERER_CHOICE_PATH), "w", encoding="utf-8") as f:
+        json.dump({"backend": "fallback"}, f)
+    gb.use_renderer("auto")
+    assert gb.active_backend()[0] == "python-markdown"
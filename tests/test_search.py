@@ -0,0 +1,82 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import REPO, build, gb, write_diary
+
+SAMPLES = [
+    "오늘은 비가 왔어요",
+    "Hello, World! 123 abc_def",
+    "ＡＢＣ　全角 숫자１２３",
+    "한 글자 가 나 漢字와 한글이 섞인 文章",
+    "ㄱㄴㄷ ㅋㅋㅋ café naïve",
+    "",
+]
+
+
+def shard_files(site):
+    folder = os.path.join(site, "data", "search")
+    files = {}
+    for name in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, name), "rb") as f:
+            files[name] = f.read()
+    return files
+
+
+def test_incremental_shards_match_a_full_rebuild(site):
+    for day in range(1, 21):
+        write_diary(site, f"2026-03-{day:02d}", title=f"{day}일 산책", body=f"공원을 {day}바퀴 걸었어요. walk {day}")
+    build(site)
+
+    write_diary(site, "2026-03-05", title="5일 비", body="하루 종일 비가 내렸어요. rain")
+    os.remove(os.path.join(site, "diaries", "2026-03-07.md"))
+    write_diary(site, "2026-03-25", title="새 일기", body="처음 쓰는 낱말 zebra")
+    result = build(site, report=True)
+    assert result.report.counts["search_docs_tokenised"] == 2
+    patched = shard_files(site)
+    assert result.report.counts["search_shards_written"] < len(patched)
+
+    shutil.rmtree(os.path.join(site, ".cache", "search"))
+    build(site, full=True)
+    assert shard_files(site) == patched
+
+
+def test_shard_count_change_drops_extra_shards(site):
+    dates = [f"2026-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    for date in dates[: gb.SEARCH_MIN_SHARDS * gb.SEARCH_DOCS_PER_SHARD + 1]:
+        write_diary(site, date, body=f"{date} 일기")
+    build(site)
+    assert len(shard_files(site)) == 2 * gb.SEARCH_MIN_SHARDS
+
+    os.remove(os.path.join(site, "diaries", f"{dates[0]}.md"))
+    build(site)
+    assert len(shard_files(site)) == gb.SEARCH_MIN_SHARDS
+
+
+def run_search_js(snippet: str):
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+    with open(os.path.join(REPO, "search.js"), encoding="utf-8") as f:
+        source = f.read()
+    run = re.search(r"^\s*const RUN = .*$", source, re.M).group(0)
+    tokens = re.search(r"^\s*function tokens\(text\) \{.*?^  \}$", source, re.M | re.S).group(0)
+    out = subprocess.run([node, "-e", f"{run}\n{tokens}\n{snippet}"], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def test_tokenizer_matches_search_js():
+    expected = run_search_js(f"console.log(JSON.stringify({json.dumps(SAMPLES)}.map(tokens)))")
+    assert [gb.search_tokens(text) for text in SAMPLES] == expected
+
+
+def test_shard_of_matches_search_js():
+    tokens = sorted({token for text in SAMPLES for token in gb.search_tokens(text)})
+    expected = run_search_js(
+        f"console.log(JSON.stringify({json.dumps(tokens)}.map(t => [16, 64].map(n => t.codePointAt(0) % n))))"
+    )
+    assert [[gb.search_shard_of(t, n) for n in (16, 64)] for t in tokens] == expected
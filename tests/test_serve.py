@@ -0,0 +1,108 @@
+import os
+import random
+
+import pytest
+
+from conftest import build, gb, make_site, write_diary
+
+
+def exists(site, rel_path):
+    return os.path.exists(os.path.join(site, rel_path))
+
+
+def read(site, rel_path):
+    with open(os.path.join(site, rel_path), encoding="utf-8") as f:
+        return f.read()
+
+
+def shards(site):
+    return "".join(read(site, f"data/search/{name}") for name in os.listdir(os.path.join(site, "data", "search")))
+
+
+def rebuild(manifest, changed=None):
+    # One rebuild the way `serve` runs it: the manifest is saved after the reload.
+    manifest.advance(changed)
+    gb.build_site(manifest, None, gb.OutputWriter(), save=False)
+    gb.save_build(manifest, None)
+
+
+def tree(root):
+    files = {}
+    for dirpath, dirnames, names in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in names:
+            if not name.startswith("."):
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    files[os.path.relpath(os.path.join(dirpath, name), root)] = f.read()
+    return files
+
+
+def test_rebuild_after_a_failed_one_still_catches_up(site, monkeypatch):
+    write_diary(site, "2026-01-15")
+    write_diary(site, "2026-02-10")
+    with gb.bind_site(gb.BuildConfig(root=site, renderer="fallback")):
+        # What `serve` does on start and on every change.
+        manifest = gb.BuildManifest(live=True)
+        gb.build_site(manifest, None, gb.OutputWriter())
+
+        os.remove(os.path.join(site, "diaries", "2026-02-10.md"))
+        write_diary(site, "2026-01-15", body="zebra 얼룩말")
+
+        def broken(*args):
+            raise RuntimeError("broken template")
+
+        with monkeypatch.context() as m:
+            m.setattr(gb, "generate_sitemap", broken)
+            manifest.advance()
+            with pytest.raises(RuntimeError):
+                gb.build_site(manifest, None, gb.OutputWriter())
+        assert exists(site, "2026/02/10/index.html")
+
+        rebuild(manifest, {os.path.join(site, "diaries", "2026-01-15.md")})
+    for gone in ("2026/02/10/index.html", "data/posts/2026-02-10.json", "archive/2026-02/index.html"):
+        assert not exists(site, gone)
+    assert "zebra" in shards(site)
+    assert "얼룩말" in read(site, "2026/01/15/index.html")
+
+
+def test_live_rebuilds_match_fresh_builds(tmp_path):
+    # serve's in-memory shortcuts against build() from what is on disk, over the same edits.
+    live, fresh = make_site(str(tmp_path / "live")), make_site(str(tmp_path / "fresh"))
+    rng = random.Random(3)
+    words = ["산책", "커피", "비가", "바람", "친구", "walk", "rain", "book"]
+    dates = [f"2026-0{1 + i % 3}-{1 + i:02d}" for i in range(24)]
+
+    def edit(root, date, seed):
+        r = random.Random(seed)
+        front = f"---\ntags: [{r.choice(words)}]\n---\n" if r.random() < 0.5 else ""
+        write_diary(root, date, title=" ".join(r.choices(words, k=2)), body=" ".join(r.choices(words, k=12)),
+                    front=front)
+        return os.path.join(root, "diaries", f"{date}.md")
+
+    for i, date in enumerate(dates[:16]):
+        edit(live, date, i)
+        edit(fresh, date, i)
+    with gb.bind_site(gb.BuildConfig(root=live, renderer="fallback")):
+        manifest = gb.BuildManifest(live=True)
+        gb.build_site(manifest, None, gb.OutputWriter())
+    build(fresh, snapshot=False)
+
+    for step in range(30):
+        roll, date, seed = rng.random(), rng.choice(dates), rng.random()
+        changed = set()
+        for root in (live, fresh):
+            path = os.path.join(root, "diaries", f"{date}.md")
+            if roll < 0.2 and os.path.exists(path):
+                os.remove(path)
+            elif roll < 0.25:
+                with open(os.path.join(root, "style.css"), "a", encoding="utf-8") as f:
+                    f.write(f"/* {step} */\n")
+                path = os.path.join(root, "style.css")
+            else:
+                edit(root, date, seed)
+            if root == live:
+                changed.add(path)
+        with gb.bind_site(gb.BuildConfig(root=live, renderer="fallback")):
+            rebuild(manifest, changed)
+        build(fresh, snapshot=False)
+        assert tree(live) == tree(fresh), f"step {step}"
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from conftest import gb, write_diary
+
+
+@pytest.fixture
+def store(site):
+    with gb.bind_site(gb.BuildConfig(root=site)):
+        yield gb.SnapshotStore()
+
+
+def diaries(site):
+    folder = os.path.join(site, "diaries")
+    contents = {}
+    for name in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, name), encoding="utf-8") as f:
+            contents[name] = f.read()
+    return contents
+
+
+def test_take_stores_each_state_and_blob_once(site, store):
+    write_diary(site, "2026-01-01")
+    write_diary(site, "2026-01-02", body="다른 본문이에요.")
+    first = store.take()
+    assert store.blobs_written == 2
+
+    assert store.take() == first
+    assert store.blobs_written == 2 and len(store.snapshots()) == 1
+
+    write_diary(site, "2026-01-02", body="고친 본문이에요, 조금 더 길게.")
+    assert store.take() != first
+    assert store.blobs_written == 3 and len(store.snapshots()) == 2
+
+
+def test_diff_reports_added_deleted_and_modified(site, store):
+    write_diary(site, "2026-01-01")
+    write_diary(site, "2026-01-02")
+    old = store.load(store.take())
+    write_diary(site, "2026-01-02", body="고친 본문이에요, 조금 더 길게.")
+    write_diary(site, "2026-01-03")
+    os.remove(os.path.join(site, "diaries", "2026-01-01.md"))
+    new = store.load(store.take())
+    assert gb.diff_snapshots(old["files"], new["files"]) == [
+        ("D", "2026-01-01.md"), ("M", "2026-01-02.md"), ("A", "2026-01-03.md"),
+    ]
+
+
+def test_restore_one_file_leaves_the_rest(site, store):
+    write_diary(site, "2026-01-01")
+    write_diary(site, "2026-01-02")
+    old = store.take()
+    write_diary(site, "2026-01-01", body="고친 본문이에요, 조금 더 길게.")
+    write_diary(site, "2026-01-03")
+    store.take()
+
+    assert store.restore(old, ["2026-01-01.md"]) == (["2026-01-01.md"], [])
+    assert "본문이에요." in diaries(site)["2026-01-01.md"]
+    assert "2026-01-03.md" in diaries(site)
+    with pytest.raises(SystemExit):
+        store.restore(old, ["2026-01-03.md"])
+
+
+def test_whole_restore_removes_newer_diaries_and_can_be_undone(site, store, capsys):
+    write_diary(site, "2026-01-01")
+    old_state = diaries(site)
+    old = store.take()
+    write_diary(site, "2026-01-01", body="고친 본문이에요, 조금 더 길게.")
+    write_diary(site, "2026-01-02")
+    new_state = diaries(site)
+
+    assert gb.snapshot_command(["restore", old]) == 0
+    assert diaries(site) == old_state
+    out = capsys.readouterr().out
+    assert "restored 2026-01-01.md" in out and "removed 2026-01-02.md" in out
+    before = out.rsplit("previous state: snapshot ", 1)[1].rstrip(")\n")
+
+    assert store.restore(before) == (["2026-01-01.md", "2026-01-02.md"], [])
+    assert diaries(site) == new_state